@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+
+# Scaling benchmark for the pipeline stages.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# bench.py - Runs every stage headlessly over growing n and several polygon families, reports
+# throughput and the fitted growth exponent per stage, records the core import time, stores the
+# results as JSON and compares them against a stored run to flag regressions.
+
+# Usage:
+#   python benchmarks/bench.py                                   # n = 10 .. 10^6, all families
+#   python benchmarks/bench.py --sizes 100 1000 --families star comb
+#   python benchmarks/bench.py --output bench.json
+#   python benchmarks/bench.py --compare bench.json --threshold 0.2
+#
+# Sizes whose predicted run time exceeds --max-seconds are skipped (and listed as such), so
+# the default sweep stops wherever the slowest stage becomes impractical.
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, os.pardir, "src"))
+sys.path.insert(0, os.path.join(BENCH_DIR, os.pardir, "scripts"))
+sys.path.insert(0, BENCH_DIR)
+
+import families as families_module  # noqa: E402
+import import_time as import_time_module  # noqa: E402
+import profiling as profiling_module  # noqa: E402
+from headless import HeadlessCanvas  # noqa: E402
+from pipeline import ArtGalleryPipeline  # noqa: E402
+
+# Reported stages, in pipeline order ("polygon" is the DCEL build)
+STAGES = (
+    "dcel_build",
+    "vertex_classification",
+    "trapezoidalisation",
+    "monotone_partitioning",
+    "triangulation",
+    "dual_graph",
+    "three_coloring",
+    "vertex_guards",
+)
+PIPELINE_NAMES = {"polygon": "dcel_build"}
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000, 1000000)
+NOISE_FLOOR = 1e-3  # seconds; differences below this are never regressions
+FIT_FLOOR = 1e-4  # seconds; shorter timings are too noisy to fit
+
+
+def run_once(points) -> dict:
+    """Seconds spent in each stage solving ``points`` once."""
+    profiler = profiling_module.Profiler(memory=False)
+    pipeline = ArtGalleryPipeline(HeadlessCanvas(), profiler=profiler)
+    try:
+        if not pipeline.step_load_polygon(points):
+            raise ValueError("polygon rejected")
+        start = time.perf_counter()
+        pipeline.polygon_app.dcel.find_vertices()
+        classification = time.perf_counter() - start
+        if not pipeline.request("vertex_guards"):
+            raise ValueError("pipeline stopped before vertex_guards")
+    except Exception as exc:
+        stage = profiler.current.name if profiler.current else "polygon"
+        raise RuntimeError(
+            "%s: %s: %s" % (PIPELINE_NAMES.get(stage, stage), type(exc).__name__, exc)
+        ) from exc
+    finally:
+        profiler.close()
+    seconds = {PIPELINE_NAMES.get(s.name, s.name): s.wall for s in profiler.stages}
+    seconds["vertex_classification"] = classification
+    return {stage: seconds.get(stage, 0.0) for stage in STAGES}
+
+
+def measure(family, n, repeat) -> dict:
+    """Best of ``repeat`` runs per stage."""
+    points = families_module.FAMILIES[family](n)
+    best = None
+    for _ in range(repeat):
+        seconds = run_once(points)
+        best = seconds if best is None else {s: min(best[s], seconds[s]) for s in STAGES}
+    total = sum(best.values())
+    return {
+        "family": family,
+        "n": n,
+        "seconds": best,
+        "total_seconds": total,
+        "throughput_vps": n / total if total > 0 else None,
+    }
+
+
+def fit_exponent(points):
+    """Least-squares slope of log(seconds) against log(n)."""
+    points = [(n, t) for n, t in points if t > FIT_FLOOR]
+    if len(points) < 2:
+        return None
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def complexity_label(exponent):
+    if exponent is None:
+        return None
+    if exponent < 1.08:
+        return "O(n)"
+    if exponent < 1.4:
+        return "O(n log n)"
+    if exponent < 2.5:
+        return "O(n^2)"
+    return "O(n^3)"
+
+
+def fits(results) -> dict:
+    """Growth exponent of each stage (and the total) per family."""
+    out = {}
+    for family in sorted({r["family"] for r in results}):
+        rows = [r for r in results if r["family"] == family and "seconds" in r]
+        out[family] = {}
+        for stage in STAGES + ("total",):
+            exponent = fit_exponent(
+                [(r["n"], r["total_seconds"] if stage == "total" else r["seconds"][stage]) for r in rows]
+            )
+            out[family][stage] = {
+                "exponent": None if exponent is None else round(exponent, 3),
+                "complexity": complexity_label(exponent),
+            }
+    return out
+
+
+def print_fits(fitted):
+    print("\n%-22s" % "exponent" + "".join("%10s" % family for family in fitted))
+    for stage in STAGES + ("total",):
+        cells = [fitted[family][stage]["exponent"] for family in fitted]
+        print("%-22s" % stage + "".join("%10s" % ("-" if c is None else "%.2f" % c) for c in cells))
+
+
+def sweep(family, sizes, repeat, max_seconds, log=print) -> list:
+    rows = []
+    timed = []  # (n, total seconds) of the sizes run so far
+    for n in sizes:
+        if timed:
+            last_n, last_t = timed[-1]
+            exponent = max(fit_exponent(timed) or 2.0, 1.0)
+            predicted = last_t * (n / last_n) ** exponent * repeat
+            if predicted > max_seconds:
+                rows.append({"family": family, "n": n, "skipped": "predicted %.0f s" % predicted})
+                log("%-7s n=%-8d skipped (predicted %.0f s)" % (family, n, predicted))
+                continue
+        try:
+            row = measure(family, n, repeat)
+        except Exception as exc:  # recorded, not hidden: a stage that breaks at this size
+            rows.append({"family": family, "n": n, "error": str(exc)})
+            log("%-7s n=%-8d error in %s" % (family, n, exc))
+            continue
+        rows.append(row)
+        timed.append((n, row["total_seconds"]))
+        log(
+            "%-7s n=%-8d %9.4f s %12.0f vertices/s"
+            % (family, n, row["total_seconds"], row["throughput_vps"] or 0)
+        )
+    return rows
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCH_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report, baseline, threshold) -> list:
+    """Stages slower than the baseline by more than ``threshold`` (relative)."""
+    old = {
+        (r["family"], r["n"]): r["seconds"] for r in baseline["results"] if "seconds" in r
+    }
+    problems = []
+    for row in report["results"]:
+        before = old.get((row["family"], row["n"]))
+        if before is None:
+            continue
+        if "error" in row:
+            problems.append("%s n=%d now fails: %s" % (row["family"], row["n"], row["error"]))
+            continue
+        if "seconds" not in row:
+            continue
+        for stage in STAGES:
+            if stage not in before:
+                continue
+            now, then = row["seconds"][stage], before[stage]
+            if now - then > NOISE_FLOOR and now > then * (1.0 + threshold):
+                problems.append(
+                    "%s n=%d %s: %.4f s, was %.4f s (+%.0f%%)"
+                    % (row["family"], row["n"], stage, now, then, 100 * (now / then - 1))
+                )
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scaling benchmark of the pipeline stages")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--families", nargs="+", choices=sorted(families_module.FAMILIES), default=list(families_module.FAMILIES)
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size; the fastest counts")
+    parser.add_argument(
+        "--max-seconds", type=float, default=60.0, help="Skip sizes predicted to take longer than this"
+    )
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--compare", help="Flag regressions against this stored run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    imports = import_time_module.measure(repeat=args.repeat)
+    print("core import: %.1f ms" % imports["total_ms"])
+    results = []
+    for family in args.families:
+        results.extend(sweep(family, sorted(args.sizes), args.repeat, args.max_seconds))
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "repeat": args.repeat,
+            "max_seconds": args.max_seconds,
+        },
+        "import": imports,
+        "results": results,
+        "fits": fits(results),
+    }
+    print_fits(report["fits"])
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as fh:
+            baseline = json.load(fh)
+
+    # A size that broke is kept in the report but fails the run: the sweep
+    # must work under the interpreter's default settings. So does a core
+    # import that loads unwanted modules or got slower than the stored run.
+    failures = [row for row in results if "error" in row]
+    for row in failures:
+        print("FAILED: %s n=%d %s" % (row["family"], row["n"], row["error"]), file=sys.stderr)
+    import_problems = import_time_module.compare(
+        imports, baseline.get("import") if baseline else None, args.threshold
+    )
+    for problem in import_problems:
+        print("FAILED: " + problem, file=sys.stderr)
+    failed = bool(failures or import_problems)
+
+    if baseline is None:
+        return 1 if failed else 0
+    problems = compare(report, baseline, args.threshold)
+    for problem in problems:
+        print("REGRESSION: " + problem, file=sys.stderr)
+    if not problems:
+        print("No regressions against %s (commit %s)" % (args.compare, baseline["meta"].get("commit")))
+    return 1 if problems or failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,66 @@
+# Polygon families for the benchmarks.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# families.py - Deterministic generators of simple polygons with n vertices, each stressing
+# a different part of the pipeline.
+
+import math
+import random
+
+SIZE = 400.0  # polygons fit in a SIZE x SIZE box, like the canvas coordinates
+
+
+def convex(n, seed=0):
+    """Regular n-gon: y-monotone and star-shaped, so the fast paths apply."""
+    c = SIZE / 2
+    return [
+        (c + c * math.cos(2 * math.pi * k / n), c + c * math.sin(2 * math.pi * k / n))
+        for k in range(n)
+    ]
+
+
+def star(n, seed=0):
+    """Random radii around the centre: star-shaped with many reflex vertices."""
+    rng = random.Random(seed)
+    c = SIZE / 2
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(n))
+    return [
+        (c + r * math.cos(a), c + r * math.sin(a))
+        for a, r in ((a, rng.uniform(0.3 * c, c)) for a in angles)
+    ]
+
+
+def comb(n, seed=0):
+    """Zigzag bottom edge: every notch top is a merge vertex, so the monotone
+    partition adds many diagonals. A slight tilt keeps all y distinct."""
+    m = max(n - 2, 2)
+    tilt = 0.01
+    zigzag = [
+        (SIZE * j / (m - 1), (0.0 if j % 2 == 0 else SIZE / 2) + tilt * SIZE * j / (m - 1))
+        for j in range(m)
+    ]
+    return [(SIZE, SIZE), (0.0, SIZE)] + zigzag
+
+
+def spiral(n, seed=0):
+    """Spiral corridor: long and thin, with a deep, path-like dual tree."""
+    c = SIZE / 2
+    turns = max(n / 120.0, min(1.0, n / 24.0))  # at least ~12 points per turn
+    width = min(0.3 * c / turns, 0.1 * c)
+
+    def arm(count, offset):
+        points = []
+        for k in range(count):
+            t = k / (count - 1)
+            angle = 2 * math.pi * turns * t
+            radius = 0.15 * c + 0.8 * c * t - offset
+            points.append((c + radius * math.cos(angle), c + radius * math.sin(angle)))
+        return points
+
+    inner = arm(max(n // 2, 2), width)
+    outer = arm(max(n - len(inner), 2), 0.0)
+    return outer + inner[::-1]  # counter-clockwise
+
+
+FAMILIES = {"convex": convex, "star": star, "comb": comb, "spiral": spiral}
@@ -9,6 +9,8 @@
 # Usage:
 #   - Desktop (Tkinter):  python main.py --desktop
 #   - Web (Streamlit):    python main.py --web [--port 8501]
+#   - Batch solve:        python main.py --solve polygons.jsonl [--workers 8] > results.jsonl
+#   - Stream triangles:   python main.py --triangulate polygon.json [-o triangles.txt|.geojson|.wkt|.bin]
 #
 
 from __future__ import annotations
@@ -63,6 +65,77 @@ def run_desktop_gui() -> int:
         return 1
 
 
+def _reader_gone() -> int:
+    # Point stdout at devnull so the interpreter's final flush of the
+    # unwritten buffer does not raise a second BrokenPipeError at exit.
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.close(devnull)
+    return 1
+
+
+def run_batch_solve(
+    path: str,
+    output: str | None,
+    workers: int | None,
+    max_in_flight: int | None,
+    cache_dir: str | None = None,
+) -> int:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+    import batch_solve
+
+    source = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    sink = sys.stdout if output in (None, "-") else open(output, "w", encoding="utf-8")
+    try:
+        solved, failed = batch_solve.run(
+            source, sink, workers, max_in_flight, cache_dir=cache_dir
+        )
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head): stop without a traceback
+        return _reader_gone()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    print(f"Solved {solved} polygons, {failed} failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def run_triangulate(path: str, output: str | None) -> int:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+    import batch_solve
+    import export
+    import headless
+
+    source = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    try:
+        request = batch_solve.parse_request(source.read())
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    fmt = export.FORMATS.get(os.path.splitext(output or "")[1].lower())
+    if fmt:
+        # Exporter formats take the triangles straight from the generator
+        vertices = request["points"] + [p for hole in request["holes"] for p in hole]
+        triangles = headless.iter_triangles(request["points"], request["holes"])
+        mode, encoding = ("wb", None) if fmt == "binary" else ("w", "utf-8")
+        with open(output, mode, encoding=encoding) as sink:
+            count = export.WRITERS[fmt](sink, vertices, triangles)
+        print(f"Wrote {count} triangles", file=sys.stderr)
+        return 0
+    sink = sys.stdout if output in (None, "-") else open(output, "w", encoding="utf-8")
+    try:
+        count = headless.stream_triangles(request["points"], sink, request["holes"])
+    except BrokenPipeError:
+        return _reader_gone()
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+    print(f"Wrote {count} triangles", file=sys.stderr)
+    return 0
+
+
 def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Art Gallery launcher")
     mode = parser.add_mutually_exclusive_group()
@@ -72,9 +145,40 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     mode.add_argument(
         "--desktop", action="store_true", help="Run the Tkinter desktop UI"
     )
+    mode.add_argument(
+        "--solve",
+        metavar="JSONL",
+        nargs="?",
+        const="-",
+        help="Solve polygons from a JSONL file (or stdin) and print JSONL results",
+    )
+    mode.add_argument(
+        "--triangulate",
+        metavar="JSON",
+        nargs="?",
+        const="-",
+        help="Stream the triangles of one polygon (file or stdin) as 'i j k' lines",
+    )
     parser.add_argument(
         "--port", type=int, default=8501, help="Port for web UI (default: 8501)"
     )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="Write --solve or --triangulate results to this file instead of stdout",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes for --solve (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        help="Polygons queued or solving at once for --solve (default: 4 per worker)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Keep --solve results as JSON files here and reuse them across runs",
+    )
     return parser.parse_args(argv)
 
 
@@ -82,6 +186,12 @@ def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv or sys.argv[1:])
     if args.desktop:
         return run_desktop_gui()
+    if args.solve:
+        return run_batch_solve(
+            args.solve, args.output, args.workers, args.max_in_flight, args.cache_dir
+        )
+    if args.triangulate:
+        return run_triangulate(args.triangulate, args.output)
     return run_web_ui(port=args.port)
 
 
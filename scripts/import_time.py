@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+# Startup benchmark for the geometry core.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# import_time.py - Measures the cost of importing the core modules with `python -X importtime`
+# in fresh interpreters, checks that no UI library or tool-only module gets loaded, and
+# compares against a stored baseline.
+
+# Usage:
+#   python scripts/import_time.py                          # print the report
+#   python scripts/import_time.py --output import_time.json
+#   python scripts/import_time.py --baseline import_time.json --threshold 0.25
+#
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src")
+CORE_MODULES = (
+    "dcel",
+    "fast_paths",
+    "trapezoidalisation",
+    "monotone_partitioning",
+    "triangulation",
+    "dual_graph",
+    "three_coloring",
+    "vertex_guards",
+    "pipeline",
+    "headless",
+)
+# Must never be imported by the core
+UI_MODULES = ("tkinter", "matplotlib", "streamlit", "numpy", "PIL")
+# Needed only by the command lines and the profiler
+TOOL_MODULES = ("argparse", "tracemalloc")
+UNWANTED_MODULES = UI_MODULES + TOOL_MODULES
+
+_PROBE = """
+import json, sys
+sys.path.insert(0, %r)
+%s
+print(json.dumps(sorted(m for m in %r if m in sys.modules)))
+"""
+
+
+def measure_once(modules):
+    """Import ``modules`` in a fresh interpreter.
+
+    Returns the cumulative import time of each (microseconds) and the
+    unwanted modules that got loaded.
+    """
+    code = _PROBE % (
+        os.path.abspath(SRC_DIR),
+        "\n".join("import " + name for name in modules),
+        UNWANTED_MODULES,
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        # "import time:      self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2][1:].rstrip()  # nesting shows as extra leading spaces
+        if name in modules:
+            cumulative[name] = int(parts[1])
+    return cumulative, json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def measure(modules=CORE_MODULES, repeat=5) -> dict:
+    """Best of ``repeat`` fresh-interpreter runs (the least disturbed one)."""
+    best = None
+    loaded = set()
+    for _ in range(repeat):
+        cumulative, unwanted = measure_once(modules)
+        loaded.update(unwanted)
+        if best is None or sum(cumulative.values()) < sum(best.values()):
+            best = cumulative
+    return {
+        "python": sys.version.split()[0],
+        "modules_us": best,
+        "total_ms": round(sum(best.values()) / 1000.0, 3),
+        "unwanted_modules_loaded": sorted(loaded),
+    }
+
+
+def compare(report, baseline, threshold) -> list:
+    problems = []
+    if report["unwanted_modules_loaded"]:
+        problems.append(
+            "core imports unwanted modules: " + ", ".join(report["unwanted_modules_loaded"])
+        )
+    if baseline:
+        limit = baseline["total_ms"] * (1.0 + threshold)
+        if report["total_ms"] > limit:
+            problems.append(
+                "core import took %.1f ms, over %.1f ms (baseline %.1f ms + %d%%)"
+                % (report["total_ms"], limit, baseline["total_ms"], 100 * threshold)
+            )
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark of the core modules")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Write the report as JSON to this file")
+    parser.add_argument("--baseline", help="Fail if slower than this stored report")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    report = measure(CORE_MODULES, args.repeat)
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as fh:
+            baseline = json.load(fh)
+    problems = compare(report, baseline, args.threshold)
+    for problem in problems:
+        print("FAIL: " + problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+# Load generator for the local solve service.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# loadgen.py - Sends random polygons to POST /solve from many keep-alive connections and
+# reports throughput, latency percentiles and status counts.
+
+# Usage:
+#   python src/service.py --workers 4 &
+#   python scripts/loadgen.py --concurrency 32 --requests 2000 --vertices 20 200
+#
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections import Counter
+
+
+def random_polygon(rng: random.Random, n: int):
+    # Star-shaped around the centre: sorted angles, random radii.
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(n))
+    return [
+        (round(200 + r * math.cos(a), 3), round(200 + r * math.sin(a), 3))
+        for a, r in ((a, rng.uniform(60, 190)) for a in angles)
+    ]
+
+
+async def send(reader, writer, host, body: bytes):
+    writer.write(
+        (
+            "POST /solve HTTP/1.1\r\nHost: %s\r\nContent-Type: application/json\r\n"
+            "Content-Length: %d\r\n\r\n" % (host, len(body))
+        ).encode("latin-1")
+        + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(args, bodies, latencies, statuses):
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    try:
+        while bodies:
+            body = bodies.pop()
+            start = time.perf_counter()
+            try:
+                status = await send(reader, writer, args.host, body)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                statuses["connection error"] += 1
+                writer.close()
+                reader, writer = await asyncio.open_connection(args.host, args.port)
+                continue
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+            if status == 429:
+                await asyncio.sleep(args.backoff)
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return float("nan")
+    return sorted_values[min(int(q * len(sorted_values)), len(sorted_values) - 1)]
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    low, high = args.vertices
+    bodies = [
+        json.dumps(
+            {"id": k, "points": random_polygon(rng, rng.randint(low, high))}
+        ).encode("utf-8")
+        for k in range(args.requests)
+    ]
+    latencies, statuses = [], Counter()
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(client(args, bodies, latencies, statuses) for _ in range(args.concurrency))
+    )
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    report = {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(args.requests / elapsed, 1),
+        "ok_rps": round(statuses[200] / elapsed, 1),
+        "latency_ms": {
+            name: round(1000 * percentile(latencies, q), 2)
+            for name, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+        },
+        "statuses": {str(k): v for k, v in sorted(statuses.items(), key=str)},
+    }
+    print(json.dumps(report, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for POST /solve")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--vertices", type=int, nargs=2, default=(10, 60), metavar=("MIN", "MAX"))
+    parser.add_argument("--backoff", type=float, default=0.05, help="Seconds to wait after a 429")
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
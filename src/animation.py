@@ -0,0 +1,200 @@
+# Animation pacing shared by the algorithm steps.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# animation.py - Frame pacing through per-session clocks, plus recording of drawing
+# calls and their later replay.
+
+import threading
+from typing import Any, Dict, NamedTuple, Tuple
+
+
+FRAME_DELAY = 0.4
+
+
+class AnimationClock:
+    """Frame timing for one session: a speed multiplier and a skip-to-end switch.
+
+    Every UI session owns its clock, so one session's speed never affects
+    another and nothing process-wide (like ``time.sleep``) is patched.
+    ``skip_to_end`` also cuts short a wait in progress on another thread.
+    """
+
+    def __init__(self, speed: float = 1.0):
+        self.speed = speed
+        self._skip = threading.Event()
+
+    @property
+    def skipping(self) -> bool:
+        return self._skip.is_set()
+
+    def skip_to_end(self):
+        self._skip.set()
+
+    def resume(self):
+        self._skip.clear()
+
+    def delay(self, seconds: float) -> float:
+        if self.skipping or self.speed <= 0:
+            return 0.0
+        return seconds / self.speed
+
+    def wait(self, seconds: float):
+        delay = self.delay(seconds)
+        if delay > 0:
+            self._skip.wait(delay)
+
+
+DEFAULT_CLOCK = AnimationClock()
+
+
+def pause(canvas, seconds=FRAME_DELAY, clock=None):
+    """Show the current frame and wait before drawing the next one.
+
+    The wait goes through ``clock``, else the canvas' ``clock`` attribute (set
+    by ``ArtGalleryPipeline``), else a real-time default clock. Canvases that
+    set ``animate = False`` (e.g. the headless canvas) skip the wait so the
+    algorithms run at full speed. Canvases with ``mark_frame`` only note where
+    the frame ends.
+    """
+    clock = clock or getattr(canvas, "clock", None) or DEFAULT_CLOCK
+    canvas.update()
+    mark_frame = getattr(canvas, "mark_frame", None)
+    if mark_frame is not None:
+        mark_frame(seconds, clock)
+    elif getattr(canvas, "animate", True):
+        clock.wait(seconds)
+
+
+class DrawEvent(NamedTuple):
+    """One recorded drawing operation.
+
+    ``kind`` is ``"line"``, ``"oval"``, ``"text"`` (``obj_id`` is the recorded
+    id), ``"delete"`` (``obj_id`` is the recorded id, a tag or ``"all"``) or
+    ``"frame"`` (``args`` holds the frame delay in seconds).
+    """
+
+    kind: str
+    obj_id: Any = None
+    args: Tuple = ()
+    kwargs: Dict = {}
+
+
+class StepCancelled(Exception):
+    """Raised inside a step drawing to a RecordingCanvas that was cancelled."""
+
+
+class RecordingCanvas:
+    """Canvas that logs drawing calls instead of drawing or waiting.
+
+    The algorithms run at full speed against it; ``take_events`` hands the
+    log to an ``AnimationPlayer``. Setting ``cancelled`` (from any thread)
+    makes the next drawing call raise ``StepCancelled``, which stops the step.
+
+    With a ``namespace`` the recorded ids are ``(namespace, n)`` pairs, so logs
+    recorded elsewhere (e.g. in a ``solve_pool`` worker) can be replayed through
+    the same player as local ones without their ids colliding.
+    """
+
+    animate = False
+
+    def __init__(self, namespace=None):
+        self.events = []
+        self.cancelled = threading.Event()
+        self.namespace = namespace
+        self._next_id = 1
+
+    def _check_cancelled(self):
+        if self.cancelled.is_set():
+            raise StepCancelled()
+
+    def _record(self, kind, args, kwargs):
+        self._check_cancelled()
+        obj_id = self._next_id
+        self._next_id += 1
+        if self.namespace is not None:
+            obj_id = (self.namespace, obj_id)
+        self.events.append(DrawEvent(kind, obj_id, args, kwargs))
+        return obj_id
+
+    def create_line(self, *args, **kwargs):
+        return self._record("line", args, kwargs)
+
+    def create_oval(self, *args, **kwargs):
+        return self._record("oval", args, kwargs)
+
+    def create_text(self, *args, **kwargs):
+        return self._record("text", args, kwargs)
+
+    def delete(self, tag):
+        self._check_cancelled()
+        self.events.append(DrawEvent("delete", tag))
+
+    def update(self):
+        pass
+
+    def mark_frame(self, seconds=FRAME_DELAY, clock=None):
+        # The log keeps the unscaled delay; clocks apply at playback.
+        self._check_cancelled()
+        self.events.append(DrawEvent("frame", None, (seconds,)))
+
+    def take_events(self):
+        events, self.events = self.events, []
+        return events
+
+
+class AnimationPlayer:
+    """Replays recorded events onto a real canvas (Tk or the Matplotlib adapter).
+
+    Recorded ids are mapped to the target canvas ids, so a log may delete
+    objects created by an earlier log played through the same player. Frame
+    delays go through ``clock`` (speed, skip-to-end).
+    """
+
+    def __init__(self, canvas, clock=None):
+        self.canvas = canvas
+        self.clock = clock or DEFAULT_CLOCK
+        self._ids = {}
+
+    def clear(self):
+        """Empty the canvas, e.g. before redrawing the logs of the valid stages."""
+        self.canvas.delete("all")
+        self._ids.clear()
+
+    def apply(self, event: DrawEvent):
+        if event.kind == "frame":
+            return
+        if event.kind == "delete":
+            if event.obj_id == "all":
+                self.canvas.delete("all")
+                self._ids.clear()
+            elif event.obj_id in self._ids:
+                self.canvas.delete(self._ids.pop(event.obj_id))
+            elif isinstance(event.obj_id, str):
+                self.canvas.delete(event.obj_id)  # a tag
+            return
+        create = getattr(self.canvas, "create_" + event.kind)
+        self._ids[event.obj_id] = create(*event.args, **event.kwargs)
+
+    def frames(self, events):
+        """Apply ``events`` one frame at a time, yielding each frame's delay.
+
+        Lets a UI drive playback from its own timer (e.g. Tk ``after``).
+        """
+        for event in events:
+            if event.kind == "frame":
+                yield event.args[0]
+            else:
+                self.apply(event)
+
+    def play(self, events, speed=1.0):
+        """Replay ``events``; ``speed`` scales the recorded delays on top of
+        the clock's own speed.
+
+        ``speed=None`` (or ``0``), or a clock skipping to the end, is instant:
+        everything is drawn and the canvas is refreshed once at the end.
+        """
+        for delay in self.frames(events):
+            if speed and not self.clock.skipping:
+                pause(self.canvas, delay / speed, self.clock)
+        self.canvas.update()
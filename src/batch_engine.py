@@ -0,0 +1,359 @@
+# Batch engine for many small polygons in one packed layout.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# batch_engine.py - Packs polygons into one coordinate array with offsets, classifies, fans,
+# colors and picks guards with NumPy across the batch, and sweeps the remaining polygons on
+# worker processes that share the arrays through multiprocessing.shared_memory.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import headless as headless_module
+import three_coloring as three_coloring_module
+import triangulation as triangulation_module
+
+# Polygon kinds, from cheapest to dearest
+CONVEX, MONOTONE, GENERAL = 0, 1, 2
+KIND_NAMES = ("convex", "monotone", "general")
+EPS = 1e-9
+CHUNKS_PER_WORKER = 4
+# Below this many vertices to sweep, starting worker processes costs more than it saves
+MIN_PARALLEL_VERTICES = 20000
+
+
+@dataclass
+class PolygonBatch:
+    """Outer rings packed end to end: polygon ``i`` is
+    ``coords[offsets[i]:offsets[i + 1]]``."""
+
+    coords: np.ndarray  # (N, 2) float64
+    offsets: np.ndarray  # (P + 1,) int64
+
+    @classmethod
+    def from_polygons(cls, polygons: Sequence[Sequence[Tuple[float, float]]]) -> "PolygonBatch":
+        sizes = np.fromiter((len(p) for p in polygons), dtype=np.int64, count=len(polygons))
+        if (sizes < 3).any():
+            raise ValueError("A polygon needs at least 3 vertices")
+        offsets = np.zeros(len(polygons) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=offsets[1:])
+        coords = np.empty((offsets[-1], 2), dtype=np.float64)
+        for polygon, start, stop in zip(polygons, offsets[:-1], offsets[1:]):
+            coords[start:stop] = polygon
+        return cls(coords, offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def polygon(self, index) -> np.ndarray:
+        return self.coords[self.offsets[index] : self.offsets[index + 1]]
+
+    def ring_ids(self) -> np.ndarray:
+        """The polygon of every vertex."""
+        return np.repeat(np.arange(len(self)), np.diff(self.offsets))
+
+    def ring_neighbours(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Indices of the previous and next vertex of every vertex in its own ring."""
+        n = len(self.coords)
+        nxt = np.arange(1, n + 1)
+        nxt[self.offsets[1:] - 1] = self.offsets[:-1]
+        prv = np.arange(-1, n - 1)
+        prv[self.offsets[:-1]] = self.offsets[1:] - 1
+        return prv, nxt
+
+
+@dataclass
+class BatchResult:
+    """Ragged results aligned with a ``PolygonBatch``.
+
+    Triangles hold ring-local vertex indices; polygon ``i`` owns
+    ``triangles[triangle_offsets[i]:triangle_offsets[i + 1]]`` (a simple
+    polygon of n vertices has n - 2 triangles). ``colors`` are palette indices
+    and ``guards`` marks guard vertices, both per packed vertex. Rows of a
+    polygon with ``ok`` false are left at -1 / False.
+    """
+
+    batch: PolygonBatch
+    kinds: np.ndarray  # (P,) int8
+    triangles: np.ndarray  # (N - 2P, 3) int32
+    triangle_offsets: np.ndarray  # (P + 1,) int64
+    colors: np.ndarray  # (N,) int8
+    guards: np.ndarray  # (N,) bool
+    ok: np.ndarray  # (P,) bool
+
+    def triangles_of(self, index) -> np.ndarray:
+        return self.triangles[self.triangle_offsets[index] : self.triangle_offsets[index + 1]]
+
+    def guards_of(self, index) -> List[int]:
+        start, stop = self.batch.offsets[index], self.batch.offsets[index + 1]
+        return np.flatnonzero(self.guards[start:stop]).tolist()
+
+    def solve_result(self, index) -> headless_module.SolveResult:
+        """Polygon ``index`` as a ``headless.SolveResult``."""
+        if not self.ok[index]:
+            raise ValueError("Polygon %d could not be solved" % index)
+        start = self.batch.offsets[index]
+        points = [tuple(p) for p in self.batch.polygon(index).tolist()]
+        palette = three_coloring_module.PALETTE
+        colors = self.colors[start : self.batch.offsets[index + 1]].tolist()
+        guards = self.guards_of(index)
+        return headless_module.SolveResult(
+            points=points,
+            triangles=[tuple(t) for t in self.triangles_of(index).tolist()],
+            colors={i: palette[c] for i, c in enumerate(colors)},
+            guards=guards,
+            guard_points=[points[i] for i in guards],
+        )
+
+
+def classify(batch: PolygonBatch) -> np.ndarray:
+    """Kind of every polygon: convex, y-monotone, or general.
+
+    Works on the whole batch at once. Convex means no reflex corner and
+    y-monotone, which rules out rings that wind more than once; y-monotone
+    uses the test of ``fast_paths.is_y_monotone`` (the y direction of the
+    edges changes at most twice around the ring, horizontal edges ordered by
+    x). Rings of zero area are never convex.
+    """
+    coords, offsets = batch.coords, batch.offsets
+    starts = offsets[:-1]
+    prv, nxt = batch.ring_neighbours()
+    x, y = coords[:, 0], coords[:, 1]
+
+    area = np.add.reduceat(x * y[nxt] - x[nxt] * y, starts)
+    turn = (x - x[prv]) * (y[nxt] - y) - (y - y[prv]) * (x[nxt] - x)
+    turn *= np.sign(area)[batch.ring_ids()]
+    locally_convex = np.minimum.reduceat(turn, starts) >= -EPS
+
+    # Every edge goes up or down: equal y values are ordered by x, as in
+    # the sweeps (the smaller x is higher)
+    dy = y[nxt] - y
+    up = (dy > 0) | ((dy == 0) & (x[nxt] < x))
+    ring = batch.ring_ids()
+    changes = np.bincount(
+        ring[1:], weights=(up[1:] != up[:-1]) & (ring[1:] == ring[:-1]), minlength=len(batch)
+    )
+    changes += up[starts] != up[offsets[1:] - 1]
+    flat = np.maximum.reduceat(y, starts) == np.minimum.reduceat(y, starts)
+    monotone = (changes <= 2) & ~flat
+
+    kinds = np.full(len(batch), GENERAL, dtype=np.int8)
+    kinds[monotone] = MONOTONE
+    kinds[locally_convex & monotone & (np.abs(area) > EPS)] = CONVEX
+    return kinds
+
+
+def _fan_all(batch, kinds, triangles, triangle_offsets, colors):
+    # Fan from each convex polygon's first vertex, and color it (apex 0,
+    # then 1 and 2 alternating), for all convex polygons at once.
+    polygons = np.flatnonzero(kinds == CONVEX)
+    if not len(polygons):
+        return
+    sizes = np.diff(batch.offsets)[polygons]
+    rows = np.concatenate(
+        [np.arange(triangle_offsets[p], triangle_offsets[p + 1]) for p in polygons]
+    )
+    local = rows - np.repeat(triangle_offsets[polygons], sizes - 2)
+    triangles[rows, 0] = 0
+    triangles[rows, 1] = local + 1
+    triangles[rows, 2] = local + 2
+    vertices = np.concatenate(
+        [np.arange(batch.offsets[p], batch.offsets[p + 1]) for p in polygons]
+    )
+    k = vertices - np.repeat(batch.offsets[polygons], sizes)
+    colors[vertices] = np.where(k == 0, 0, 1 + (k + 1) % 2)
+
+
+def color_triangles(triangles, num_vertices) -> List[int]:
+    """3-color the vertices of a triangulated simple polygon.
+
+    Walks the triangles across shared edges from the first one; each new
+    triangle has one uncolored corner, which takes the remaining color.
+    """
+    colors = [-1] * num_vertices
+    if not triangles:
+        return colors
+    by_edge = {}
+    for t, (a, b, c) in enumerate(triangles):
+        for edge in ((a, b), (b, c), (c, a)):
+            by_edge.setdefault(frozenset(edge), []).append(t)
+    a, b, c = triangles[0]
+    colors[a], colors[b], colors[c] = 0, 1, 2
+    seen = [False] * len(triangles)
+    seen[0] = True
+    stack = [0]
+    while stack:
+        a, b, c = triangles[stack.pop()]
+        for edge in ((a, b), (b, c), (c, a)):
+            for t in by_edge[frozenset(edge)]:
+                if seen[t]:
+                    continue
+                seen[t] = True
+                corners = triangles[t]
+                missing = [v for v in corners if colors[v] < 0]
+                if missing:
+                    colors[missing[0]] = 3 - sum(colors[v] for v in corners if colors[v] >= 0)
+                stack.append(t)
+    return colors
+
+
+def _solve_one(points, kind):
+    if kind == MONOTONE:
+        return list(triangulation_module.monotone_triangles(range(len(points)), points))
+    return list(headless_module.iter_triangles(points))
+
+
+def _solve_range(arrays, start, stop):
+    # Triangulate and color pending polygons start..stop in place.
+    coords, offsets = arrays["coords"], arrays["offsets"]
+    for p in arrays["pending"][start:stop]:
+        lo, hi = offsets[p], offsets[p + 1]
+        points = [tuple(xy) for xy in coords[lo:hi].tolist()]
+        try:
+            triangles = _solve_one(points, arrays["kinds"][p])
+            if len(triangles) != hi - lo - 2:
+                raise ValueError("Triangulation has the wrong number of triangles")
+            colors = color_triangles(triangles, hi - lo)
+        except Exception:
+            arrays["ok"][p] = False
+            continue
+        row = lo - 2 * p
+        arrays["triangles"][row : row + len(triangles)] = triangles
+        arrays["colors"][lo:hi] = colors
+
+
+# Worker processes attach to the shared blocks once, in the initializer
+_worker_blocks = []
+_worker_arrays = {}
+
+
+def _init_worker(specs):
+    for key, (name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(shm)
+        _worker_arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _solve_shared_range(start, stop):
+    _solve_range(_worker_arrays, start, stop)
+    return stop - start
+
+
+def _chunks(sizes, count):
+    # Split pending polygons into ``count`` runs of about equal vertex totals
+    bounds = np.searchsorted(np.cumsum(sizes), np.linspace(0, sizes.sum(), count + 1)[1:-1])
+    edges = np.unique(np.concatenate(([0], bounds, [len(sizes)])))
+    return list(zip(edges[:-1].tolist(), edges[1:].tolist()))
+
+
+def _solve_shared(arrays, workers):
+    blocks = {}
+    views = {}
+    try:
+        for key, array in arrays.items():
+            shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            blocks[key] = shm
+            views[key] = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+            views[key][...] = array
+        specs = {
+            key: (blocks[key].name, array.shape, array.dtype.str)
+            for key, array in arrays.items()
+        }
+        sizes = np.diff(arrays["offsets"])[arrays["pending"]]
+        ranges = _chunks(sizes, workers * CHUNKS_PER_WORKER)
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(specs,)
+        ) as executor:
+            for future in [executor.submit(_solve_shared_range, *r) for r in ranges]:
+                future.result()
+        for key in ("triangles", "colors", "ok"):
+            arrays[key][...] = views[key]
+    finally:
+        views.clear()
+        for shm in blocks.values():
+            shm.close()
+            shm.unlink()
+
+
+def _check_areas(batch, arrays, triangle_offsets):
+    # A polygon is ok only if its triangles tile its (non-zero) area; this
+    # catches rings that are not simple, which the sweeps do not detect.
+    # Rows of polygons that fail are reset to -1.
+    coords, ok = batch.coords, arrays["ok"]
+    sizes = np.diff(batch.offsets)
+    starts = batch.offsets[:-1]
+    prv, nxt = batch.ring_neighbours()
+    x, y = coords[:, 0], coords[:, 1]
+    area = np.abs(np.add.reduceat(x * y[nxt] - x[nxt] * y, starts))
+
+    triangles = arrays["triangles"]
+    row_polygon = np.repeat(np.arange(len(batch)), sizes - 2)
+    corners = np.where(triangles >= 0, triangles + starts[row_polygon][:, None], 0)
+    ab = coords[corners[:, 1]] - coords[corners[:, 0]]
+    ac = coords[corners[:, 2]] - coords[corners[:, 0]]
+    cross = np.abs(ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0])
+    tiled = np.add.reduceat(cross, triangle_offsets[:-1])
+    ok &= (area > EPS) & np.isclose(tiled, area, rtol=1e-9, atol=0.0)
+
+    triangles[~ok[row_polygon]] = -1
+    arrays["colors"][~ok[batch.ring_ids()]] = -1
+
+
+def solve_batch(batch: PolygonBatch, workers: Optional[int] = None) -> BatchResult:
+    """Triangulate, 3-color and guard every polygon of ``batch``.
+
+    Classification, convex fans, their coloring and guard selection run
+    vectorized over the whole batch. Monotone and general polygons are swept
+    one by one, on ``workers`` processes (default: one per CPU; 1, or fewer
+    than ``MIN_PARALLEL_VERTICES`` vertices, solves in this process) that
+    read the packed input and write their rows of the output through shared
+    memory, so no polygon is pickled.
+    """
+    num_polygons = len(batch)
+    kinds = classify(batch)
+    sizes = np.diff(batch.offsets)
+    triangle_offsets = batch.offsets - 2 * np.arange(num_polygons + 1)
+    arrays = {
+        "coords": batch.coords,
+        "offsets": batch.offsets,
+        "kinds": kinds,
+        "pending": np.flatnonzero(kinds != CONVEX),
+        "triangles": np.full((triangle_offsets[-1], 3), -1, dtype=np.int32),
+        "colors": np.full(len(batch.coords), -1, dtype=np.int8),
+        "ok": np.ones(num_polygons, dtype=bool),
+    }
+    _fan_all(batch, kinds, arrays["triangles"], triangle_offsets, arrays["colors"])
+
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(arrays["pending"]))
+    if workers > 1 and sizes[arrays["pending"]].sum() >= MIN_PARALLEL_VERTICES:
+        _solve_shared(arrays, workers)
+    elif len(arrays["pending"]):
+        _solve_range(arrays, 0, len(arrays["pending"]))
+
+    _check_areas(batch, arrays, triangle_offsets)
+
+    # Smallest color class per polygon (ties prefer the lower color, as in
+    # vertex_guards); failed polygons have no colors and get no guards.
+    colors = arrays["colors"]
+    ring_ids = batch.ring_ids()
+    colored = colors >= 0
+    counts = np.bincount(
+        ring_ids[colored] * 3 + colors[colored], minlength=3 * num_polygons
+    ).reshape(num_polygons, 3)
+    guard_color = np.argmin(counts, axis=1)
+    guards = colored & (colors == guard_color[ring_ids])
+    return BatchResult(
+        batch=batch,
+        kinds=kinds,
+        triangles=arrays["triangles"],
+        triangle_offsets=triangle_offsets,
+        colors=colors,
+        guards=guards,
+        ok=arrays["ok"],
+    )
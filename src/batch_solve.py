@@ -0,0 +1,162 @@
+# Batch solving of polygons given as JSON lines.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# batch_solve.py - Streams JSONL polygons through the headless pipeline on worker processes
+# and writes one JSONL result per input line, in input order.
+
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional
+
+import headless as headless_module
+import result_cache as result_cache_module
+
+# solve_polygon keyword arguments a request may set
+SOLVE_OPTIONS = ("rotation", "shift", "start_face_index", "fast_paths", "convex_partition")
+CACHE_BYTES = 64 * 1024 * 1024  # default in-memory result cache per process
+
+# Result cache of this process, set up by use_cache (in each worker too)
+_cache: Optional[result_cache_module.ResultCache] = None
+
+
+def use_cache(max_memory_bytes: int, disk_dir=None):
+    """Answer repeated polygons of this process from a ``ResultCache``.
+
+    ``max_memory_bytes=0`` turns caching off. Workers have a memory tier
+    each; a ``disk_dir`` is shared by all of them.
+    """
+    global _cache
+    _cache = None
+    if max_memory_bytes > 0:
+        _cache = result_cache_module.ResultCache(max_memory_bytes, disk_dir)
+
+
+def parse_request(line: str) -> dict:
+    """Decode one input line.
+
+    A line is either a JSON array of ``[x, y]`` points or an object with
+    ``points`` and optionally ``id``, ``holes`` and ``options`` (keyword
+    arguments of ``headless.solve_polygon``).
+    """
+    data = json.loads(line)
+    if isinstance(data, list):
+        data = {"points": data}
+    if not isinstance(data, dict) or not isinstance(data.get("points"), list):
+        raise ValueError("Expected a list of points or an object with 'points'")
+    options = data.get("options", {})
+    if not isinstance(options, dict):
+        raise ValueError("'options' must be an object")
+    unknown = set(options) - set(SOLVE_OPTIONS)
+    if unknown:
+        raise ValueError("Unknown options: %s" % ", ".join(sorted(unknown)))
+    return {
+        "id": data.get("id"),
+        "points": [(float(x), float(y)) for x, y in data["points"]],
+        "holes": [[(float(x), float(y)) for x, y in hole] for hole in data.get("holes", [])],
+        "options": options,
+    }
+
+
+def solve_line(line_number: int, line: str) -> dict:
+    """Solve one input line; failures become ``{"ok": false, "error": ...}`` records."""
+    record = {"id": line_number, "line": line_number}
+    start = time.perf_counter()
+    try:
+        request = parse_request(line)
+        if request["id"] is not None:
+            record["id"] = request["id"]
+        parsed = time.perf_counter()
+        solve = _cache.solve if _cache is not None else headless_module.solve_polygon
+        result = solve(request["points"], holes=request["holes"], **request["options"])
+    except Exception as exc:
+        record.update(ok=False, error="%s: %s" % (type(exc).__name__, exc))
+        return record
+    solved = time.perf_counter()
+    record.update(ok=True, **result_fields(result))
+    record["timings"] = {"parse": parsed - start, "solve": solved - parsed}
+    return record
+
+
+def result_fields(result) -> dict:
+    """The JSON fields reported for a ``SolveResult``."""
+    fields = {
+        "triangles": [list(t) for t in result.triangles],
+        "guards": list(result.guards),
+        "guard_points": [list(p) for p in result.guard_points],
+    }
+    if result.convex_pieces:
+        fields["convex_pieces"] = [list(piece) for piece in result.convex_pieces]
+    return fields
+
+
+def _numbered(lines: Iterable[str]) -> Iterator:
+    for line_number, line in enumerate(lines, 1):
+        if line.strip():
+            yield line_number, line
+
+
+def solve_lines(
+    lines: Iterable[str],
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    cache_bytes: int = CACHE_BYTES,
+    cache_dir=None,
+) -> Iterator[dict]:
+    """Yield a result record per non-blank line of ``lines``, in input order.
+
+    Lines are read lazily and at most ``max_in_flight`` of them (default: four
+    per worker) are queued or being solved at once, so memory stays bounded
+    however long the input is. ``workers=1`` solves in this process.
+    Repeated polygons are answered from a result cache (see ``use_cache``).
+    """
+    if workers == 1:
+        use_cache(cache_bytes, cache_dir)
+        for line_number, line in _numbered(lines):
+            yield solve_line(line_number, line)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 4 * workers
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=use_cache, initargs=(cache_bytes, cache_dir)
+    ) as executor:
+        in_flight = deque()
+        try:
+            for line_number, line in _numbered(lines):
+                in_flight.append(executor.submit(solve_line, line_number, line))
+                if len(in_flight) >= max_in_flight:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+        finally:
+            # Closed early (e.g. the output broke): do not solve what is queued
+            for future in in_flight:
+                future.cancel()
+
+
+def run(
+    input_stream,
+    output_stream,
+    workers=None,
+    max_in_flight=None,
+    cache_bytes=CACHE_BYTES,
+    cache_dir=None,
+):
+    """Solve every line of ``input_stream`` into ``output_stream``.
+
+    Returns ``(solved, failed)`` counts.
+    """
+    solved = failed = 0
+    records = solve_lines(input_stream, workers, max_in_flight, cache_bytes, cache_dir)
+    for record in records:
+        output_stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+        output_stream.flush()
+        if record["ok"]:
+            solved += 1
+        else:
+            failed += 1
+    return solved, failed
@@ -2,13 +2,30 @@
 # Date: 25 Sept, 2025
 # controller.py - Tkinter desktop GUI controller wiring the algorithm pipeline to UI widgets
 
+import queue
+import threading
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, simpledialog
 
+from animation import AnimationPlayer, RecordingCanvas, StepCancelled
+from lod import POLYGON_TAG, Viewport, draw_polygon
 from pipeline import ArtGalleryPipeline
 from ui import Toolbar, CanvasPanel, ThemeManager, HeaderBar, StatusBar
 
 
+POLL_INTERVAL_MS = 30
+
+# Toolbar button -> pipeline stage it runs, in pipeline order
+STEP_BUTTONS = (
+    ("trapezoidal", "trapezoidalisation"),
+    ("monotone", "monotone_partitioning"),
+    ("triangulation", "triangulation"),
+    ("dual_graph", "dual_graph"),
+    ("three_coloring", "three_coloring"),
+    ("vertex_guards", "vertex_guards"),
+)
+
+
 class ArtGalleryController:
     def __init__(self):
         self.root = tk.Tk()
@@ -25,7 +42,27 @@ class ArtGalleryController:
         self.toolbar = Toolbar(self.root)
         self.status = StatusBar(self.root)
 
-        self.pipeline = ArtGalleryPipeline(self.canvas_panel.widget())
+        # Stages compute against a recorder on a worker thread; the player
+        # animates their logs on the Tk thread, one after() tick per frame.
+        self.recorder = RecordingCanvas()
+        self.pipeline = ArtGalleryPipeline(self.recorder)
+        self.player = AnimationPlayer(self.canvas_panel.widget(), self.pipeline.clock)
+        self._results = queue.Queue()
+        self._busy = False
+        self._frames = None
+        self._after_id = None
+        self._on_animation_done = None
+
+        # Zoom (mouse wheel) and pan (drag); the polygon is redrawn at the
+        # detail level of the visible region.
+        self.viewport = Viewport()
+        self._drag_from = None
+        canvas = self.canvas_panel.widget()
+        canvas.bind("<MouseWheel>", lambda e: self.on_zoom(e, e.delta > 0))
+        canvas.bind("<Button-4>", lambda e: self.on_zoom(e, True))
+        canvas.bind("<Button-5>", lambda e: self.on_zoom(e, False))
+        canvas.bind("<ButtonPress-1>", self.on_pan_start)
+        canvas.bind("<B1-Motion>", self.on_pan)
 
         # Build buttons
         self.toolbar.add_button(
@@ -52,6 +89,14 @@ class ArtGalleryController:
         self.toolbar.add_button(
             "vertex_guards", "Vertex Guards", self.on_vertex_guards, enabled=False
         )
+        self.toolbar.add_button("back", "◀ Step Back", self.on_back, enabled=False)
+        self.toolbar.add_button(
+            "forward", "Step Forward ▶", self.on_forward, enabled=False
+        )
+        self.toolbar.add_button("cancel", "Cancel", self.on_cancel, enabled=False)
+        self.toolbar.add_scale(
+            "Animation speed", 0.25, 4.0, self.pipeline.clock.speed, self.on_speed
+        )
 
     # State helpers
     def _advance(self, next_key: str | None = None):
@@ -59,69 +104,247 @@ class ArtGalleryController:
         self.toolbar.enable("generate")
         if next_key:
             self.toolbar.enable(next_key)
+        self.toolbar.set_enabled("back", self.pipeline.can_step_back())
+        self.toolbar.set_enabled("forward", self.pipeline.can_step_forward())
         self.status.set_message("Ready")
 
+    def _run_step(self, message, step, next_key, done_message):
+        """Run ``step`` on a worker thread, then animate what it drew."""
+        self.status.set_message(message)
+        self.toolbar.disable_all()
+        self.toolbar.enable("cancel")
+        self._busy = True
+        self.recorder.cancelled.clear()
+
+        def work():
+            try:
+                outcome = step()
+            except StepCancelled:
+                outcome = None
+            except Exception as exc:
+                outcome = exc
+            self._results.put(outcome)
+
+        threading.Thread(target=work, daemon=True).start()
+        self.root.after(POLL_INTERVAL_MS, self._poll, next_key, done_message)
+
+    def _poll(self, next_key, done_message):
+        try:
+            outcome = self._results.get_nowait()
+        except queue.Empty:
+            self.root.after(POLL_INTERVAL_MS, self._poll, next_key, done_message)
+            return
+        self._busy = False
+        if outcome is None:
+            self.recorder.take_events()  # partial drawing of the cancelled step
+            self.pipeline.take_new_events()
+            self._advance(self._next_step_key())
+            self.status.set_message("Step cancelled.")
+            return
+
+        def finish():
+            if outcome is True:
+                self._advance(next_key)
+                self.status.set_message(done_message)
+            else:
+                self.recorder.take_events()
+                self._advance(self._next_step_key())
+                detail = str(outcome) if isinstance(outcome, Exception) else ""
+                messagebox.showwarning(
+                    "Warning", detail or "Please generate a polygon first."
+                )
+
+        self._animate(self.pipeline.take_new_events(), finish)
+
+    def _next_step_key(self):
+        if not self.pipeline.is_valid("polygon"):
+            return None
+        for key, stage in STEP_BUTTONS:
+            if not self.pipeline.is_valid(stage):
+                return key
+        return None
+
+    # Animation
+    def _animate(self, events, on_done):
+        # Recorded drawings use the unzoomed mapping
+        self._reset_view()
+        self._frames = self.player.frames(events)
+        self._on_animation_done = on_done
+        self._next_frame()
+
+    def _next_frame(self):
+        self._after_id = None
+        try:
+            delay = next(self._frames)
+        except StopIteration:
+            self._end_animation()
+            return
+        self._after_id = self.root.after(
+            max(int(self.pipeline.clock.delay(delay) * 1000), 1), self._next_frame
+        )
+
+    def _end_animation(self):
+        self._frames = None
+        on_done, self._on_animation_done = self._on_animation_done, None
+        if on_done:
+            on_done()
+
+    def _redraw_stages(self):
+        # Draws the logs of the valid stages at once, e.g. after stepping back
+        self.pipeline.take_new_events()
+        self._reset_view()
+        self.player.clear()
+        for events in self.pipeline.event_logs.values():
+            self.player.play(events, speed=None)
+
+    def on_cancel(self):
+        if self._busy:
+            self.recorder.cancelled.set()
+            self.status.set_message("Cancelling…")
+        elif self._frames is not None:
+            # The step is computed; draw the rest of it at once
+            if self._after_id is not None:
+                self.root.after_cancel(self._after_id)
+                self._after_id = None
+            for _ in self._frames:
+                pass
+            self._end_animation()
+
+    def on_speed(self, value):
+        self.pipeline.clock.speed = max(float(value), 0.05)
+
+    # Zoom and pan
+    def _redraw_polygon(self):
+        canvas = self.canvas_panel.widget()
+        polygon_app = self.pipeline.polygon_app
+        if self._busy or not polygon_app or not polygon_app.points:
+            return
+        canvas.delete(POLYGON_TAG)
+        draw_polygon(
+            canvas,
+            [polygon_app.points] + polygon_app.holes,
+            self.viewport,
+            polygon_app.lod,
+        )
+
+    def _reset_view(self):
+        if self.viewport.is_identity:
+            return
+        # Items sit at scale * unzoomed + (offset - scale * default offset)
+        canvas = self.canvas_panel.widget()
+        default = Viewport()
+        scale = self.viewport.scale
+        canvas.move(
+            "all",
+            -(self.viewport.offset_x - scale * default.offset_x),
+            -(self.viewport.offset_y - scale * default.offset_y),
+        )
+        canvas.scale("all", 0, 0, 1 / scale, 1 / scale)
+        self.viewport = default
+        self._redraw_polygon()
+
+    def on_zoom(self, event, zoom_in: bool):
+        if self._busy or self._frames is not None:
+            return
+        factor = 1.25 if zoom_in else 0.8
+        self.canvas_panel.widget().scale("all", event.x, event.y, factor, factor)
+        self.viewport.zoom(factor, event.x, event.y)
+        self._redraw_polygon()
+
+    def on_pan_start(self, event):
+        self._drag_from = (event.x, event.y)
+
+    def on_pan(self, event):
+        if self._drag_from is None or self._busy or self._frames is not None:
+            return
+        dx = event.x - self._drag_from[0]
+        dy = event.y - self._drag_from[1]
+        self._drag_from = (event.x, event.y)
+        self.canvas_panel.widget().move("all", dx, dy)
+        self.viewport.pan(dx, dy)
+        self._redraw_polygon()
+
     # Button handlers
     def on_generate(self):
-        self.status.set_message("Generating polygon…")
-        self._advance(None)
-        if self.pipeline.step_generate_polygon():
-            self.status.set_message(
-                "Polygon generated. Continue with trapezoidalisation."
-            )
-            self._advance("trapezoidal")
+        n = simpledialog.askinteger(
+            "Input", "Enter number of vertices (n):", minvalue=3, maxvalue=100
+        )
+        if not n:
+            return
+        self._run_step(
+            "Generating polygon…",
+            lambda: self.pipeline.step_generate_polygon_with_n(n),
+            "trapezoidal",
+            "Polygon generated. Continue with trapezoidalisation.",
+        )
 
     def on_trapezoidal(self):
-        self.status.set_message("Drawing trapezoidalisation…")
-        if self.pipeline.step_trapezoidalisation():
-            self.status.set_message(
-                "Trapezoidalisation done. Continue with monotone partitioning."
-            )
-            self._advance("monotone")
-        else:
-            messagebox.showwarning("Warning", "Please generate a polygon first.")
+        self._run_step(
+            "Drawing trapezoidalisation…",
+            self.pipeline.step_trapezoidalisation,
+            "monotone",
+            "Trapezoidalisation done. Continue with monotone partitioning.",
+        )
 
     def on_monotone(self):
-        self.status.set_message("Computing monotone partitioning…")
-        if self.pipeline.step_monotone_partitioning():
-            self.status.set_message(
-                "Monotone partitioning complete. Continue with triangulation."
-            )
-            self._advance("triangulation")
-        else:
-            messagebox.showwarning("Warning", "Please generate a polygon first.")
+        self._run_step(
+            "Computing monotone partitioning…",
+            self.pipeline.step_monotone_partitioning,
+            "triangulation",
+            "Monotone partitioning complete. Continue with triangulation.",
+        )
 
     def on_triangulation(self):
-        self.status.set_message("Triangulating…")
-        if self.pipeline.step_triangulation():
-            self.status.set_message("Triangulation done. Build the dual graph next.")
-            self._advance("dual_graph")
-        else:
-            messagebox.showwarning("Warning", "Please generate a polygon first.")
+        self._run_step(
+            "Triangulating…",
+            self.pipeline.step_triangulation,
+            "dual_graph",
+            "Triangulation done. Build the dual graph next.",
+        )
 
     def on_dual_graph(self):
-        self.status.set_message("Creating dual graph…")
-        if self.pipeline.step_dual_graph():
-            self.status.set_message("Dual graph created. Proceed to 3-coloring.")
-            self._advance("three_coloring")
-        else:
-            messagebox.showwarning("Warning", "Please generate a polygon first.")
+        self._run_step(
+            "Creating dual graph…",
+            self.pipeline.step_dual_graph,
+            "three_coloring",
+            "Dual graph created. Proceed to 3-coloring.",
+        )
 
     def on_three_coloring(self):
-        self.status.set_message("3-coloring triangulation…")
-        if self.pipeline.step_three_coloring():
-            self.status.set_message("3-coloring complete. Compute vertex guards.")
-            self._advance("vertex_guards")
-        else:
-            messagebox.showwarning("Warning", "Please generate a polygon first.")
+        self._run_step(
+            "3-coloring triangulation…",
+            self.pipeline.step_three_coloring,
+            "vertex_guards",
+            "3-coloring complete. Compute vertex guards.",
+        )
 
     def on_vertex_guards(self):
-        self.status.set_message("Selecting vertex guards…")
-        if self.pipeline.step_vertex_guards():
-            self.status.set_message("Vertex guards highlighted.")
-            self._advance(None)
-        else:
-            messagebox.showwarning("Warning", "Please generate a polygon first.")
+        self._run_step(
+            "Selecting vertex guards…",
+            self.pipeline.step_vertex_guards,
+            None,
+            "Vertex guards highlighted.",
+        )
+
+    # Undo history: stages are restored, never recomputed
+    def on_back(self):
+        stage = self.pipeline.step_back()
+        if stage is None:
+            return
+        self._redraw_stages()
+        self._advance(self._next_step_key())
+        self.status.set_message(
+            "Stepped back to %s." % self.pipeline.latest_stage.replace("_", " ")
+        )
+
+    def on_forward(self):
+        stage = self.pipeline.step_forward()
+        if stage is None:
+            return
+        self._reset_view()
+        self.player.play(self.pipeline.take_new_events(), speed=None)
+        self._advance(self._next_step_key())
+        self.status.set_message("Restored %s." % stage.replace("_", " "))
 
     def run(self):
         self.root.mainloop()
@@ -0,0 +1,82 @@
+# Convex partition of a triangulated polygon (Hertel–Mehlhorn).
+#
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# convex_partition.py - Removes inessential diagonals, leaving at most 4x the optimal piece count.
+#
+
+from animation import pause
+import profiling
+
+
+class ConvexPartitionApp:
+    def __init__(self, canvas, dcel, triangulation_app):
+        self.canvas = canvas
+        self.dcel = dcel
+        self.triangulation_app = triangulation_app
+        self.canvas_width = 500
+        self.canvas_height = 500
+        self.padding = 50
+        self.origin_x = self.padding
+        self.origin_y = self.canvas_height - self.padding
+        self.removed_diagonals = []
+        self.essential_diagonals = []
+
+    def is_convex_corner(self, incoming, outgoing, sign):
+        # incoming ends at the corner vertex, outgoing starts there.
+        a = incoming.origin
+        b = incoming.target
+        c = outgoing.target
+        profiling.count(profiling.ORIENTATION_TESTS)
+        cross = (b.x - a.x) * (c.y - b.y) - (b.y - a.y) * (c.x - b.x)
+        return sign * cross >= 0
+
+    def partition(self):
+        # Each diagonal is checked once against the current (already merged)
+        # neighbours at both endpoints, so the pass is linear in the DCEL size.
+        sign = self.dcel.orientation()
+        seen = set()
+        removed = []
+        for half_edge in list(self.dcel.half_edges):
+            if half_edge in seen or not self.dcel.is_diagonal(half_edge):
+                continue
+            twin = half_edge.twin
+            seen.add(half_edge)
+            seen.add(twin)
+            if self.is_convex_corner(
+                twin.prev, half_edge.next, sign
+            ) and self.is_convex_corner(half_edge.prev, twin.next, sign):
+                self.dcel.splice_out_edge(half_edge)
+                removed.append(half_edge)
+                self.removed_diagonals.append((half_edge.origin, half_edge.target))
+            else:
+                self.essential_diagonals.append((half_edge.origin, half_edge.target))
+
+        self.dcel.discard_edges(removed)
+        self.dcel.rebuild_faces()
+
+        for v1, v2 in self.essential_diagonals:
+            self.draw_essential_diagonal(v1, v2)
+
+    def pieces(self):
+        result = []
+        for face in self.dcel.faces:
+            vertices = []
+            half_edge = face.outer_half_edge
+            while True:
+                vertices.append(half_edge.origin)
+                half_edge = half_edge.next
+                if half_edge == face.outer_half_edge:
+                    break
+            result.append(vertices)
+        return result
+
+    def draw_essential_diagonal(self, vertex1, vertex2):
+        self.canvas.create_line(
+            self.origin_x + vertex1.x,
+            self.origin_y - vertex1.y,
+            self.origin_x + vertex2.x,
+            self.origin_y - vertex2.y,
+            fill="#5b8def",
+        )
+        pause(self.canvas)
@@ -4,6 +4,8 @@
 
 import math
 
+import profiling
+
 
 class Vertex:
     def __init__(self, x, y):
@@ -26,6 +28,63 @@ class HalfEdge:
 class Face:
     def __init__(self):
         self.outer_half_edge = None
+        self.inner_half_edges = []
+
+
+# Journal operations: each entry undoes one mutation and applying it yields
+# the entry that redoes it.
+_SET, _POP, _PUSH, _ADD, _DISCARD, _UNLINK, _RELINK = range(7)
+
+
+def _apply(entry):
+    kind = entry[0]
+    if kind == _UNLINK:
+        entry[1].unlink_diagonal(*entry[2:])
+        return (_RELINK,) + entry[1:]
+    if kind == _RELINK:
+        entry[1].relink_diagonal(*entry[2:])
+        return (_UNLINK,) + entry[1:]
+    if kind == _SET:
+        _, obj, attr, value = entry
+        inverse = (_SET, obj, attr, getattr(obj, attr))
+        setattr(obj, attr, value)
+        return inverse
+    if kind == _POP:
+        return (_PUSH, entry[1], entry[1].pop())
+    if kind == _PUSH:
+        entry[1].append(entry[2])
+        return (_POP, entry[1])
+    if kind == _ADD:
+        entry[1].add(entry[2])
+        return (_DISCARD, entry[1], entry[2])
+    entry[1].discard(entry[2])
+    return (_ADD, entry[1], entry[2])
+
+
+class Journal:
+    """Undo log of a DCEL's mutations.
+
+    ``mark()`` is a checkpoint; ``rollback(mark)`` undoes everything after it
+    and returns the entries that redo it, for ``replay``. Both cost the
+    number of mutations undone or redone, not the size of the DCEL.
+    """
+
+    def __init__(self):
+        self.entries = []
+
+    def mark(self) -> int:
+        return len(self.entries)
+
+    def rollback(self, mark: int) -> list:
+        redo = []
+        entries = self.entries
+        while len(entries) > mark:
+            redo.append(_apply(entries.pop()))
+        return redo
+
+    def replay(self, redo: list):
+        # Rolled back newest first, so redo the other way round.
+        self.entries.extend(_apply(entry) for entry in reversed(redo))
 
 
 class DCEL:
@@ -33,16 +92,35 @@ class DCEL:
         self.vertices = []
         self.half_edges = []
         self.faces = []
-        self.existing_lines = []
+        self.existing_lines = set()  # (v1, v2) for both directions of every edge
+        self.rings = []
+        # While set, every mutation below is recorded so it can be rolled back.
+        self.journal = None
+        self._orientation = None
+
+    def _set(self, obj, attr, value):
+        if self.journal is not None:
+            self.journal.entries.append((_SET, obj, attr, getattr(obj, attr)))
+        setattr(obj, attr, value)
+
+    def _append(self, items, item):
+        items.append(item)
+        if self.journal is not None:
+            self.journal.entries.append((_POP, items))
+
+    def _add_line(self, line):
+        if self.journal is not None and line not in self.existing_lines:
+            self.journal.entries.append((_DISCARD, self.existing_lines, line))
+        self.existing_lines.add(line)
 
     def add_vertex(self, x, y):
         vertex = Vertex(x, y)
-        self.vertices.append(vertex)
+        self._append(self.vertices, vertex)
         return vertex
 
     def add_edge(self, v1, v2):
-        self.existing_lines.append((v1, v2))
-        self.existing_lines.append((v2, v1))
+        self._add_line((v1, v2))
+        self._add_line((v2, v1))
 
         half_edge1 = HalfEdge()
         half_edge2 = HalfEdge()
@@ -55,11 +133,11 @@ class DCEL:
         half_edge1.target = v2
         half_edge2.target = v1
 
-        v1.incident_half_edges.append(half_edge1)
-        v2.incident_half_edges.append(half_edge2)
+        self._append(v1.incident_half_edges, half_edge1)
+        self._append(v2.incident_half_edges, half_edge2)
 
-        self.half_edges.append(half_edge1)
-        self.half_edges.append(half_edge2)
+        self._append(self.half_edges, half_edge1)
+        self._append(self.half_edges, half_edge2)
 
         return half_edge1, half_edge2
 
@@ -69,70 +147,353 @@ class DCEL:
 
         edge = outer_half_edge
         while True:
-            edge.target.incident_edges_and_faces.append((face, edge))
-            edge.incident_face = face
+            self._append(edge.target.incident_edges_and_faces, (face, edge))
+            self._set(edge, "incident_face", face)
             edge = edge.next
             if edge == outer_half_edge:
                 break
 
-        self.faces.append(face)
+        self._append(self.faces, face)
 
     def add_diagonal(self, v1, v2):
-        common_face_list = []
-        for x in v1.incident_edges_and_faces:
-            for y in v2.incident_edges_and_faces:
-                if x[0] is not None and y[0] is not None:
-                    if x[0] == y[0]:
-                        common_face_list.append(x)
-                        common_face_list.append(y)
-                        break
-
-        common_face = common_face_list[0][0]
-        temp_half_edge = common_face_list[0][1]
+        # Links v1-v2 inside their common face. If both ends lie on the same
+        # boundary cycle the face is split in two; if they lie on different
+        # cycles (outer boundary and a hole) the cycles merge into one. Only
+        # the smaller side of the diagonal is walked and relabelled (the face
+        # record keeps the larger one), so inserting k diagonals into an
+        # n-gon costs O(n log n) edge visits instead of O(n) per diagonal.
+        profiling.count(profiling.ADD_DIAGONAL)
+        face, in1, in2 = self.find_common_corners(v1, v2)
         half_edge1, half_edge2 = self.add_edge(v1, v2)
-        half_edge2.next = temp_half_edge.next
-        half_edge2.next.prev = half_edge2
-        half_edge1.prev = temp_half_edge
-        temp_half_edge.next = half_edge1
-
-        new_face1 = Face()
-        new_face2 = Face()
-
-        new_face1.outer_half_edge = half_edge1
-        new_face2.outer_half_edge = half_edge2
-        looping_edge = half_edge2
-        while True:
-            looping_edge.incident_face = new_face2
-            looping_edge.target.incident_edges_and_faces.append(
-                (new_face2, looping_edge)
+        out1 = in1.next
+        out2 = in2.next
+        in1.next = half_edge1
+        half_edge1.prev = in1
+        half_edge1.next = out2
+        out2.prev = half_edge1
+        in2.next = half_edge2
+        half_edge2.prev = in2
+        half_edge2.next = out1
+        out1.prev = half_edge2
+
+        before = (face.outer_half_edge, list(face.inner_half_edges))
+        merged, side = self.smaller_side(half_edge1, half_edge2)
+        if merged:
+            self.merge_cycles(face, side)
+            new_faces = []
+        else:
+            new_faces = [self.split_face(face, side)]
+        for edge in (half_edge1, half_edge2):
+            if edge.incident_face is None:
+                self.relabel(edge, None, face)
+        self.faces.extend(new_faces)
+        if self.journal is not None:
+            # One entry per diagonal: undoing relinks and relabels the
+            # smaller side rather than storing every field the split touched.
+            after = (face.outer_half_edge, list(face.inner_half_edges))
+            self.journal.entries.append(
+                (_UNLINK, self, half_edge1, face, new_faces, before, after)
             )
-            if looping_edge.target == v2:
-                break
-            looping_edge = looping_edge.next
 
-        half_edge1.next = looping_edge.next
+    def smaller_side(self, half_edge1, half_edge2):
+        # Walks from both new half-edges in lockstep and stops at the first
+        # walk that closes. Returns (merged, edges): a walk reaching the
+        # other half-edge means the diagonal joined two cycles, and its edges
+        # are one half-edge plus the whole smaller old cycle; a walk back to
+        # its start is the smaller of the two cycles the split made.
+        profiling.count(profiling.FACES_WALKED)
+        walk1, walk2 = [half_edge1], [half_edge2]
+        edge1, edge2 = half_edge1.next, half_edge2.next
+        while True:
+            if edge1 is half_edge1 or edge1 is half_edge2:
+                return edge1 is half_edge2, walk1
+            if edge2 is half_edge2 or edge2 is half_edge1:
+                return edge2 is half_edge1, walk2
+            walk1.append(edge1)
+            walk2.append(edge2)
+            edge1, edge2 = edge1.next, edge2.next
+
+    def merge_cycles(self, face, side):
+        # side[1:] is the smaller of the two joined cycles; the face keeps
+        # one boundary reference for the merged cycle and drops the other.
+        walked = set(side[1:])
+        if face.outer_half_edge in walked:
+            # The outer boundary was the smaller cycle: drop the reference of
+            # the joined hole, found by walking the merged cycle (each hole is
+            # walked this way at most once, when it joins the outer boundary).
+            merged = set(self.cycle(side[0]))
+            face.inner_half_edges = [he for he in face.inner_half_edges if he not in merged]
+        else:
+            face.inner_half_edges = [he for he in face.inner_half_edges if he not in walked]
+
+    def split_face(self, face, side):
+        # side is the smaller cycle of the split. The cycle with positive
+        # area bounds the new face (normally side itself; when the diagonal
+        # cuts a pocket off a hole it is the larger cycle), the other keeps
+        # the role of the cycle that was split. Holes inside the new face's
+        # boundary move with it.
+        other = side[0].twin
+        if self.orientation() * self.edges_area(side) <= 0:
+            side, other = self.cycle(other), side[0]
+        new_face = Face()
+        new_face.outer_half_edge = side[0]
+        inside = set(side)
+        if face.outer_half_edge in inside:
+            face.outer_half_edge = other
+        kept = []
+        for he in face.inner_half_edges:
+            if he in inside:
+                kept.append(other)
+            elif self.edges_contain(side, he):
+                new_face.inner_half_edges.append(he)
+            else:
+                kept.append(he)
+        face.inner_half_edges = kept
+        for edge in side:
+            self.relabel(edge, face, new_face)
+        for he in new_face.inner_half_edges:
+            for edge in self.cycle(he):
+                self.relabel(edge, face, new_face)
+        return new_face
+
+    def unlink_diagonal(self, half_edge1, face, new_faces, before, after):
+        # Reverts add_diagonal's linking and face split (not add_edge). The
+        # new edges keep their next/prev so relink_diagonal can redo it.
+        half_edge2 = half_edge1.twin
+        for new_face in new_faces:
+            for he in [new_face.outer_half_edge] + new_face.inner_half_edges:
+                for edge in self.cycle(he):
+                    is_new = edge is half_edge1 or edge is half_edge2
+                    self.relabel(edge, new_face, None if is_new else face)
+        for edge in (half_edge1, half_edge2):
+            if edge.incident_face is face:
+                self.relabel(edge, face, None)
+        in1, out2 = half_edge1.prev, half_edge1.next
+        in2, out1 = half_edge2.prev, half_edge2.next
+        in1.next = out1
+        out1.prev = in1
+        in2.next = out2
+        out2.prev = in2
+        face.outer_half_edge, face.inner_half_edges = before[0], list(before[1])
+        del self.faces[len(self.faces) - len(new_faces) :]
+
+    def relink_diagonal(self, half_edge1, face, new_faces, before, after):
+        half_edge2 = half_edge1.twin
+        half_edge1.prev.next = half_edge1
         half_edge1.next.prev = half_edge1
-        looping_edge.next = half_edge2
-        half_edge2.prev = looping_edge
-        looping_edge = half_edge1
+        half_edge2.prev.next = half_edge2
+        half_edge2.next.prev = half_edge2
+        face.outer_half_edge, face.inner_half_edges = after[0], list(after[1])
+        for new_face in new_faces:
+            for he in [new_face.outer_half_edge] + new_face.inner_half_edges:
+                for edge in self.cycle(he):
+                    is_new = edge is half_edge1 or edge is half_edge2
+                    self.relabel(edge, None if is_new else face, new_face)
+        for edge in (half_edge1, half_edge2):
+            if edge.incident_face is None:
+                self.relabel(edge, None, face)
+        self.faces.extend(new_faces)
+
+    def relabel(self, edge, old_face, face):
+        # Moves edge from old_face to face, replacing its corner entry at the
+        # target in place (appending it if there was none, dropping it if
+        # face is None).
+        edge.incident_face = face
+        entries = edge.target.incident_edges_and_faces
+        for k, (owner, incoming) in enumerate(entries):
+            if incoming is edge and owner is old_face:
+                if face is None:
+                    del entries[k]
+                else:
+                    entries[k] = (face, edge)
+                return
+        entries.append((face, edge))
+
+    def cycle(self, half_edge):
+        profiling.count(profiling.FACES_WALKED)
+        edges = []
+        edge = half_edge
         while True:
-            looping_edge.incident_face = new_face1
-            looping_edge.target.incident_edges_and_faces.append(
-                (new_face1, looping_edge)
-            )
-            if looping_edge.target == v1:
+            edges.append(edge)
+            edge = edge.next
+            if edge == half_edge:
                 break
-            looping_edge = looping_edge.next
-
-        self.faces.remove(common_face)
+        return edges
+
+    def find_common_corners(self, v1, v2):
+        # A corner is (face, incoming half-edge) at a vertex. When a vertex
+        # has several corners in the same face (after a hole was bridged),
+        # the one whose wedge contains the diagonal direction is used.
+        sign = self.orientation()
+        corners2 = {}
+        for face, edge in v2.incident_edges_and_faces:
+            if face is not None:
+                corners2.setdefault(face, []).append(edge)
+        matches = []
+        for face, edge in v1.incident_edges_and_faces:
+            if face is not None and face in corners2:
+                matches.append((face, edge))
+        if not matches:
+            raise ValueError("Vertices do not share a face")
+
+        # Both ends are checked: linking at the wrong corner of a bridged face
+        # would tie the boundary cycles into a knot that never closes.
+        for face, edge in matches:
+            if len(matches) > 1 and not self.wedge_contains(edge, v2, sign):
+                continue
+            others = corners2[face]
+            for other in others:
+                if len(others) == 1 or self.wedge_contains(other, v1, sign):
+                    return face, edge, other
+        raise ValueError("Diagonal does not run inside a face")
+
+    def wedge_contains(self, incoming, point, sign):
+        # True if point lies strictly inside the face angle at incoming.target.
+        v = incoming.target
+        p = incoming.origin
+        q = incoming.next.target
+        a = (q.x - v.x, q.y - v.y)
+        b = (p.x - v.x, p.y - v.y)
+        d = (point.x - v.x, point.y - v.y)
+        profiling.count(profiling.ORIENTATION_TESTS, 3)
+        if sign < 0:
+            a, b = b, a
+        cross_ab = a[0] * b[1] - a[1] * b[0]
+        cross_ad = a[0] * d[1] - a[1] * d[0]
+        cross_db = d[0] * b[1] - d[1] * b[0]
+        if cross_ab > 0:
+            return cross_ad > 0 and cross_db > 0
+        return cross_ad > 0 or cross_db > 0
+
+    def edges_area(self, edges):
+        area = 0.0
+        for edge in edges:
+            area += edge.origin.x * edge.target.y - edge.target.x * edge.origin.y
+        return area / 2.0
+
+    def edges_contain(self, edges, half_edge):
+        # Ray test of the midpoint of half_edge against the closed chain of
+        # edges. The midpoint, unlike an endpoint, never lies on the chain
+        # when half_edge is not one of its edges.
+        x = (half_edge.origin.x + half_edge.target.x) / 2.0
+        y = (half_edge.origin.y + half_edge.target.y) / 2.0
+        inside = False
+        for edge in edges:
+            a, b = edge.origin, edge.target
+            if (a.y > y) != (b.y > y):
+                if a.x + (y - a.y) * (b.x - a.x) / (b.y - a.y) > x:
+                    inside = not inside
+        return inside
+
+    def is_diagonal(self, half_edge):
+        return (
+            half_edge.incident_face is not None
+            and half_edge.twin is not None
+            and half_edge.twin.incident_face is not None
+        )
+
+    def splice_out_edge(self, half_edge):
+        # Unlinks a diagonal and its twin from the boundary cycles without
+        # touching face records; call rebuild_faces() once afterwards.
+        twin = half_edge.twin
+        self._set(twin.prev, "next", half_edge.next)
+        self._set(half_edge.next, "prev", twin.prev)
+        self._set(half_edge.prev, "next", twin.next)
+        self._set(twin.next, "prev", half_edge.prev)
+
+    def discard_edges(self, half_edges):
+        removed = set()
+        for half_edge in half_edges:
+            removed.add(half_edge)
+            removed.add(half_edge.twin)
+        self._set(self, "half_edges", [he for he in self.half_edges if he not in removed])
         for v in self.vertices:
-            for temp in v.incident_edges_and_faces:
-                if temp[0] == common_face:
-                    v.incident_edges_and_faces.remove(temp)
+            self._set(
+                v,
+                "incident_half_edges",
+                [he for he in v.incident_half_edges if he not in removed],
+            )
+        for he in removed:
+            line = (he.origin, he.target)
+            if self.journal is not None and line in self.existing_lines:
+                self.journal.entries.append((_ADD, self.existing_lines, line))
+            self.existing_lines.discard(line)
+
+    def rebuild_faces(self):
+        # Recreates every bounded face from the half-edge cycles in one pass.
+        self._set(self, "faces", [])
+        for v in self.vertices:
+            self._set(v, "incident_edges_and_faces", [])
+        visited = set()
+        for half_edge in self.half_edges:
+            if half_edge.incident_face is None or half_edge in visited:
+                continue
+            profiling.count(profiling.FACES_WALKED)
+            face = Face()
+            face.outer_half_edge = half_edge
+            edge = half_edge
+            while True:
+                visited.add(edge)
+                self._set(edge, "incident_face", face)
+                edge.target.incident_edges_and_faces.append((face, edge))
+                edge = edge.next
+                if edge == half_edge:
                     break
+            self.faces.append(face)
 
-        self.faces.append(new_face1)
-        self.faces.append(new_face2)
+    def copy(self):
+        clone = DCEL()
+        vertex_map = {}
+        for v in self.vertices:
+            vertex_map[v] = clone.add_vertex(v.x, v.y)
+        edge_map = {he: HalfEdge() for he in self.half_edges}
+        face_map = {}
+        for face in self.faces:
+            face_map[face] = Face()
+            face_map[face].outer_half_edge = edge_map[face.outer_half_edge]
+            face_map[face].inner_half_edges = [
+                edge_map[he] for he in face.inner_half_edges
+            ]
+
+        for he, new in edge_map.items():
+            new.origin = vertex_map[he.origin]
+            new.target = vertex_map[he.target]
+            new.twin = edge_map.get(he.twin)
+            new.next = edge_map.get(he.next)
+            new.prev = edge_map.get(he.prev)
+            new.incident_face = face_map.get(he.incident_face)
+
+        for v, new in vertex_map.items():
+            new.incident_half_edges = [edge_map[he] for he in v.incident_half_edges]
+            new.incident_edges_and_faces = [
+                (face_map.get(face), edge_map[he])
+                for face, he in v.incident_edges_and_faces
+                if face in face_map
+            ]
+        clone.half_edges = list(edge_map.values())
+        clone.faces = list(face_map.values())
+        clone.existing_lines = {
+            (vertex_map[a], vertex_map[b]) for a, b in self.existing_lines
+        }
+        clone.rings = [[vertex_map[v] for v in ring] for ring in self.rings]
+        return clone
+
+    def orientation(self):
+        # +1 when the outer ring (and so every bounded face) runs CCW, else -1.
+        # Computed once: diagonals and edits never flip the outer ring.
+        if self._orientation is None:
+            self._orientation = self.ring_orientation()
+        return self._orientation
+
+    def ring_orientation(self):
+        ring = self.rings[0] if self.rings else self.vertices
+        area = 0.0
+        n = len(ring)
+        for i in range(n):
+            v1 = ring[i]
+            v2 = ring[(i + 1) % n]
+            area += v1.x * v2.y - v2.x * v1.y
+        return 1 if area >= 0 else -1
 
     def construct_polygon(self, points):
         dcel_vertices = []
@@ -171,8 +532,57 @@ class DCEL:
         first_edge1.prev = prev_edge1
         first_edge2.prev = prev_edge2
 
+        self.rings = [dcel_vertices]
+        self._orientation = None
         self.add_face(first_edge1)
 
+    def construct_polygon_with_holes(self, outer, holes=()):
+        # Rings are stored with the polygon interior on their left: the outer
+        # ring counter-clockwise and every hole clockwise. Vertices keep the
+        # input order (outer first, then each hole) in self.vertices.
+        face = Face()
+        self.rings = []
+        self._orientation = None
+        for k, points in enumerate([outer] + list(holes)):
+            ring = [self.add_vertex(x, y) for x, y in points]
+            area = 0.0
+            for i in range(len(points)):
+                x1, y1 = points[i]
+                x2, y2 = points[(i + 1) % len(points)]
+                area += x1 * y2 - x2 * y1
+            if (area > 0) != (k == 0):
+                ring.reverse()
+            self.rings.append(ring)
+
+            half_edge = self.add_ring(ring)
+            if k == 0:
+                face.outer_half_edge = half_edge
+            else:
+                face.inner_half_edges.append(half_edge)
+
+        for he in [face.outer_half_edge] + face.inner_half_edges:
+            for edge in self.cycle(he):
+                edge.incident_face = face
+                edge.target.incident_edges_and_faces.append((face, edge))
+        self.faces.append(face)
+
+    def add_ring(self, ring):
+        # Creates the edges of a closed ring and links both sides; returns the
+        # half-edge from ring[0] to ring[1] (the side facing the interior).
+        inner = []
+        outer = []
+        for i in range(len(ring)):
+            half_edge1, half_edge2 = self.add_edge(ring[i], ring[(i + 1) % len(ring)])
+            inner.append(half_edge1)
+            outer.append(half_edge2)
+        m = len(ring)
+        for i in range(m):
+            inner[i].next = inner[(i + 1) % m]
+            inner[(i + 1) % m].prev = inner[i]
+            outer[i].next = outer[i - 1]
+            outer[i - 1].prev = outer[i]
+        return inner[0]
+
     def angle_between(self, v1, v2, v3):
         vec_a = (v1.x - v2.x, v1.y - v2.y)
         vec_b = (v3.x - v2.x, v3.y - v2.y)
@@ -192,20 +602,23 @@ class DCEL:
         min_cusp_vertices = []
         max_cusp_vertices = []
 
-        for i, vertex in enumerate(self.vertices):
-            prev_vertex = self.vertices[i - 1]
-            next_vertex = self.vertices[(i + 1) % len(self.vertices)]
-
-            angle = self.angle_between(prev_vertex, vertex, next_vertex)
-
-            if prev_vertex.y < vertex.y and next_vertex.y < vertex.y and angle > 180:
-                start_vertices.append(vertex)
-            elif prev_vertex.y > vertex.y and next_vertex.y > vertex.y and angle > 180:
-                end_vertices.append(vertex)
-            elif prev_vertex.y < vertex.y and next_vertex.y < vertex.y and angle < 180:
-                max_cusp_vertices.append(vertex)
-            elif prev_vertex.y > vertex.y and next_vertex.y > vertex.y and angle < 180:
-                min_cusp_vertices.append(vertex)
+        for ring in self.rings or [self.vertices]:
+            for i, vertex in enumerate(ring):
+                prev_vertex = ring[i - 1]
+                next_vertex = ring[(i + 1) % len(ring)]
+
+                angle = self.angle_between(prev_vertex, vertex, next_vertex)
+
+                if prev_vertex.y < vertex.y and next_vertex.y < vertex.y:
+                    if angle > 180:
+                        start_vertices.append(vertex)
+                    elif angle < 180:
+                        max_cusp_vertices.append(vertex)
+                elif prev_vertex.y > vertex.y and next_vertex.y > vertex.y:
+                    if angle > 180:
+                        end_vertices.append(vertex)
+                    elif angle < 180:
+                        min_cusp_vertices.append(vertex)
 
         return {
             "start_vertices": start_vertices,
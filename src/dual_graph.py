@@ -4,7 +4,8 @@
 # Date: 25 Sept, 2025
 # dual_graph.py - Builds dual graph by connecting triangle centroids.
 
-import time
+from animation import pause
+import profiling
 
 
 class DualGraphApp:
@@ -30,6 +31,7 @@ class DualGraphApp:
 
         for face in self.dcel.faces:
             if face.outer_half_edge:
+                profiling.count(profiling.FACES_WALKED)
                 vertices = []
                 half_edge = face.outer_half_edge
                 start_edge = half_edge
@@ -40,8 +42,8 @@ class DualGraphApp:
                     if half_edge == start_edge:
                         break
 
-                centroid_x = sum(v[0] for v in vertices) / 3.0
-                centroid_y = sum(v[1] for v in vertices) / 3.0
+                centroid_x = sum(v[0] for v in vertices) / len(vertices)
+                centroid_y = sum(v[1] for v in vertices) / len(vertices)
                 centroids[face] = (centroid_x, centroid_y)
 
                 transformed_centroid_x, transformed_centroid_y = (
@@ -51,6 +53,7 @@ class DualGraphApp:
 
         for face in self.dcel.faces:
             if face.outer_half_edge:
+                profiling.count(profiling.FACES_WALKED)
                 half_edge = face.outer_half_edge
                 start_edge = half_edge
                 while True:
@@ -83,10 +86,8 @@ class DualGraphApp:
         self.canvas.create_oval(
             x - radius, y - radius, x + radius, y + radius, fill=color
         )
-        self.canvas.update()
-        time.sleep(0.4)
+        pause(self.canvas)
 
     def draw_line(self, point1, point2, color="black"):
         self.canvas.create_line(point1[0], point1[1], point2[0], point2[1], fill=color)
-        self.canvas.update()
-        time.sleep(0.4)
+        pause(self.canvas)
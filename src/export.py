@@ -0,0 +1,276 @@
+# Streaming exporters for solve results.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# export.py - Writes triangles, convex pieces, guard points and guard coverage as GeoJSON,
+# WKT or a compact little-endian binary format, in buffered chunks.
+
+import os
+import struct
+from typing import Iterable, Optional, Sequence, Tuple
+
+EXPORT_CHUNK = 8192  # features (or binary items) per write
+
+# Binary layout: MAGIC, then records of <kind: u8, count: u32> followed by
+# ``count`` items. Coordinates are f64 pairs, indices u32, coverage i32.
+MAGIC = b"AGX1"
+VERTICES, TRIANGLES, PIECE, GUARD_POINTS, COVERAGE = 1, 2, 3, 4, 5
+_HEADER = struct.Struct("<BI")
+_ITEM_FORMATS = {VERTICES: "d", TRIANGLES: "I", PIECE: "I", GUARD_POINTS: "d", COVERAGE: "i"}
+_ITEM_WIDTHS = {VERTICES: 2, TRIANGLES: 3, PIECE: 1, GUARD_POINTS: 2, COVERAGE: 1}
+
+FORMATS = {".geojson": "geojson", ".json": "geojson", ".wkt": "wkt", ".bin": "binary"}
+
+
+def _ccw_triangle(triangle, vertices):
+    a, b, c = triangle
+    (ax, ay), (bx, by), (cx, cy) = vertices[a], vertices[b], vertices[c]
+    if (bx - ax) * (cy - ay) - (by - ay) * (cx - ax) < 0:
+        return a, c, b
+    return a, b, c
+
+
+def _ccw(ring, vertices):
+    # GeoJSON wants counter-clockwise exterior rings
+    area = 0.0
+    for a, b in zip(ring, ring[1:] + ring[:1]):
+        area += vertices[a][0] * vertices[b][1] - vertices[b][0] * vertices[a][1]
+    return ring if area >= 0 else ring[::-1]
+
+
+class _ChunkedWriter:
+    """Collects pieces of text and writes them ``chunk_size`` at a time,
+    with ``separator`` between consecutive pieces."""
+
+    def __init__(self, out, chunk_size, separator=""):
+        self.out = out
+        self.chunk_size = chunk_size
+        self.separator = separator
+        self.parts = []
+        self.count = 0
+
+    def add(self, part):
+        self.parts.append(part)
+        if len(self.parts) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.parts:
+            lead = self.separator if self.count else ""
+            self.out.write(lead + self.separator.join(self.parts))
+            self.count += len(self.parts)
+            self.parts.clear()
+
+
+def _point_text(point, pair):
+    return pair % (float(point[0]), float(point[1]))
+
+
+def _ring_text(ring, texts):
+    # ``texts`` holds each vertex formatted once; rings are closed
+    return ", ".join([texts[v] for v in ring] + [texts[ring[0]]])
+
+
+def _coverage_groups(triangles, coverage, num_guards):
+    groups = [[] for _ in range(num_guards)]
+    for triangle, guard in zip(triangles, coverage):
+        if guard >= 0:
+            groups[guard].append(triangle)
+    return groups
+
+
+def write_geojson(
+    out,
+    vertices: Sequence[Tuple[float, float]],
+    triangles: Iterable[Sequence[int]] = (),
+    convex_pieces: Iterable[Sequence[int]] = (),
+    guard_points: Sequence[Tuple[float, float]] = (),
+    coverage: Optional[Sequence[int]] = None,
+    chunk_size: int = EXPORT_CHUNK,
+) -> int:
+    """Write a GeoJSON FeatureCollection to the text file ``out``.
+
+    Triangles and convex pieces are Polygon features, guards Point features,
+    and with ``coverage`` (one guard index per triangle, see
+    ``SolveResult.coverage``) each guard gets a MultiPolygon of the triangles
+    it sees. ``triangles`` may be a generator unless ``coverage`` is given.
+    Returns the number of features written.
+    """
+    writer = _ChunkedWriter(out, chunk_size, ",\n")
+    out.write('{"type": "FeatureCollection", "features": [\n')
+    texts = [_point_text(point, "[%r, %r]") for point in vertices]
+    feature = (
+        '{"type": "Feature", "properties": {"kind": "%s", "index": %d}, '
+        '"geometry": {"type": "%s", "coordinates": %s}}'
+    )
+    triangle_feature = (
+        '{"type": "Feature", "properties": {"kind": "triangle", "index": %d}, '
+        '"geometry": {"type": "Polygon", "coordinates": [[%s, %s, %s, %s]]}}'
+    )
+
+    if coverage is not None:
+        triangles = list(triangles)
+    for index, triangle in enumerate(triangles):
+        a, b, c = _ccw_triangle(triangle, vertices)
+        writer.add(triangle_feature % (index, texts[a], texts[b], texts[c], texts[a]))
+    for index, piece in enumerate(convex_pieces):
+        ring = _ring_text(_ccw(list(piece), vertices), texts)
+        writer.add(feature % ("convex_piece", index, "Polygon", "[[%s]]" % ring))
+    for index, point in enumerate(guard_points):
+        writer.add(feature % ("guard", index, "Point", _point_text(point, "[%r, %r]")))
+    if coverage is not None:
+        for index, group in enumerate(_coverage_groups(triangles, coverage, len(guard_points))):
+            polygons = ", ".join(
+                "[[%s]]" % _ring_text(_ccw_triangle(t, vertices), texts) for t in group
+            )
+            writer.add(feature % ("coverage", index, "MultiPolygon", "[%s]" % polygons))
+    writer.flush()
+    out.write("\n]}\n")
+    return writer.count
+
+
+def write_wkt(
+    out,
+    vertices: Sequence[Tuple[float, float]],
+    triangles: Iterable[Sequence[int]] = (),
+    convex_pieces: Iterable[Sequence[int]] = (),
+    guard_points: Sequence[Tuple[float, float]] = (),
+    coverage: Optional[Sequence[int]] = None,
+    chunk_size: int = EXPORT_CHUNK,
+) -> int:
+    """Write one WKT geometry per line to the text file ``out``.
+
+    Lines come in the order triangles (POLYGON), convex pieces (POLYGON),
+    guards (POINT), then with ``coverage`` one MULTIPOLYGON per guard.
+    Returns the number of lines written.
+    """
+    writer = _ChunkedWriter(out, chunk_size)
+    texts = [_point_text(point, "%r %r") for point in vertices]
+    if coverage is not None:
+        triangles = list(triangles)
+    for a, b, c in triangles:
+        writer.add("POLYGON ((%s, %s, %s, %s))\n" % (texts[a], texts[b], texts[c], texts[a]))
+    for ring in convex_pieces:
+        writer.add("POLYGON ((%s))\n" % _ring_text(ring, texts))
+    for point in guard_points:
+        writer.add("POINT (%s)\n" % _point_text(point, "%r %r"))
+    if coverage is not None:
+        for group in _coverage_groups(triangles, coverage, len(guard_points)):
+            if not group:
+                writer.add("MULTIPOLYGON EMPTY\n")
+                continue
+            polygons = ", ".join("((%s))" % _ring_text(t, texts) for t in group)
+            writer.add("MULTIPOLYGON (%s)\n" % polygons)
+    writer.flush()
+    return writer.count
+
+
+def _write_records(out, kind, items, chunk_size):
+    # One record per chunk keeps the writer streaming: counts are never
+    # needed before the items are produced.
+    item_format = "<%d" + _ITEM_FORMATS[kind]
+    width = _ITEM_WIDTHS[kind]
+    chunk = []
+    count = 0
+    for item in items:
+        if width == 1:
+            chunk.append(item)
+        else:
+            chunk.extend(item)
+        if len(chunk) >= chunk_size * width:
+            out.write(_HEADER.pack(kind, len(chunk) // width))
+            out.write(struct.pack(item_format % len(chunk), *chunk))
+            count += len(chunk) // width
+            chunk.clear()
+    if chunk:
+        out.write(_HEADER.pack(kind, len(chunk) // width))
+        out.write(struct.pack(item_format % len(chunk), *chunk))
+        count += len(chunk) // width
+    return count
+
+
+def write_binary(
+    out,
+    vertices: Sequence[Tuple[float, float]],
+    triangles: Iterable[Sequence[int]] = (),
+    convex_pieces: Iterable[Sequence[int]] = (),
+    guard_points: Sequence[Tuple[float, float]] = (),
+    coverage: Optional[Sequence[int]] = None,
+    chunk_size: int = EXPORT_CHUNK,
+) -> int:
+    """Write the compact little-endian binary format to the binary file ``out``.
+
+    Triangles are written in records of up to ``chunk_size`` triangles, so a
+    generator streams straight through; each convex piece is one record.
+    ``coverage`` is stored as one i32 guard index per triangle. Returns the
+    number of triangles written.
+    """
+    out.write(MAGIC)
+    _write_records(out, VERTICES, vertices, chunk_size)
+    count = _write_records(out, TRIANGLES, triangles, chunk_size)
+    for piece in convex_pieces:
+        out.write(_HEADER.pack(PIECE, len(piece)))
+        out.write(struct.pack("<%dI" % len(piece), *piece))
+    _write_records(out, GUARD_POINTS, guard_points, chunk_size)
+    if coverage is not None:
+        _write_records(out, COVERAGE, coverage, chunk_size)
+    return count
+
+
+def read_binary(stream) -> dict:
+    """Read a file written by ``write_binary`` back into plain lists."""
+    if stream.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not an art gallery binary export")
+    data = {"vertices": [], "triangles": [], "convex_pieces": [], "guard_points": [], "coverage": []}
+    keys = {VERTICES: "vertices", TRIANGLES: "triangles", GUARD_POINTS: "guard_points", COVERAGE: "coverage"}
+    while True:
+        header = stream.read(_HEADER.size)
+        if not header:
+            return data
+        if len(header) < _HEADER.size:
+            raise ValueError("Truncated record header")
+        kind, count = _HEADER.unpack(header)
+        if kind not in _ITEM_FORMATS:
+            raise ValueError("Unknown record kind %d" % kind)
+        width = _ITEM_WIDTHS[kind]
+        item_format = "<%d%s" % (count * width, _ITEM_FORMATS[kind])
+        size = struct.calcsize(item_format)
+        payload = stream.read(size)
+        if len(payload) < size:
+            raise ValueError("Truncated record")
+        values = struct.unpack(item_format, payload)
+        if kind == PIECE:
+            data["convex_pieces"].append(list(values))
+        elif width == 1:
+            data[keys[kind]].extend(values)
+        else:
+            data[keys[kind]].extend(zip(*[iter(values)] * width))
+
+
+def export_result(result, path, fmt: Optional[str] = None, chunk_size: int = EXPORT_CHUNK) -> int:
+    """Write a ``headless.SolveResult`` to ``path`` with its coverage.
+
+    ``fmt`` is ``"geojson"``, ``"wkt"`` or ``"binary"``; by default it
+    follows the file extension (.geojson/.json, .wkt, .bin).
+    """
+    if fmt is None:
+        fmt = FORMATS.get(os.path.splitext(str(path))[1].lower())
+        if fmt is None:
+            raise ValueError("Cannot tell the export format of %s" % path)
+    if fmt not in WRITERS:
+        raise ValueError("Unknown export format: %s" % fmt)
+    mode = "wb" if fmt == "binary" else "w"
+    encoding = None if fmt == "binary" else "utf-8"
+    with open(path, mode, encoding=encoding) as out:
+        return WRITERS[fmt](
+            out,
+            result.vertices(),
+            result.triangles,
+            result.convex_pieces,
+            result.guard_points,
+            result.coverage(),
+            chunk_size,
+        )
+
+
+WRITERS = {"geojson": write_geojson, "wkt": write_wkt, "binary": write_binary}
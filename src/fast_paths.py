@@ -0,0 +1,235 @@
+# Shape detection that lets the pipeline skip work on easy polygons.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# fast_paths.py - y-monotonicity test, polygon kernel (half-plane intersection) and fan triangulation.
+
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import profiling
+
+EPS = 1e-9
+
+
+@dataclass
+class PolygonShape:
+    y_monotone: bool
+    kernel: List[Tuple[float, float]] = field(default_factory=list)
+    kernel_vertex: Optional[int] = None
+
+    @property
+    def star_shaped(self) -> bool:
+        return bool(self.kernel)
+
+    def kernel_point(self) -> Optional[Tuple[float, float]]:
+        if not self.kernel:
+            return None
+        k = len(self.kernel)
+        return (
+            sum(p[0] for p in self.kernel) / k,
+            sum(p[1] for p in self.kernel) / k,
+        )
+
+
+def signed_area(points) -> float:
+    area = 0.0
+    n = len(points)
+    for i in range(n):
+        x1, y1 = points[i]
+        x2, y2 = points[(i + 1) % n]
+        area += x1 * y2 - x2 * y1
+    return area / 2.0
+
+
+def is_y_monotone(points) -> bool:
+    """True when the boundary goes down exactly once and up exactly once.
+
+    Runs in O(n): the y direction of consecutive edges may change sign only
+    twice around the ring (once at the top vertex and once at the bottom one).
+    Equal y values are ordered as the sweeps order them (the smaller x is
+    higher), so a horizontal edge going left goes up.
+    """
+    if len({y for _, y in points}) < 2:
+        return False
+    directions = []
+    n = len(points)
+    for i in range(n):
+        (x1, y1), (x2, y2) = points[i], points[(i + 1) % n]
+        directions.append(y2 > y1 or (y2 == y1 and x2 < x1))
+    changes = sum(
+        1 for i in range(len(directions)) if directions[i] != directions[i - 1]
+    )
+    return changes <= 2
+
+
+def _cross(o, a, b):
+    profiling.count(profiling.ORIENTATION_TESTS)
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _line_intersection(l1, l2):
+    (p1, d1), (p2, d2) = l1, l2
+    denom = d1[0] * d2[1] - d1[1] * d2[0]
+    if abs(denom) < EPS:
+        return None
+    t = ((p2[0] - p1[0]) * d2[1] - (p2[1] - p1[1]) * d2[0]) / denom
+    return (p1[0] + t * d1[0], p1[1] + t * d1[1])
+
+
+def _outside(line, point):
+    (px, py), (dx, dy) = line
+    return dx * (point[1] - py) - dy * (point[0] - px) < -EPS
+
+
+def polygon_kernel(points) -> List[Tuple[float, float]]:
+    """Return the kernel of a simple polygon as a CCW convex polygon.
+
+    Intersects the inner half-planes of all edges with the sorted-angle deque
+    method in O(n log n). An empty list means the polygon is not star-shaped.
+    """
+    pts = [tuple(p) for p in points]
+    if signed_area(pts) < 0:
+        pts.reverse()
+    n = len(pts)
+    lines = []
+    for i in range(n):
+        p, q = pts[i], pts[(i + 1) % n]
+        d = (q[0] - p[0], q[1] - p[1])
+        if d != (0, 0):
+            lines.append((p, d))
+    lines.sort(key=lambda line: math.atan2(line[1][1], line[1][0]))
+
+    dq = deque()
+    for line in lines:
+        if dq:
+            last = dq[-1]
+            if abs(last[1][0] * line[1][1] - last[1][1] * line[1][0]) < EPS and (
+                last[1][0] * line[1][0] + last[1][1] * line[1][1] > 0
+            ):
+                # Same direction: keep the more restrictive half-plane only.
+                if _outside(last, line[0]):
+                    continue
+                dq.pop()
+        while len(dq) >= 2:
+            corner = _line_intersection(dq[-1], dq[-2])
+            if corner is None or _outside(line, corner):
+                dq.pop()
+            else:
+                break
+        while len(dq) >= 2:
+            corner = _line_intersection(dq[0], dq[1])
+            if corner is None or _outside(line, corner):
+                dq.popleft()
+            else:
+                break
+        dq.append(line)
+
+    while len(dq) >= 3:
+        corner = _line_intersection(dq[-1], dq[-2])
+        if corner is None or _outside(dq[0], corner):
+            dq.pop()
+        else:
+            break
+    while len(dq) >= 3:
+        corner = _line_intersection(dq[0], dq[1])
+        if corner is None or _outside(dq[-1], corner):
+            dq.popleft()
+        else:
+            break
+    if len(dq) < 3:
+        return []
+
+    kernel = []
+    for i in range(len(dq)):
+        corner = _line_intersection(dq[i], dq[(i + 1) % len(dq)])
+        if corner is None:
+            return []
+        kernel.append(corner)
+    kernel = _drop_degenerate_corners(kernel)
+    if len(kernel) < 3 or signed_area(kernel) <= EPS:
+        return []
+    return kernel
+
+
+def _near(p, q) -> bool:
+    tolerance = EPS * max(1.0, abs(p[0]), abs(p[1]))
+    return abs(p[0] - q[0]) <= tolerance and abs(p[1] - q[1]) <= tolerance
+
+
+def _drop_degenerate_corners(ring):
+    # Parallel or nearly parallel half-planes leave repeated corners (the
+    # closing one included) and straight corners, which point_in_convex's
+    # binary search does not tolerate.
+    corners = []
+    for point in ring:
+        if not corners or not _near(corners[-1], point):
+            corners.append(point)
+    while len(corners) > 1 and _near(corners[0], corners[-1]):
+        corners.pop()
+    k = len(corners)
+    kept = []
+    for i in range(k):
+        previous = kept[-1] if kept else corners[i - 1]
+        if abs(_cross(previous, corners[i], corners[(i + 1) % k])) > EPS:
+            kept.append(corners[i])
+    return kept
+
+
+def point_in_convex(polygon, point) -> bool:
+    """Closed point-in-convex-polygon test in O(log k) for a CCW polygon."""
+    k = len(polygon)
+    if k < 3:
+        return False
+    origin = polygon[0]
+    if _cross(origin, polygon[1], point) < -EPS:
+        return False
+    if _cross(origin, polygon[-1], point) > EPS:
+        return False
+    lo, hi = 1, k - 1
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if _cross(origin, polygon[mid], point) >= 0:
+            lo = mid
+        else:
+            hi = mid
+    return _cross(polygon[lo], polygon[lo + 1], point) >= -EPS
+
+
+def _fans_cleanly(points, apex, sign) -> bool:
+    # Every fan triangle must have positive area: a kernel vertex on the
+    # line of a non-incident edge (a kernel corner, say) would give a flat one.
+    n = len(points)
+    origin = points[apex]
+    for j in range(1, n - 1):
+        a, b = points[(apex + j) % n], points[(apex + j + 1) % n]
+        scale = max(
+            abs(a[0] - origin[0]), abs(a[1] - origin[1]), abs(b[0] - origin[0]), abs(b[1] - origin[1])
+        )
+        if sign * _cross(origin, a, b) <= EPS * scale * scale:
+            return False
+    return True
+
+
+def analyse_polygon(points) -> PolygonShape:
+    kernel = polygon_kernel(points)
+    kernel_vertex = None
+    if kernel:
+        sign = 1 if signed_area(points) > 0 else -1
+        for index, point in enumerate(points):
+            if point_in_convex(kernel, point) and _fans_cleanly(points, index, sign):
+                kernel_vertex = index
+                break
+    return PolygonShape(
+        y_monotone=is_y_monotone(points), kernel=kernel, kernel_vertex=kernel_vertex
+    )
+
+
+def fan_triangles(num_vertices: int, apex: int) -> List[Tuple[int, int, int]]:
+    """Triangles of the fan from ``apex``; valid when ``apex`` lies in the kernel."""
+    return [
+        (apex, (apex + j) % num_vertices, (apex + j + 1) % num_vertices)
+        for j in range(1, num_vertices - 1)
+    ]
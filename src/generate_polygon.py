@@ -6,26 +6,31 @@
 
 
 import random
-import time
 import math
-import tkinter as tk
-from tkinter import simpledialog
 
+from animation import pause
 from dcel import DCEL
+from lod import POLYGON_TAG, LodConfig, Viewport, draw_polygon
 
 
 class GeneratePolygonApp:
     def __init__(self, canvas):
         self.canvas = canvas
         self.points = []
+        self.holes = []
         self.num_vertices = 0
         self.canvas_width = 500
         self.canvas_height = 500
         self.padding = 50
         self.axis_length = self.canvas_width - 2 * self.padding
         self.dcel = DCEL()
+        self.lod = LodConfig()
+        self.viewport = Viewport()
 
     def generate_polygon(self):
+        # Desktop only; the core must stay importable without tkinter.
+        from tkinter import simpledialog
+
         self.num_vertices = simpledialog.askinteger(
             "Input", "Enter number of vertices (n):", minvalue=3, maxvalue=100
         )
@@ -52,6 +57,16 @@ class GeneratePolygonApp:
             self.dcel.construct_polygon(self.points)
             self.draw_polygon_with_delay()
 
+    def load_polygon(self, points, holes=()):
+        if points and len(points) >= 3:
+            self.num_vertices = len(points) + sum(len(hole) for hole in holes)
+            self.canvas.delete("all")
+            self.draw_axes()
+            self.points = [(x, y) for x, y in points]
+            self.holes = [[(x, y) for x, y in hole] for hole in holes]
+            self.dcel.construct_polygon_with_holes(self.points, self.holes)
+            self.draw_polygon_without_delay()
+
     def draw_axes(self):
         origin_x = self.padding
         origin_y = self.canvas_height - self.padding
@@ -62,7 +77,7 @@ class GeneratePolygonApp:
             origin_x + self.axis_length,
             origin_y,
             fill="black",
-            arrow=tk.LAST,
+            arrow="last",
         )
         self.canvas.create_line(
             origin_x,
@@ -70,7 +85,7 @@ class GeneratePolygonApp:
             origin_x,
             origin_y - self.axis_length,
             fill="black",
-            arrow=tk.LAST,
+            arrow="last",
         )
 
         self.canvas.create_text(
@@ -137,70 +152,58 @@ class GeneratePolygonApp:
         return sorted(points, key=angle_from_centroid)
 
     def draw_polygon_with_delay(self):
+        rings = [self.points] + self.holes
+        if sum(len(ring) for ring in rings) > self.lod.max_animated:
+            # Too many vertices to animate one by one
+            self.draw_polygon_without_delay()
+            pause(self.canvas)
+            return
+
         origin_x = self.padding
         origin_y = self.canvas_height - self.padding
 
-        for i in range(len(self.points)):
-            x, y = self.points[i]
-            adjusted_x = origin_x + x
-            adjusted_y = origin_y - y
-
-            self.canvas.create_oval(
-                adjusted_x - 3,
-                adjusted_y - 3,
-                adjusted_x + 3,
-                adjusted_y + 3,
-                fill="black",
-            )
-            self.canvas.create_text(
-                adjusted_x + 10,
-                adjusted_y - 10,
-                text=f"({x}, {y})",
-                fill="black",
-                font=("Arial", 5),
-            )
-
-            self.canvas.update()
-            time.sleep(0.4)
-
-            next_point = self.points[(i + 1) % len(self.points)]
-            adjusted_next_x = origin_x + next_point[0]
-            adjusted_next_y = origin_y - next_point[1]
-            self.canvas.create_line(
-                adjusted_x, adjusted_y, adjusted_next_x, adjusted_next_y, fill="black"
-            )
-
-            self.canvas.update()
+        for ring in rings:
+            for i in range(len(ring)):
+                x, y = ring[i]
+                adjusted_x = origin_x + x
+                adjusted_y = origin_y - y
+
+                self.canvas.create_oval(
+                    adjusted_x - 3,
+                    adjusted_y - 3,
+                    adjusted_x + 3,
+                    adjusted_y + 3,
+                    fill="black",
+                    tags=POLYGON_TAG,
+                )
+                self.canvas.create_text(
+                    adjusted_x + 10,
+                    adjusted_y - 10,
+                    text=f"({x}, {y})",
+                    fill="black",
+                    font=("Arial", 5),
+                    tags=POLYGON_TAG,
+                )
+
+                pause(self.canvas)
+
+                next_point = ring[(i + 1) % len(ring)]
+                adjusted_next_x = origin_x + next_point[0]
+                adjusted_next_y = origin_y - next_point[1]
+                self.canvas.create_line(
+                    adjusted_x,
+                    adjusted_y,
+                    adjusted_next_x,
+                    adjusted_next_y,
+                    fill="black",
+                    tags=POLYGON_TAG,
+                )
+
+                self.canvas.update()
 
     def draw_polygon_without_delay(self):
-        origin_x = self.padding
-        origin_y = self.canvas_height - self.padding
-
-        for i in range(len(self.points)):
-            x, y = self.points[i]
-            adjusted_x = origin_x + x
-            adjusted_y = origin_y - y
-
-            self.canvas.create_oval(
-                adjusted_x - 3,
-                adjusted_y - 3,
-                adjusted_x + 3,
-                adjusted_y + 3,
-                fill="black",
-            )
-            self.canvas.create_text(
-                adjusted_x + 10,
-                adjusted_y - 10,
-                text=f"({x}, {y})",
-                fill="black",
-                font=("Arial", 5),
-            )
-            self.canvas.update()
-
-            next_point = self.points[(i + 1) % len(self.points)]
-            adjusted_next_x = origin_x + next_point[0]
-            adjusted_next_y = origin_y - next_point[1]
-            self.canvas.create_line(
-                adjusted_x, adjusted_y, adjusted_next_x, adjusted_next_y, fill="black"
-            )
-            self.canvas.update()
+        # One polyline per ring; markers and labels depend on the vertex count
+        draw_polygon(
+            self.canvas, [self.points] + self.holes, self.viewport, self.lod
+        )
+        self.canvas.update()
@@ -0,0 +1,122 @@
+# Multi-trial guard minimization over randomized pipeline variants.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# guard_minimization.py - Solves K variants in a process pool and keeps the smallest guard set.
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+import headless as headless_module
+
+
+@dataclass(frozen=True)
+class TrialVariant:
+    index: int
+    rotation: float = 0.0
+    shift: int = 0
+    start_face_index: int = 0
+
+
+@dataclass
+class MinimizationResult:
+    best: Optional[headless_module.SolveResult]
+    best_variant: Optional[TrialVariant]
+    trials_completed: int
+    trials_failed: int
+    timed_out: bool
+
+
+def make_variants(num_vertices: int, trials: int, seed: int) -> List[TrialVariant]:
+    """Build ``trials`` variants deterministically from ``seed``.
+
+    Trial 0 is always the unmodified pipeline, so the result is never worse
+    than a single run.
+    """
+    rng = random.Random(seed)
+    variants = [TrialVariant(0)]
+    for index in range(1, trials):
+        variants.append(
+            TrialVariant(
+                index=index,
+                rotation=rng.uniform(0.0, 2.0 * math.pi),
+                shift=rng.randrange(num_vertices),
+                start_face_index=rng.randrange(max(num_vertices - 2, 1)),
+            )
+        )
+    return variants
+
+
+def run_trial(points, variant: TrialVariant, holes=()):
+    # Only a variant the pipeline rejects counts as a failed trial; any
+    # other exception is a bug and reaches the caller.
+    try:
+        result = headless_module.solve_polygon(
+            points, variant.rotation, variant.shift, variant.start_face_index, holes=holes
+        )
+    except ValueError:
+        result = None
+    return variant, result
+
+
+def minimize_guards(
+    points,
+    trials: int = 8,
+    seed: int = 0,
+    time_budget: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    holes=(),
+) -> MinimizationResult:
+    """Solve ``trials`` randomized variants and keep the smallest guard set.
+
+    Variants run in a process pool (``max_workers=1`` runs them in-process).
+    When ``time_budget`` seconds elapse, unfinished trials are dropped and the
+    best finished one wins. Ties go to the lowest trial index, so the result
+    only depends on ``seed`` as long as the budget is not hit.
+
+    ``holes`` are passed to every trial; guard indices number their vertices
+    after the outer ring, as in ``headless.solve_polygon``.
+    """
+    variants = make_variants(len(points), max(trials, 1), seed)
+    outcomes = []
+    timed_out = False
+
+    if max_workers == 1:
+        deadline = None if time_budget is None else time.monotonic() + time_budget
+        for variant in variants:
+            if deadline is not None and time.monotonic() >= deadline:
+                timed_out = True
+                break
+            outcomes.append(run_trial(points, variant, holes))
+    else:
+        # Imported here: the process machinery is slow to import and only
+        # needed once a pool is actually used.
+        from concurrent.futures import ProcessPoolExecutor, wait
+
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [executor.submit(run_trial, points, v, holes) for v in variants]
+            done, not_done = wait(futures, timeout=time_budget)
+            timed_out = bool(not_done)
+            outcomes = [future.result() for future in done]
+        finally:
+            executor.shutdown(wait=not timed_out, cancel_futures=True)
+
+    solved = [(variant, result) for variant, result in outcomes if result is not None]
+    best_variant, best = None, None
+    if solved:
+        best_variant, best = min(
+            solved, key=lambda item: (len(item[1].guards), item[0].index)
+        )
+    return MinimizationResult(
+        best=best,
+        best_variant=best_variant,
+        trials_completed=len(outcomes),
+        trials_failed=len(outcomes) - len(solved),
+        timed_out=timed_out,
+    )
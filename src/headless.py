@@ -0,0 +1,428 @@
+# Headless execution of the full pipeline (no window, no animation).
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# headless.py - Runs every step on a no-op canvas and returns plain index-based results.
+
+import bisect
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+import fast_paths as fast_paths_module
+import monotone_partitioning as monotone_partitioning_module
+import pipeline as pipeline_module
+import three_coloring as three_coloring_module
+import triangulation as triangulation_module
+
+# Triangles buffered per write by stream_triangles
+STREAM_CHUNK = 4096
+
+
+class HeadlessCanvas:
+    """No-op canvas exposing the subset of the Tk canvas API used by the steps.
+
+    Setting ``animate = False`` makes ``animation.pause`` skip its frame delay.
+    """
+
+    animate = False
+
+    def __init__(self):
+        self._next_id = 1
+
+    def _new_id(self):
+        obj_id = self._next_id
+        self._next_id += 1
+        return obj_id
+
+    def create_line(self, *args, **kwargs):
+        return self._new_id()
+
+    def create_oval(self, *args, **kwargs):
+        return self._new_id()
+
+    def create_text(self, *args, **kwargs):
+        return self._new_id()
+
+    def delete(self, tag):
+        pass
+
+    def update(self):
+        pass
+
+
+@dataclass
+class SolveResult:
+    """Outcome of a headless solve, expressed with indices into ``points``.
+
+    ``guards`` is always a valid vertex guard set. ``guard_points`` is where to
+    place the guards: the guard vertices, or a single kernel point when the
+    polygon is star-shaped but no vertex lies in its kernel.
+    """
+
+    points: List[Tuple[float, float]]
+    triangles: List[Tuple[int, int, int]] = field(default_factory=list)
+    colors: Dict[int, str] = field(default_factory=dict)
+    guards: List[int] = field(default_factory=list)
+    guard_points: List[Tuple[float, float]] = field(default_factory=list)
+    convex_pieces: List[List[int]] = field(default_factory=list)
+    holes: List[List[Tuple[float, float]]] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "points": [list(p) for p in self.points],
+            "holes": [[list(p) for p in hole] for hole in self.holes],
+            "triangles": [list(t) for t in self.triangles],
+            "colors": {str(i): color for i, color in self.colors.items()},
+            "guards": list(self.guards),
+            "guard_points": [list(p) for p in self.guard_points],
+            "convex_pieces": [list(piece) for piece in self.convex_pieces],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SolveResult":
+        return cls(
+            points=[tuple(p) for p in data["points"]],
+            holes=[[tuple(p) for p in hole] for hole in data.get("holes", [])],
+            triangles=[tuple(t) for t in data.get("triangles", [])],
+            colors={int(i): color for i, color in data.get("colors", {}).items()},
+            guards=list(data.get("guards", [])),
+            guard_points=[tuple(p) for p in data.get("guard_points", [])],
+            convex_pieces=[list(piece) for piece in data.get("convex_pieces", [])],
+        )
+
+    def vertex(self, index) -> Tuple[float, float]:
+        """Coordinates of a vertex index (hole vertices follow the outer ring)."""
+        if index < len(self.points):
+            return self.points[index]
+        index -= len(self.points)
+        for hole in self.holes:
+            if index < len(hole):
+                return hole[index]
+            index -= len(hole)
+        raise IndexError(index)
+
+    def vertices(self) -> List[Tuple[float, float]]:
+        """Coordinates of every vertex index, outer ring first."""
+        return list(self.points) + [p for hole in self.holes for p in hole]
+
+    def coverage(self) -> List[int]:
+        """For each triangle, the index in ``guard_points`` of a guard that sees it.
+
+        -1 marks a triangle no guard covers (never the case for a solved result).
+        """
+        if len(self.guard_points) == 1:
+            # A kernel point or the fan apex sees the whole polygon
+            return [0] * len(self.triangles)
+        slot = {guard: k for k, guard in enumerate(self.guards)}
+        return [
+            next((slot[v] for v in triangle if v in slot), -1)
+            for triangle in self.triangles
+        ]
+
+
+def transform_points(points, rotation=0.0, shift=0, center=None):
+    """Rotate ``points`` about ``center`` (default: their centroid) and
+    cyclically shift their order.
+
+    Returns the transformed points and, for each of them, its index in the
+    original list.
+    """
+    n = len(points)
+    order = [(k + shift) % n for k in range(n)]
+    if not rotation:
+        return [tuple(points[i]) for i in order], order
+
+    if center is None:
+        center = (sum(p[0] for p in points) / n, sum(p[1] for p in points) / n)
+    cx, cy = center
+    cos_a = math.cos(rotation)
+    sin_a = math.sin(rotation)
+    transformed = []
+    for i in order:
+        dx = points[i][0] - cx
+        dy = points[i][1] - cy
+        transformed.append((cx + dx * cos_a - dy * sin_a, cy + dx * sin_a + dy * cos_a))
+    return transformed, order
+
+
+def face_vertices(face):
+    vertices = []
+    half_edge = face.outer_half_edge
+    while True:
+        vertices.append(half_edge.origin)
+        half_edge = half_edge.next
+        if half_edge == face.outer_half_edge:
+            break
+    return vertices
+
+
+def fan_result(points, apex) -> SolveResult:
+    """Fan triangulation and its 3-coloring; the apex alone guards everything."""
+    n = len(points)
+    palette = three_coloring_module.PALETTE
+    colors = {apex: palette[0]}
+    for j in range(1, n):
+        colors[(apex + j) % n] = palette[1 + (j + 1) % 2]
+    return SolveResult(
+        points=[tuple(p) for p in points],
+        triangles=fast_paths_module.fan_triangles(n, apex),
+        colors=colors,
+        guards=[apex],
+        guard_points=[tuple(points[apex])],
+    )
+
+
+def check_rings(points, holes=()):
+    """Raise ``ValueError`` unless every ring has 3 vertices and no vertex repeats.
+
+    A repeated vertex (a hole touching the outer ring or another hole) makes
+    the region non-simple, which the DCEL cannot represent.
+    """
+    if len(points) < 3:
+        raise ValueError("A polygon needs at least 3 vertices")
+    if any(len(hole) < 3 for hole in holes):
+        raise ValueError("A hole needs at least 3 vertices")
+    total = len(points) + sum(len(hole) for hole in holes)
+    distinct = {tuple(p) for p in points}
+    for hole in holes:
+        distinct.update(tuple(p) for p in hole)
+    if len(distinct) != total:
+        raise ValueError("Rings must not share or repeat vertices")
+
+
+def solve_polygon(
+    points,
+    rotation=0.0,
+    shift=0,
+    start_face_index=0,
+    fast_paths=True,
+    convex_partition=False,
+    holes=(),
+    progress=None,
+    profiler=None,
+) -> SolveResult:
+    """Run every pipeline step on ``points`` without drawing.
+
+    ``rotation`` (radians) and ``shift`` change the sweep direction and the
+    vertex order seen by the algorithms, and ``start_face_index`` selects the
+    triangle where the 3-coloring starts. Indices in the result always refer to
+    the caller's ``points``.
+
+    With ``fast_paths`` a polygon with a vertex in its kernel is answered by a
+    fan triangulation directly, skipping the DCEL entirely. Without it every
+    pipeline stage runs in full, monotone partitioning included.
+
+    With ``convex_partition`` the result also lists the Hertel–Mehlhorn convex
+    pieces (this goes through the DCEL even for kernel-vertex polygons).
+
+    ``holes`` are extra rings inside the polygon; their vertices are numbered
+    after the outer ring, in input order.
+
+    ``progress(done, total)``, if given, is called after each pipeline step.
+    A ``profiling.Profiler`` records every stage the DCEL pipeline runs (none
+    when the fast path answers).
+    """
+    check_rings(points, holes)
+
+    shape = None
+    if fast_paths and not holes:
+        shape = fast_paths_module.analyse_polygon(points)
+    if shape and shape.kernel_vertex is not None and not convex_partition:
+        return fan_result(points, shape.kernel_vertex)
+
+    work_points, order = transform_points(points, rotation, shift % len(points))
+    n = len(points)
+    center = (sum(p[0] for p in points) / n, sum(p[1] for p in points) / n)
+    work_holes = []
+    for hole in holes:
+        work_hole, hole_order = transform_points(hole, rotation, 0, center)
+        work_holes.append(work_hole)
+        base = len(order)
+        order.extend(base + k for k in hole_order)
+    pipeline = pipeline_module.ArtGalleryPipeline(
+        HeadlessCanvas(), profiler=profiler, fast_paths=fast_paths
+    )
+    steps = (
+        lambda: pipeline.step_load_polygon(work_points, work_holes),
+        pipeline.step_trapezoidalisation,
+        pipeline.step_monotone_partitioning,
+        pipeline.step_triangulation,
+        pipeline.step_convex_partition if convex_partition else (lambda: True),
+        pipeline.step_dual_graph,
+        lambda: pipeline.step_three_coloring(start_face_index),
+        pipeline.step_vertex_guards,
+    )
+    for done, step in enumerate(steps, 1):
+        if not step():
+            raise ValueError("Pipeline step failed")
+        if progress is not None:
+            progress(done, len(steps))
+
+    dcel = pipeline.triangulation_app.dcel
+    index_of = {vertex: order[k] for k, vertex in enumerate(dcel.vertices)}
+    triangles = [
+        tuple(index_of[v] for v in face_vertices(face))
+        for face in dcel.faces
+        if face.outer_half_edge
+    ]
+    colors = {
+        index_of[v]: color
+        for v, color in pipeline.three_coloring_app.colored_vertices.items()
+    }
+    guards = sorted(index_of[v] for v in pipeline.vertex_guards_app.guard_vertices)
+    result = SolveResult(
+        points=[tuple(p) for p in points],
+        holes=[[tuple(p) for p in hole] for hole in holes],
+    )
+    guard_points = [result.vertex(i) for i in guards]
+    convex_pieces = []
+    if convex_partition:
+        convex_app = pipeline.convex_partition_app
+        piece_index_of = {
+            vertex: order[k] for k, vertex in enumerate(convex_app.dcel.vertices)
+        }
+        convex_pieces = [
+            [piece_index_of[v] for v in piece] for piece in convex_app.pieces()
+        ]
+    if shape and shape.star_shaped:
+        guard_points = [shape.kernel_point()]
+    result.triangles = triangles
+    result.colors = colors
+    result.guards = guards
+    result.guard_points = guard_points
+    result.convex_pieces = convex_pieces
+    return result
+
+
+def _monotone_pieces(points, holes, coords):
+    # Vertex cycles of the y-monotone pieces, each with its triangles, traced
+    # from the sweep's diagonals over neighbour lists sorted by angle (no DCEL
+    # is built). Raises ValueError when a trace leaves the interior.
+    rings = []
+    base = 0
+    for k, ring in enumerate([points] + list(holes)):
+        indices = list(range(base, base + len(ring)))
+        base += len(ring)
+        # Interior on the left: outer ring counter-clockwise, holes clockwise
+        if (fast_paths_module.signed_area(ring) > 0) != (k == 0):
+            indices.reverse()
+        rings.append(indices)
+    order = [i for ring in rings for i in ring]
+    diagonals = monotone_partitioning_module.monotone_diagonals(
+        [[coords[i] for i in ring] for ring in rings]
+    )
+
+    def angle(v, w):
+        return math.atan2(coords[w][1] - coords[v][1], coords[w][0] - coords[v][0])
+
+    around = [[] for _ in coords]
+    edges = []  # directed, with the interior on their left
+    for ring in rings:
+        edges.extend(zip(ring, ring[1:] + ring[:1]))
+    for i, j in diagonals:
+        edges.append((order[i], order[j]))
+        edges.append((order[j], order[i]))
+    for v, w in edges:
+        around[v].append((angle(v, w), w))
+    for ring in rings:
+        for v, w in zip(ring[1:] + ring[:1], ring):
+            around[v].append((angle(v, w), w))
+    for neighbours in around:
+        neighbours.sort()
+
+    unused = set(edges)
+    for edge in edges:
+        if edge not in unused:
+            continue
+        cycle = []
+        u, v = edge
+        while (u, v) in unused:
+            unused.remove((u, v))
+            cycle.append(u)
+            # Leave v along the edge just clockwise of the one back to u
+            k = bisect.bisect_left(around[v], (angle(v, u), u))
+            u, v = v, around[v][k - 1][1]
+        if (u, v) != edge:
+            raise ValueError("Rings must not cross")
+        yield cycle, triangulation_module.monotone_triangles(cycle, coords)
+
+
+def _checked_triangles(cycle, triangles, coords):
+    # Check that the triangles tile the piece before any is handed out:
+    # m - 2 of them, none turning against the piece, the same total area.
+    triangles = list(triangles)
+    piece_area = fast_paths_module.signed_area([coords[v] for v in cycle])
+    areas = [fast_paths_module.signed_area([coords[v] for v in t]) for t in triangles]
+    if (
+        len(set(cycle)) != len(cycle)
+        or len(triangles) != len(cycle) - 2
+        or any(area * piece_area < 0 for area in areas)
+        or not math.isclose(sum(areas), piece_area, rel_tol=1e-9, abs_tol=1e-12)
+    ):
+        raise ValueError("Triangulation does not cover the polygon")
+    return triangles, abs(piece_area)
+
+
+def iter_triangles(points, holes=()):
+    """Yield the triangles of the polygon as index triples, piece by piece.
+
+    Unlike ``solve_polygon`` no DCEL is built: a polygon with a vertex in its
+    kernel is fanned and a y-monotone one is swept directly. Otherwise the
+    pieces are traced from ``monotone_partitioning.monotone_diagonals`` and
+    each is triangulated as it is reached, so only the diagonals and one
+    piece are held. Each piece is checked (triangle count and area) before
+    its triangles are yielded, and the totals once the last piece is done;
+    crossing rings raise ``ValueError`` like ``solve_polygon``. Indices follow
+    ``solve_polygon`` (hole vertices after the outer ring).
+    """
+    check_rings(points, holes)
+    n = len(points)
+    coords = [tuple(p) for p in points] + [tuple(p) for hole in holes for p in hole]
+    pieces = None
+    if not holes:
+        shape = fast_paths_module.analyse_polygon(points)
+        if shape.kernel_vertex is not None:
+            apex = shape.kernel_vertex
+            fan = [(apex, (apex + j) % n, (apex + j + 1) % n) for j in range(1, n - 1)]
+            pieces = [(range(n), fan)]
+        elif shape.y_monotone:
+            pieces = [(range(n), triangulation_module.monotone_triangles(range(n), coords))]
+    if pieces is None:
+        pieces = _monotone_pieces(points, holes, coords)
+
+    count = 0
+    covered = 0.0
+    for cycle, triangles in pieces:
+        triangles, area = _checked_triangles(cycle, triangles, coords)
+        count += len(triangles)
+        covered += area
+        yield from triangles
+    signed_area = fast_paths_module.signed_area
+    expected = abs(signed_area(points)) - sum(abs(signed_area(hole)) for hole in holes)
+    if count != n + sum(len(hole) + 2 for hole in holes) - 2 or not math.isclose(
+        covered, expected, rel_tol=1e-9, abs_tol=1e-12
+    ):
+        raise ValueError("Triangulation does not cover the polygon")
+
+
+def stream_triangles(points, out, holes=(), chunk_size=STREAM_CHUNK) -> int:
+    """Write the triangles of ``iter_triangles`` to ``out`` as they are found.
+
+    ``out`` is a path or a text file; each triangle is one ``"i j k"`` line
+    and lines are written ``chunk_size`` triangles at a time. Returns the
+    number of triangles written.
+    """
+    if isinstance(out, (str, bytes)) or hasattr(out, "__fspath__"):
+        with open(out, "w", encoding="utf-8") as stream:
+            return stream_triangles(points, stream, holes, chunk_size)
+    count = 0
+    chunk = []
+    for triangle in iter_triangles(points, holes):
+        chunk.append("%d %d %d\n" % triangle)
+        if len(chunk) >= chunk_size:
+            out.write("".join(chunk))
+            count += len(chunk)
+            chunk.clear()
+    out.write("".join(chunk))
+    return count + len(chunk)
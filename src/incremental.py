@@ -0,0 +1,614 @@
+# Incremental updates of a solved polygon after single-vertex edits.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# incremental.py - Moves, inserts and deletes polygon vertices in an existing triangulated DCEL,
+# re-triangulating only the affected triangles and updating the dual tree, the 3-coloring and
+# the guard set locally.
+
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from dcel import Face, Vertex
+from three_coloring import PALETTE
+
+# Guard color preference on ties, as in vertex_guards.decide_vertex_guards
+GUARD_ORDER = PALETTE
+
+
+@dataclass
+class EditResult:
+    """What an edit changed.
+
+    ``guards_changed`` compares the sets of guard vertices: a guard that was
+    moved stays the same guard. When the smallest color class switches,
+    ``guards_added``/``guards_removed`` list both whole classes.
+    """
+
+    faces_removed: int
+    faces_added: int
+    recolored: int
+    guards_changed: bool
+    guard_color: str
+    guards_added: List[Vertex] = field(default_factory=list)
+    guards_removed: List[Vertex] = field(default_factory=list)
+
+
+# Geometry helpers
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _on_segment(p, q, r):
+    # r is collinear with p-q; True if it lies between them
+    return min(p[0], q[0]) <= r[0] <= max(p[0], q[0]) and min(p[1], q[1]) <= r[1] <= max(p[1], q[1])
+
+
+def _segments_touch(p1, p2, q1, q2):
+    """True if the closed segments p1-p2 and q1-q2 share any point."""
+    d1 = _cross(q1, q2, p1)
+    d2 = _cross(q1, q2, p2)
+    d3 = _cross(p1, p2, q1)
+    d4 = _cross(p1, p2, q2)
+    if ((d1 > 0 and d2 < 0) or (d1 < 0 and d2 > 0)) and ((d3 > 0 and d4 < 0) or (d3 < 0 and d4 > 0)):
+        return True
+    return (
+        (d1 == 0 and _on_segment(q1, q2, p1))
+        or (d2 == 0 and _on_segment(q1, q2, p2))
+        or (d3 == 0 and _on_segment(p1, p2, q1))
+        or (d4 == 0 and _on_segment(p1, p2, q2))
+    )
+
+
+def _in_closed_triangle(a, b, c, p):
+    return _cross(a, b, p) >= 0 and _cross(b, c, p) >= 0 and _cross(c, a, p) >= 0
+
+
+def _face_edges(face):
+    edges = []
+    edge = face.outer_half_edge
+    while True:
+        edges.append(edge)
+        edge = edge.next
+        if edge is face.outer_half_edge:
+            return edges
+
+
+def ear_clip(vertices, position, blocked=None):
+    """Triangulate the (weakly) simple counter-clockwise polygon ``vertices``.
+
+    ``position(v)`` gives coordinates, and ``blocked(a, b)`` can forbid a
+    diagonal. Vertices may repeat where the polygon touches itself. Returns
+    CCW vertex triples, or None if no valid triangulation was found.
+    """
+    n = len(vertices)
+    if n < 3:
+        return None
+    points = [position(v) for v in vertices]
+    prev = [(i - 1) % n for i in range(n)]
+    nxt = [(i + 1) % n for i in range(n)]
+    triangles = []
+    remaining = n
+    i = 0
+    misses = 0
+    while remaining > 3:
+        p, q = prev[i], nxt[i]
+        if _is_ear(vertices, points, nxt, p, i, q, remaining, blocked):
+            triangles.append((vertices[p], vertices[i], vertices[q]))
+            nxt[p], prev[q] = q, p
+            remaining -= 1
+            misses = 0
+            i = p
+        else:
+            i = q
+            misses += 1
+            if misses > remaining:
+                return None
+    p, q = prev[i], nxt[i]
+    if _cross(points[p], points[i], points[q]) <= 0:
+        return None
+    triangles.append((vertices[p], vertices[i], vertices[q]))
+    return triangles
+
+
+def _is_ear(vertices, points, nxt, p, i, q, remaining, blocked):
+    a, b, c = points[p], points[i], points[q]
+    if _cross(a, b, c) <= 0 or vertices[p] is vertices[q]:
+        return False
+    if blocked is not None and blocked(vertices[p], vertices[q]):
+        return False
+    corners = (vertices[p], vertices[i], vertices[q])
+    j = nxt[q]
+    while j != p:
+        if vertices[j] not in corners and _in_closed_triangle(a, b, c, points[j]):
+            return False
+        j = nxt[j]
+    return True
+
+
+class _EdgeGrid:
+    """Uniform grid over the boundary edges, so checking a new edge against
+    the polygon only looks at the edges near it."""
+
+    def __init__(self, ring):
+        xs = [v.x for v in ring]
+        ys = [v.y for v in ring]
+        extent = max(max(xs) - min(xs), max(ys) - min(ys), 1e-9)
+        self.cell = extent / max(math.sqrt(len(ring)), 1.0)
+        self.cells: Dict[tuple, set] = {}
+        self.edge_cells: Dict[tuple, list] = {}
+        for k, v in enumerate(ring):
+            self.add(v, ring[(k + 1) % len(ring)])
+
+    def _cells_along(self, p, q):
+        # Samples every half cell, plus neighbours: covers the whole segment.
+        steps = int(math.hypot(q[0] - p[0], q[1] - p[1]) / (0.5 * self.cell)) + 1
+        cells = set()
+        for s in range(steps + 1):
+            t = s / steps
+            cx = int(math.floor((p[0] + t * (q[0] - p[0])) / self.cell))
+            cy = int(math.floor((p[1] + t * (q[1] - p[1])) / self.cell))
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    cells.add((cx + dx, cy + dy))
+        return cells
+
+    def add(self, a, b):
+        cells = [c for c in self._cells_along((a.x, a.y), (b.x, b.y))]
+        self.edge_cells[(a, b)] = cells
+        for cell in cells:
+            self.cells.setdefault(cell, set()).add((a, b))
+
+    def remove(self, a, b):
+        for cell in self.edge_cells.pop((a, b)):
+            bucket = self.cells[cell]
+            bucket.discard((a, b))
+            if not bucket:
+                del self.cells[cell]
+
+    def crosses(self, a, b, position, ignore=()):
+        """True if segment a-b (at ``position``) touches a boundary edge other
+        than at a shared endpoint, or overlaps one sharing an endpoint."""
+        p, q = position(a), position(b)
+        seen = set(ignore)
+        for cell in self._cells_along(p, q):
+            for edge in self.cells.get(cell, ()):
+                if edge in seen:
+                    continue
+                seen.add(edge)
+                c, d = edge
+                r, s = (c.x, c.y), (d.x, d.y)
+                shared = {a, b} & {c, d}
+                if not shared:
+                    if _segments_touch(p, q, r, s):
+                        return True
+                    continue
+                if len(shared) == 2:
+                    return True  # the same edge already exists
+                # One shared endpoint: only a collinear overlap conflicts.
+                other_new = q if a in shared else p
+                other_old = s if c in shared else r
+                common = p if a in shared else q
+                if _cross(common, other_new, other_old) == 0 and (
+                    _on_segment(common, other_new, other_old) or _on_segment(common, other_old, other_new)
+                ):
+                    return True
+        return False
+
+
+class IncrementalTriangulation:
+    """A triangulated polygon (no holes) that follows single-vertex edits.
+
+    ``move_vertex``, ``insert_vertex`` and ``delete_vertex`` take indices
+    into ``ring`` (the boundary in counter-clockwise order). An edit first
+    checks the new boundary edges against nearby edges; a self-intersecting
+    result raises ``ValueError`` and leaves everything unchanged. Otherwise
+    only the triangles around the vertex are removed and re-triangulated.
+    The region grows one ring of neighbours at a time while it cannot be
+    triangulated. The dual graph, the 3-coloring and the guard set are then
+    repaired starting from those triangles. Colors change only in the
+    subtrees where the new triangles force a different assignment.
+
+    A move that leaves every triangle at the vertex positively oriented only
+    updates the coordinates. Inserting or deleting also shifts the vertex
+    lists (``dcel.vertices``, ``ring``), which is a memmove of their length.
+    """
+
+    def __init__(self, dcel, colors):
+        if len(dcel.rings) > 1:
+            raise ValueError("Incremental edits support polygons without holes")
+        # Positive triangles whose areas add up to the polygon's tile it.
+        ring = dcel.rings[0]
+        total = 0.0
+        for face in dcel.faces:
+            edges = _face_edges(face)
+            corners = [(he.origin.x, he.origin.y) for he in edges]
+            if len(edges) != 3 or _cross(*corners) <= 0:
+                raise ValueError("The DCEL is not a valid triangulation")
+            total += _cross(*corners)
+        area = sum(
+            v.x * ring[(k + 1) % len(ring)].y - ring[(k + 1) % len(ring)].x * v.y
+            for k, v in enumerate(ring)
+        )
+        edges = {(he.origin, he.target) for he in dcel.half_edges}
+        if (
+            len(dcel.faces) != len(ring) - 2
+            or len(edges) != len(dcel.half_edges)
+            or len(edges) != 2 * (2 * len(ring) - 3)
+            or abs(total - area) > 1e-9 * abs(area)
+        ):
+            raise ValueError("The DCEL is not a valid triangulation")
+        dcel.journal = None  # edits here are not undone through a pipeline
+        self.dcel = dcel
+        self.ring = ring
+        self.colors: Dict[Vertex, str] = dict(colors)
+        self.classes = {color: set() for color in PALETTE}
+        for vertex, color in self.colors.items():
+            self.classes[color].add(vertex)
+        self.graph: Dict[Face, List[Face]] = {}
+        for face in dcel.faces:
+            self.graph[face] = [
+                he.twin.incident_face for he in _face_edges(face) if he.twin.incident_face is not None
+            ]
+        self._face_pos = {face: k for k, face in enumerate(dcel.faces)}
+        self._edge_pos = {he: k for k, he in enumerate(dcel.half_edges)}
+        self._grid = _EdgeGrid(self.ring)
+
+    @classmethod
+    def from_pipeline(cls, pipeline):
+        """Start from a pipeline whose 3-coloring is computed (works on a copy
+        of its triangulation, so the pipeline's stages stay valid)."""
+        if not pipeline.request("three_coloring"):
+            raise ValueError("The pipeline could not 3-color the polygon")
+        source = pipeline.triangulation_app.dcel
+        dcel = source.copy()
+        vertex_map = dict(zip(source.vertices, dcel.vertices))
+        colors = pipeline.three_coloring_app.colored_vertices
+        return cls(dcel, {vertex_map[v]: color for v, color in colors.items()})
+
+    @classmethod
+    def from_points(cls, points):
+        import headless as headless_module
+        import pipeline as pipeline_module
+
+        pipeline = pipeline_module.ArtGalleryPipeline(headless_module.HeadlessCanvas())
+        if not pipeline.step_load_polygon(points):
+            raise ValueError("Invalid polygon")
+        if not pipeline.request("three_coloring"):
+            raise ValueError("The pipeline could not 3-color the polygon")
+        # The pipeline is private here, so its DCEL can be taken over as is.
+        return cls(pipeline.triangulation_app.dcel, pipeline.three_coloring_app.colored_vertices)
+
+    # Queries
+    @property
+    def guard_color(self) -> str:
+        return min(GUARD_ORDER, key=lambda color: (len(self.classes[color]), GUARD_ORDER.index(color)))
+
+    @property
+    def guards(self) -> List[Vertex]:
+        return list(self.classes[self.guard_color])
+
+    def points(self):
+        return [(v.x, v.y) for v in self.ring]
+
+    def triangles(self):
+        """Triangles as index triples into ``ring`` (O(n); for callers and checks)."""
+        index = {v: k for k, v in enumerate(self.ring)}
+        return [tuple(index[he.origin] for he in _face_edges(face)) for face in self.dcel.faces]
+
+    # Edits
+    def move_vertex(self, index: int, x: float, y: float) -> EditResult:
+        vertex = self.ring[index]
+        before, after = self.ring[index - 1], self.ring[(index + 1) % len(self.ring)]
+        target = (float(x), float(y))
+
+        def position(v):
+            return target if v is vertex else (v.x, v.y)
+
+        ignore = [(before, vertex), (vertex, after)]
+        self._check_boundary([(before, vertex), (vertex, after)], position, ignore)
+        star = self._star(vertex)
+        if all(self._positive(face, position) for face in star):
+            self._grid.remove(before, vertex)
+            self._grid.remove(vertex, after)
+            vertex.x, vertex.y = target
+            self._grid.add(before, vertex)
+            self._grid.add(vertex, after)
+            return EditResult(0, 0, 0, False, self.guard_color)
+
+        def new_cycle(boundary):
+            return [(he.origin, he) for he in boundary]
+
+        plan = self._plan(star, new_cycle, position)
+        self._grid.remove(before, vertex)
+        self._grid.remove(vertex, after)
+        vertex.x, vertex.y = target
+        self._grid.add(before, vertex)
+        self._grid.add(vertex, after)
+        return self._apply(plan)
+
+    def insert_vertex(self, index: int, x: float, y: float) -> EditResult:
+        """Insert a vertex at (x, y) between ``ring[index]`` and the next one."""
+        a, b = self.ring[index], self.ring[(index + 1) % len(self.ring)]
+        vertex = Vertex(float(x), float(y))
+
+        def position(v):
+            return (v.x, v.y)
+
+        self._check_boundary([(a, vertex), (vertex, b)], position, [(a, b)])
+        edge = self._boundary_edge(a, b)
+
+        def new_cycle(boundary):
+            cycle = []
+            for he in boundary:
+                if he is edge:
+                    cycle += [(a, None), (vertex, None)]
+                else:
+                    cycle.append((he.origin, he))
+            return cycle
+
+        plan = self._plan([edge.incident_face], new_cycle, position)
+        self._grid.remove(a, b)
+        self._grid.add(a, vertex)
+        self._grid.add(vertex, b)
+        result = self._apply(plan, dropped=[edge], inserted=vertex)
+        self.ring.insert(index + 1, vertex)
+        self.dcel.vertices.append(vertex)
+        return result
+
+    def delete_vertex(self, index: int) -> EditResult:
+        if len(self.ring) <= 3:
+            raise ValueError("A polygon needs at least 3 vertices")
+        vertex = self.ring[index]
+        before, after = self.ring[index - 1], self.ring[(index + 1) % len(self.ring)]
+
+        def position(v):
+            return (v.x, v.y)
+
+        self._check_boundary([(before, after)], position, [(before, vertex), (vertex, after)])
+        incoming = self._boundary_edge(before, vertex)
+        outgoing = self._boundary_edge(vertex, after)
+
+        def new_cycle(boundary):
+            cycle = []
+            for he in boundary:
+                if he is incoming:
+                    cycle.append((before, None))
+                elif he is not outgoing:
+                    cycle.append((he.origin, he))
+            return cycle
+
+        plan = self._plan(self._star(vertex), new_cycle, position)
+        self._grid.remove(before, vertex)
+        self._grid.remove(vertex, after)
+        self._grid.add(before, after)
+        result = self._apply(plan, dropped=[incoming, outgoing], deleted=vertex)
+        del self.ring[index]
+        self.dcel.vertices.remove(vertex)
+        return result
+
+    # Planning (no mutation)
+    def _check_boundary(self, edges, position, ignore):
+        for a, b in edges:
+            if position(a) == position(b) or self._grid.crosses(a, b, position, ignore + edges):
+                raise ValueError("The edit would make the polygon self-intersecting")
+        if len(edges) == 2:
+            # The two new edges must not run back along each other.
+            (a, v), (_, b) = edges
+            pa, pv, pb = position(a), position(v), position(b)
+            folded = (pa[0] - pv[0]) * (pb[0] - pv[0]) + (pa[1] - pv[1]) * (pb[1] - pv[1]) > 0
+            if _cross(pv, pa, pb) == 0 and folded:
+                raise ValueError("The edit would fold the boundary back on itself")
+
+    def _star(self, vertex):
+        return [face for face, _ in vertex.incident_edges_and_faces if face is not None]
+
+    def _boundary_edge(self, a, b):
+        for he in a.incident_half_edges:
+            if he.target is b and he.incident_face is not None and he.twin.incident_face is None:
+                return he
+        raise ValueError("Not a boundary edge")
+
+    @staticmethod
+    def _positive(face, position):
+        a, b, c = (position(he.origin) for he in _face_edges(face))
+        return _cross(a, b, c) > 0
+
+    def _region_boundary(self, region):
+        """Half-edges bounding the union of ``region`` faces, in cycle order."""
+        start = None
+        for face in region:
+            for he in _face_edges(face):
+                if he.twin.incident_face not in region:
+                    start = he
+                    break
+            if start is not None:
+                break
+        boundary = [start]
+        edge = start
+        while True:
+            following = edge.next
+            while following.twin.incident_face in region:
+                following = following.twin.next
+            if following is start:
+                return boundary
+            boundary.append(following)
+            edge = following
+
+    def _plan(self, seed, new_cycle, position):
+        region = dict.fromkeys(seed)  # ordered, so edits are reproducible
+        while True:
+            boundary = self._region_boundary(region)
+            cycle = new_cycle(boundary)
+            interior = [
+                he for face in region for he in _face_edges(face) if he.twin.incident_face in region
+            ]
+            interior_set = set(interior)
+
+            def blocked(a, b):
+                return any(he.target is b and he not in interior_set for he in a.incident_half_edges)
+
+            triangles = ear_clip([v for v, _ in cycle], position, blocked)
+            if triangles is not None:
+                return region, cycle, interior, triangles
+            grow = [he.twin.incident_face for he in boundary if he.twin.incident_face is not None]
+            if not grow:
+                raise ValueError("The edited polygon cannot be triangulated")
+            region.update(dict.fromkeys(grow))
+
+    # Applying a plan
+    def _remove_from(self, items, positions, item):
+        k = positions.pop(item)
+        last = items.pop()
+        if last is not item:
+            items[k] = last
+            positions[last] = k
+
+    def _apply(self, plan, dropped=(), inserted=None, deleted=None) -> EditResult:
+        region, cycle, interior, triangles = plan
+        dcel = self.dcel
+        guard_color = self.guard_color
+
+        # Exterior neighbours of the replaced boundary edges, for relinking
+        dropped = list(dropped)
+        exterior_before = exterior_after = None
+        if dropped:
+            exterior_before = dropped[-1].twin.prev
+            exterior_after = dropped[0].twin.next
+
+        removed = list(interior)
+        for he in dropped:
+            removed += [he, he.twin]
+        for he in removed:
+            self._remove_from(dcel.half_edges, self._edge_pos, he)
+            he.origin.incident_half_edges.remove(he)
+            dcel.existing_lines.discard((he.origin, he.target))
+
+        touched = {v for v, _ in cycle}
+        if deleted is not None:
+            touched.add(deleted)
+        for face in region:
+            self._remove_from(dcel.faces, self._face_pos, face)
+            for neighbour in self.graph.pop(face):
+                if neighbour not in region:
+                    self.graph[neighbour].remove(face)
+        for v in touched:
+            v.incident_edges_and_faces = [
+                entry for entry in v.incident_edges_and_faces if entry[0] not in region
+            ]
+
+        kept = {(v, he.target): he for v, he in cycle if he is not None}
+        created = {}
+        new_faces = []
+        for corners in triangles:
+            edges = []
+            for s, t in zip(corners, corners[1:] + corners[:1]):
+                he = kept.get((s, t)) or created.get((s, t))
+                if he is None:
+                    he, twin = dcel.add_edge(s, t)
+                    self._edge_pos[he] = len(dcel.half_edges) - 2
+                    self._edge_pos[twin] = len(dcel.half_edges) - 1
+                    created[(s, t)], created[(t, s)] = he, twin
+                edges.append(he)
+            for k, he in enumerate(edges):
+                he.next = edges[(k + 1) % 3]
+                edges[(k + 1) % 3].prev = he
+            dcel.add_face(edges[0])
+            self._face_pos[dcel.faces[-1]] = len(dcel.faces) - 1
+            new_faces.append(dcel.faces[-1])
+
+        if dropped:
+            # New boundary edges: their twins join the exterior cycle.
+            new_boundary = [created[(v, w)] for (v, he), (w, _) in zip(cycle, cycle[1:] + cycle[:1]) if he is None]
+            outside = [he.twin for he in reversed(new_boundary)]
+            chain = [exterior_before] + outside + [exterior_after]
+            for first, second in zip(chain, chain[1:]):
+                first.next = second
+                second.prev = first
+
+        new_set = set(new_faces)
+        for face in new_faces:
+            neighbours = [
+                he.twin.incident_face for he in _face_edges(face) if he.twin.incident_face is not None
+            ]
+            self.graph[face] = neighbours
+            for neighbour in neighbours:
+                if neighbour not in new_set:
+                    self.graph[neighbour].append(face)
+
+        # vertex -> color before the edit (None for the inserted one)
+        previous = {}
+        if deleted is not None:
+            previous[deleted] = self.colors.pop(deleted)
+            self.classes[previous[deleted]].discard(deleted)
+        self._recolor(new_faces, new_set, previous)
+
+        new_color = self.guard_color
+        if new_color == guard_color:
+            added = [v for v in previous if previous[v] != guard_color and self.colors.get(v) == new_color]
+            removed_guards = [
+                v for v in previous if previous[v] == guard_color and self.colors.get(v) != new_color
+            ]
+        else:
+            added = list(self.classes[new_color])
+            removed_guards = [v for v in self.classes[guard_color] if v not in previous]
+            removed_guards += [v for v in previous if previous[v] == guard_color]
+        return EditResult(
+            faces_removed=len(region),
+            faces_added=len(new_faces),
+            recolored=sum(1 for v in previous if previous[v] is not None and v in self.colors),
+            guards_changed=bool(added or removed_guards),
+            guard_color=new_color,
+            guards_added=added,
+            guards_removed=removed_guards,
+        )
+
+    def _set_color(self, vertex, color, previous):
+        old = self.colors.get(vertex)
+        if old == color:
+            return
+        previous.setdefault(vertex, old)
+        if old is not None:
+            self.classes[old].discard(vertex)
+        self.colors[vertex] = color
+        self.classes[color].add(vertex)
+
+    def _recolor(self, new_faces, new_set, previous):
+        """Propagate a proper 3-coloring from the new triangles outwards,
+        stopping at triangles whose colors are already consistent. Records
+        the old color of every vertex it changes in ``previous``."""
+        seed = None
+        for face in new_faces:
+            for he in _face_edges(face):
+                if he.twin.incident_face is not None and he.twin.incident_face not in new_set:
+                    seed = he
+                    break
+            if seed is not None:
+                break
+        if seed is None:  # the region is the whole polygon
+            seed = new_faces[0].outer_half_edge
+            a, b = seed.origin, seed.target
+            if a not in self.colors or b not in self.colors or self.colors[a] == self.colors[b]:
+                self._set_color(a, PALETTE[0], previous)
+                self._set_color(b, PALETTE[1], previous)
+
+        visited = set()
+        queue = deque([seed])
+        while queue:
+            entry = queue.popleft()
+            face = entry.incident_face
+            if face in visited:
+                continue
+            visited.add(face)
+            third = entry.next.target
+            known = {self.colors[entry.origin], self.colors[entry.target]}
+            forced = next(color for color in PALETTE if color not in known)
+            self._set_color(third, forced, previous)
+            for he in (entry, entry.next, entry.prev):
+                neighbour = he.twin.incident_face
+                if neighbour is None or neighbour in visited:
+                    continue
+                if neighbour in new_set or any(e.origin in previous for e in _face_edges(neighbour)):
+                    queue.append(he.twin)
@@ -0,0 +1,169 @@
+# Level-of-detail drawing for large polygons.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# lod.py - Viewport mapping, screen-resolution ring simplification and thresholded
+# vertex markers/labels, shared by the Tk canvas and the web adapters.
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+POLYGON_TAG = "polygon"
+
+
+@dataclass
+class LodConfig:
+    max_labels: int = 60  # coordinate labels only when this few vertices are visible
+    max_markers: int = 400  # vertex dots only when this few vertices are visible
+    max_animated: int = 100  # larger polygons are drawn in a single frame
+    tolerance: float = 0.75  # simplification tolerance, in screen pixels
+
+
+@dataclass
+class Viewport:
+    """Maps polygon coordinates to canvas coordinates and knows what is visible.
+
+    The defaults reproduce the fixed mapping used by the steps (x right of the
+    left padding, y up from the bottom padding). ``window`` is the visible part
+    of the canvas, in canvas units, and ``pixel_size`` is canvas units per
+    screen pixel.
+    """
+
+    scale: float = 1.0
+    offset_x: float = 50.0
+    offset_y: float = 450.0
+    window: Tuple[float, float, float, float] = (0.0, 0.0, 500.0, 500.0)
+    pixel_size: float = 1.0
+
+    def to_canvas(self, x, y) -> Tuple[float, float]:
+        return self.offset_x + self.scale * x, self.offset_y - self.scale * y
+
+    def contains(self, cx, cy) -> bool:
+        x0, y0, x1, y1 = self.window
+        return x0 <= cx <= x1 and y0 <= cy <= y1
+
+    def zoom(self, factor, cx, cy):
+        """Zoom by ``factor`` about canvas point (cx, cy), like Tk ``canvas.scale``."""
+        self.offset_x = cx + factor * (self.offset_x - cx)
+        self.offset_y = cy + factor * (self.offset_y - cy)
+        self.scale *= factor
+
+    def pan(self, dx, dy):
+        self.offset_x += dx
+        self.offset_y += dy
+
+    @property
+    def is_identity(self) -> bool:
+        default = Viewport()
+        return (self.scale, self.offset_x, self.offset_y) == (
+            default.scale,
+            default.offset_x,
+            default.offset_y,
+        )
+
+
+def _segment_distance_sq(p, a, b) -> float:
+    dx = b[0] - a[0]
+    dy = b[1] - a[1]
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        ex, ey = p[0] - a[0], p[1] - a[1]
+        return ex * ex + ey * ey
+    t = max(0.0, min(1.0, ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / length_sq))
+    ex = p[0] - (a[0] + t * dx)
+    ey = p[1] - (a[1] + t * dy)
+    return ex * ex + ey * ey
+
+
+def simplify_chain(points, tolerance) -> List[int]:
+    """Douglas–Peucker on an open chain; returns the indices kept (ends included).
+
+    Iterative, so very long chains do not hit the recursion limit.
+    """
+    n = len(points)
+    if n <= 2:
+        return list(range(n))
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    tolerance_sq = tolerance * tolerance
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        worst, worst_index = -1.0, None
+        for i in range(first + 1, last):
+            d = _segment_distance_sq(points[i], points[first], points[last])
+            if d > worst:
+                worst, worst_index = d, i
+        if worst_index is not None and worst > tolerance_sq:
+            keep[worst_index] = True
+            stack.append((first, worst_index))
+            stack.append((worst_index, last))
+    return [i for i in range(n) if keep[i]]
+
+
+def simplify_ring(points, tolerance) -> List[Tuple[float, float]]:
+    """Simplify a closed ring, splitting it at vertex 0 and its farthest vertex."""
+    n = len(points)
+    if n <= 3 or tolerance <= 0:
+        return list(points)
+    x0, y0 = points[0]
+    far = max(range(n), key=lambda i: (points[i][0] - x0) ** 2 + (points[i][1] - y0) ** 2)
+    first = points[: far + 1]
+    second = points[far:] + points[:1]
+    kept = [first[i] for i in simplify_chain(first, tolerance)]
+    kept += [second[i] for i in simplify_chain(second, tolerance)[1:-1]]
+    return kept
+
+
+def draw_polygon(
+    canvas,
+    rings,
+    viewport: Optional[Viewport] = None,
+    config: Optional[LodConfig] = None,
+    fill="black",
+    tags=POLYGON_TAG,
+):
+    """Draw ``rings`` at the detail level the viewport allows.
+
+    Each ring becomes one closed polyline simplified to ``config.tolerance``
+    screen pixels. Vertex dots and coordinate labels are drawn only for visible
+    vertices, and only while there are at most ``max_markers`` /
+    ``max_labels`` of them. Returns the created canvas ids.
+    """
+    viewport = viewport or Viewport()
+    config = config or LodConfig()
+    ids = []
+    visible = []
+    for ring in rings:
+        screen = [viewport.to_canvas(x, y) for x, y in ring]
+        visible.extend(
+            (point, canvas_point)
+            for point, canvas_point in zip(ring, screen)
+            if viewport.contains(*canvas_point)
+        )
+        outline = simplify_ring(screen, config.tolerance * viewport.pixel_size)
+        coords = [c for point in outline + outline[:1] for c in point]
+        ids.append(canvas.create_line(*coords, fill=fill, tags=tags))
+
+    radius = 3 * viewport.pixel_size
+    if len(visible) <= config.max_markers:
+        for _, (cx, cy) in visible:
+            ids.append(
+                canvas.create_oval(
+                    cx - radius, cy - radius, cx + radius, cy + radius, fill=fill, tags=tags
+                )
+            )
+    if len(visible) <= config.max_labels:
+        offset = 10 * viewport.pixel_size
+        for (x, y), (cx, cy) in visible:
+            ids.append(
+                canvas.create_text(
+                    cx + offset,
+                    cy - offset,
+                    text=f"({x}, {y})",
+                    fill=fill,
+                    font=("Arial", 5),
+                    tags=tags,
+                )
+            )
+    return ids
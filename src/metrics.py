@@ -0,0 +1,327 @@
+# In-process operational metrics with a Prometheus exporter.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# metrics.py - Counters, gauges and fixed-bucket histograms in a registry, rendered in the
+# Prometheus text format and served over HTTP from a background thread.
+
+import bisect
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+SIZE_BUCKETS = tuple(2 ** k for k in range(2, 21))  # 4 .. ~10^6 vertices
+QUANTILES = (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names, values, extra=()) -> str:
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in pairs
+    )
+    return "{" + ",".join('%s="%s"' % pair for pair in escaped) + "}"
+
+
+# Values of one label combination
+class CounterValue:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+
+class GaugeValue:
+    def __init__(self):
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float):
+        self._value = value
+
+    def set_function(self, function: Callable[[], float]):
+        """Read the value from ``function`` at every scrape instead."""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        if self._function is not None:
+            try:
+                return float(self._function())
+            except Exception:  # a dead source (e.g. a closed queue) reads as 0
+                return 0.0
+        return self._value
+
+
+class HistogramValue:
+    """Counts per fixed bucket: ``observe`` is one bisect and one increment,
+    and quantiles are estimated from the buckets like ``histogram_quantile``."""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # the last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        with self._lock:
+            counts, total = list(self.counts), self.count
+        if total == 0:
+            return None
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if seen + count >= rank and count:
+                if index == len(self.bounds):
+                    return self.bounds[-1]  # beyond the last bound: a lower estimate
+                low = self.bounds[index - 1] if index else 0.0
+                return low + (self.bounds[index] - low) * (rank - seen) / count
+            seen += count
+        return self.bounds[-1]
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        with self._lock:
+            counts = list(self.counts)
+        out, running = [], 0
+        for bound, count in zip(self.bounds + (float("inf"),), counts):
+            running += count
+            out.append((bound, running))
+        return out
+
+
+# Metric families (one value per label combination)
+class Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError("%s takes labels %s" % (self.name, self.labelnames))
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def children(self):
+        with self._lock:
+            return sorted(self._children.items())
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = ["# HELP %s %s" % (self.name, self.help), "# TYPE %s %s" % (self.name, self.kind)]
+        for values, child in self.children():
+            lines.extend(self._render_child(values, child))
+        return lines
+
+    def _render_child(self, values, child) -> List[str]:
+        labels = _format_labels(self.labelnames, values)
+        return ["%s%s %s" % (self.name, labels, _format_value(child.value))]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return CounterValue()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return GaugeValue()
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def _render_child(self, values, child) -> List[str]:
+        lines = [
+            "%s_bucket%s %d"
+            % (self.name, _format_labels(self.labelnames, values, [("le", _format_value(bound))]), count)
+            for bound, count in child.cumulative()
+        ]
+        labels = _format_labels(self.labelnames, values)
+        lines.append("%s_sum%s %s" % (self.name, labels, _format_value(child.sum)))
+        lines.append("%s_count%s %d" % (self.name, labels, child.count))
+        return lines
+
+
+class Registry:
+    """Named metrics of one process; ``render`` gives the Prometheus text
+    format and ``snapshot`` a JSON-friendly summary with quantiles."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif type(metric) is not cls:
+                raise ValueError("%s is already a %s" % (name, metric.kind))
+            return metric
+
+    def counter(self, name, help_text, labelnames=()) -> Counter:
+        return self._get(Counter, name, help_text, labelnames)
+
+    def gauge(self, name, help_text, labelnames=()) -> Gauge:
+        return self._get(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name, help_text, labelnames=(), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help_text, labelnames, buckets)
+
+    def metrics(self) -> List[Metric]:
+        with self._lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> dict:
+        out = {}
+        for metric in self.metrics():
+            entries = {}
+            for values, child in metric.children():
+                key = ",".join("%s=%s" % pair for pair in zip(metric.labelnames, values)) or "_"
+                if isinstance(metric, Histogram):
+                    entries[key] = {"count": child.count, "sum": child.sum}
+                    entries[key].update((name, child.quantile(q)) for name, q in QUANTILES)
+                else:
+                    entries[key] = child.value
+            out[metric.name] = entries
+        return out
+
+
+REGISTRY = Registry()
+
+# Metrics recorded by the pipeline, the result cache, the solve pool and the solve service
+STAGE_SECONDS = REGISTRY.histogram(
+    "art_gallery_stage_seconds", "Time to compute a pipeline stage.", ("stage",)
+)
+STAGE_CACHE = REGISTRY.counter(
+    "art_gallery_stage_cache_total",
+    "Stage requests answered from the pipeline memo (hit) or computed (miss).",
+    ("stage", "result"),
+)
+RESULT_CACHE = REGISTRY.counter(
+    "art_gallery_result_cache_total",
+    "Solve results looked up in a ResultCache: found (hit) or not (miss).",
+    ("result",),
+)
+POLYGON_VERTICES = REGISTRY.histogram(
+    "art_gallery_polygon_vertices", "Vertices of the polygons loaded.", buckets=SIZE_BUCKETS
+)
+REQUESTS = REGISTRY.counter(
+    "art_gallery_requests_total", "Solve requests by entry point and outcome.", ("source", "outcome")
+)
+REQUEST_SECONDS = REGISTRY.histogram(
+    "art_gallery_request_seconds", "Time from receiving a request to answering it.", ("source",)
+)
+QUEUE_DEPTH = REGISTRY.gauge(
+    "art_gallery_queue_depth", "Jobs waiting or running in a queue.", ("queue",)
+)
+
+
+# Exporter
+def start_http_server(port: int, host: str = "127.0.0.1", registry: Registry = REGISTRY):
+    """Serve ``GET /metrics`` from a daemon thread; returns the server
+    (``server.server_address`` holds the bound port, ``shutdown()`` stops it)."""
+    # Imported here: the pipeline imports this module and http.server is slow to load.
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):  # scrapes are not worth a log line each
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-exporter", daemon=True)
+    thread.start()
+    return server
+
+
+_env_server = None
+_env_lock = threading.Lock()
+
+
+def start_from_env():
+    """Start the exporter once per process if ``ART_GALLERY_METRICS_PORT`` is
+    set (``ART_GALLERY_METRICS_HOST`` defaults to 127.0.0.1)."""
+    global _env_server
+    port = os.environ.get("ART_GALLERY_METRICS_PORT")
+    if not port:
+        return None
+    with _env_lock:
+        if _env_server is None:
+            _env_server = start_http_server(
+                int(port), os.environ.get("ART_GALLERY_METRICS_HOST", "127.0.0.1")
+            )
+        return _env_server
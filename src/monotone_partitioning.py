@@ -2,10 +2,117 @@
 #
 # GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
 # Date: 25 Sept, 2025
-# monotone_partitioning.py - Finds supporting vertices and draws diagonals.
+# monotone_partitioning.py - Helper-based sweep that finds and draws the diagonals.
 #
 
-import time
+from bisect import bisect_left, bisect_right
+
+from animation import pause
+import profiling
+
+
+def monotone_diagonals(rings):
+    """Helper-based sweep (de Berg et al.) over one or more rings.
+
+    ``rings`` are point lists with the polygon interior on their left (outer
+    ring counter-clockwise, holes clockwise). Vertices are numbered by
+    concatenating the rings. Returns ``(event_vertex, other_vertex)`` pairs in
+    sweep order; adding them splits the region into y-monotone pieces and
+    connects every hole to the outer boundary. Runs in O(n log n) comparisons.
+    Raises ``ValueError`` when the sweep finds no edge left of a vertex.
+    """
+    coords = []
+    next_index = []
+    prev_index = []
+    for ring in rings:
+        base = len(coords)
+        m = len(ring)
+        for k, point in enumerate(ring):
+            coords.append((point[0], point[1]))
+            next_index.append(base + (k + 1) % m)
+            prev_index.append(base + (k - 1) % m)
+
+    def above(a, b):
+        return coords[a][1] > coords[b][1] or (
+            coords[a][1] == coords[b][1] and coords[a][0] < coords[b][0]
+        )
+
+    def is_convex(i):
+        profiling.count(profiling.ORIENTATION_TESTS)
+        (px, py), (x, y), (nx, ny) = coords[prev_index[i]], coords[i], coords[next_index[i]]
+        return (x - px) * (ny - y) - (y - py) * (nx - x) > 0
+
+    sweep_y = 0.0
+
+    def x_at(edge):
+        # Where the edge crosses the sweep line: the sweep's intersection test
+        profiling.count(profiling.SEGMENTS_INTERSECT)
+        (x1, y1), (x2, y2) = coords[edge], coords[next_index[edge]]
+        if y1 == y2:
+            return max(x1, x2)
+        return x1 + (sweep_y - y1) * (x2 - x1) / (y2 - y1)
+
+    status = []
+    helper = {}
+    merge_vertices = set()
+    diagonals = []
+
+    def insert(edge):
+        status.insert(bisect_left(status, x_at(edge), key=x_at), edge)
+
+    def remove(edge):
+        index = bisect_left(status, x_at(edge), key=x_at)
+        for k in (index, index - 1, index + 1):
+            if 0 <= k < len(status) and status[k] == edge:
+                del status[k]
+                return
+        status.remove(edge)
+
+    def edge_left_of(i):
+        k = bisect_right(status, coords[i][0], key=x_at)
+        if k == 0:
+            # Only possible when the rings cross or are oriented the wrong way
+            raise ValueError("Rings must not cross")
+        return status[k - 1]
+
+    def connect_if_merge(i, edge):
+        if helper[edge] in merge_vertices:
+            diagonals.append((i, helper[edge]))
+
+    order = sorted(range(len(coords)), key=lambda i: (-coords[i][1], coords[i][0]))
+    for i in order:
+        sweep_y = coords[i][1]
+        prev_edge = prev_index[i]
+        prev_above = above(prev_index[i], i)
+        next_above = above(next_index[i], i)
+        if not prev_above and not next_above:
+            if is_convex(i):  # start
+                helper[i] = i
+                insert(i)
+            else:  # split
+                left = edge_left_of(i)
+                diagonals.append((i, helper[left]))
+                helper[left] = i
+                helper[i] = i
+                insert(i)
+        elif prev_above and next_above:
+            connect_if_merge(i, prev_edge)
+            remove(prev_edge)
+            if not is_convex(i):  # merge
+                left = edge_left_of(i)
+                connect_if_merge(i, left)
+                helper[left] = i
+                merge_vertices.add(i)
+        elif prev_above:  # regular, interior to the right
+            connect_if_merge(i, prev_edge)
+            remove(prev_edge)
+            helper[i] = i
+            insert(i)
+        else:  # regular, interior to the left
+            left = edge_left_of(i)
+            connect_if_merge(i, left)
+            helper[left] = i
+    return diagonals
 
 
 class MonotonePartitioningApp:
@@ -20,94 +127,59 @@ class MonotonePartitioningApp:
         self.origin_y = self.canvas_height - self.padding
 
     def draw_monotone_partitioning(self):
-        vertices = sorted(self.dcel.vertices, key=lambda v: v.y, reverse=True)
-        vertex_types = self.dcel.find_vertices()
-        for vertex in vertices:
-            if vertex in vertex_types["min_cusp_vertices"]:
-                self.handle_min_cusp(vertex)
-            elif vertex in vertex_types["max_cusp_vertices"]:
-                self.handle_max_cusp(vertex)
+        # One helper-based sweep finds every diagonal; for polygons with
+        # holes the hole-bridging diagonals are inserted before the splitting
+        # ones, so that each split happens in a face without holes.
+        rings = self.dcel.rings
+        if self.dcel.orientation() < 0:
+            # monotone_diagonals wants the interior on the left of each ring
+            rings = [ring[::-1] for ring in rings]
+        ring_vertices = [v for ring in rings for v in ring]
+        ring_of = {}
+        for k, ring in enumerate(rings):
+            for v in ring:
+                ring_of[v] = k
+        diagonals = [
+            (ring_vertices[i], ring_vertices[j])
+            for i, j in monotone_diagonals([[(v.x, v.y) for v in ring] for ring in rings])
+        ]
+
+        by_vertex = {}
+        for v1, v2 in diagonals:
+            by_vertex.setdefault(v1, []).append(v2)
+        for vertex in sorted(self.dcel.vertices, key=lambda v: (-v.y, v.x)):
+            for other in by_vertex.get(vertex, []):
+                self.draw_diagonal_line(vertex, other)
             self.trapezoidal_app.remove_horizontal_line(vertex)
-            self.canvas.update()
-            time.sleep(0.4)
-
-    def handle_min_cusp(self, vertex):
-        supporting_vertex_below = self.find_supporting_vertex_below(vertex)
-        if supporting_vertex_below:
-            self.draw_diagonal(vertex, supporting_vertex_below)
-
-    def handle_max_cusp(self, vertex):
-        supporting_vertex_above = self.find_supporting_vertex_above(vertex)
-        if supporting_vertex_above:
-            self.draw_diagonal(vertex, supporting_vertex_above)
-
-    def find_supporting_vertex_below(self, vertex):
-        vertices_below = sorted(
-            [v for v in self.dcel.vertices if v.y < vertex.y],
-            key=lambda v: v.y,
-            reverse=True,
-        )
-        for v in vertices_below:
-            if self.is_visible(vertex, v):
-                return v
-        return None
-
-    def find_supporting_vertex_above(self, vertex):
-        vertices_above = sorted(
-            [v for v in self.dcel.vertices if v.y > vertex.y], key=lambda v: v.y
-        )
-        for v in vertices_above:
-            if self.is_visible(vertex, v):
-                return v
-        return None
-
-    def is_visible(self, vertex1, vertex2):
-        for i in range(len(self.dcel.vertices)):
-            start_vertex = self.dcel.vertices[i]
-            end_vertex = self.dcel.vertices[(i + 1) % len(self.dcel.vertices)]
-            if (
-                vertex1 != start_vertex
-                and vertex1 != end_vertex
-                and vertex2 != start_vertex
-                and vertex2 != end_vertex
-            ):
-                if self.segments_intersect(vertex1, vertex2, start_vertex, end_vertex):
-                    return False
-        return True
-
-    def segments_intersect(self, p1, p2, p3, p4):
-        def orientation(p, q, r):
-            val = (q.y - p.y) * (r.x - q.x) - (q.x - p.x) * (r.y - q.y)
-            if val == 0:
-                return 0
-            return 1 if val > 0 else 2
-
-        def on_segment(p, q, r):
-            return (
-                q.x <= max(p.x, r.x)
-                and q.x >= min(p.x, r.x)
-                and q.y <= max(p.y, r.y)
-                and q.y >= min(p.y, r.y)
-            )
-
-        o1 = orientation(p1, p2, p3)
-        o2 = orientation(p1, p2, p4)
-        o3 = orientation(p3, p4, p1)
-        o4 = orientation(p3, p4, p2)
-
-        if o1 != o2 and o3 != o4:
-            return True
-        if o1 == 0 and on_segment(p1, p3, p2):
-            return True
-        if o2 == 0 and on_segment(p1, p4, p2):
-            return True
-        if o3 == 0 and on_segment(p3, p1, p4):
-            return True
-        if o4 == 0 and on_segment(p3, p2, p4):
-            return True
-        return False
-
-    def draw_diagonal(self, vertex1, vertex2):
+            pause(self.canvas)
+
+        parent = list(range(len(rings)))
+
+        def find(k):
+            while parent[k] != k:
+                parent[k] = parent[parent[k]]
+                k = parent[k]
+            return k
+
+        bridges = []
+        splits = []
+        for v1, v2 in diagonals:
+            r1, r2 = find(ring_of[v1]), find(ring_of[v2])
+            if r1 != r2:
+                parent[r1] = r2
+                bridges.append((v1, v2))
+            else:
+                splits.append((v1, v2))
+        for v1, v2 in bridges + splits:
+            self.dcel.add_diagonal(v1, v2)
+
+    def skip_partitioning(self):
+        # The polygon is already monotone (or gets a fan triangulation), so
+        # only the trapezoidalisation helper lines need to go.
+        self.trapezoidal_app.reset_canvas()
+        self.canvas.update()
+
+    def draw_diagonal_line(self, vertex1, vertex2):
         x1, y1 = vertex1.x, vertex1.y
         x2, y2 = vertex2.x, vertex2.y
 
@@ -124,7 +196,6 @@ class MonotonePartitioningApp:
             fill="#808080",
             dash=(4, 3),
         )
-        self.dcel.add_diagonal(vertex1, vertex2)
 
     def draw_diagonal_only(self, vertex1, vertex2):
         x1, y1 = vertex1.x, vertex1.y
@@ -143,5 +214,4 @@ class MonotonePartitioningApp:
             fill="#808080",
             dash=(4, 3),
         )
-        self.canvas.update()
-        time.sleep(0.4)
+        pause(self.canvas)
@@ -6,8 +6,15 @@
 # triangulation, dual graph, three-coloring, and vertex guards.
 #
 
+import time
 from typing import Optional
 
+import animation as animation_module
+import dcel as dcel_module
+import metrics as metrics_module
+import profiling as profiling_module
+import convex_partition as convex_partition_module
+import fast_paths as fast_paths_module
 import generate_polygon as generate_polygon_module
 import trapezoidalisation as trapezoidalisation_module
 import monotone_partitioning as monotone_partitioning_module
@@ -15,6 +22,21 @@ import triangulation as triangulation_module
 import dual_graph as dual_graph_module
 import three_coloring as three_coloring_module
 import vertex_guards as vertex_guards_module
+import guard_minimization as guard_minimization_module
+
+
+# Stage graph: each stage lists the stages whose outputs it reads.
+STAGE_DEPENDENCIES = {
+    "polygon": (),
+    "trapezoidalisation": ("polygon",),
+    "monotone_partitioning": ("trapezoidalisation",),
+    "triangulation": ("monotone_partitioning",),
+    "convex_partition": ("triangulation",),
+    "dual_graph": ("triangulation",),
+    "three_coloring": ("dual_graph",),
+    "vertex_guards": ("three_coloring",),
+    "minimize_guards": ("polygon",),
+}
 
 
 class ArtGalleryPipeline:
@@ -22,11 +44,50 @@ class ArtGalleryPipeline:
 
     This class composes the existing modules into a cohesive pipeline while
     keeping their internal logic unchanged.
+
+    Steps form a memoized dependency graph (``STAGE_DEPENDENCIES``). A step
+    whose output is still valid returns immediately; otherwise it first
+    computes any missing upstream stage. Loading or generating a polygon, or
+    calling a step with different parameters, invalidates the affected stage
+    and everything downstream.
+
+    Monotone partitioning and triangulation add their diagonals to the
+    polygon's DCEL under a ``dcel.Journal`` checkpoint instead of copying it,
+    so the DCEL shows the latest of these stages and invalidating one rolls
+    its diagonals back. The convex partition removes diagonals, so it works
+    on a copy: the triangulation stays readable next to it.
+
+    ``step_back`` undoes the latest stage and ``step_forward`` restores it
+    without recomputing, so a UI can go back and forth between stages.
+
+    With ``fast_paths`` off, y-monotone and kernel-vertex polygons are not
+    special-cased: every stage runs the full DCEL algorithm.
+
+    Animation waits go through ``clock`` (an ``animation.AnimationClock``),
+    which is per pipeline rather than process-wide. A ``profiling.Profiler``
+    records the time, memory and counters of each stage computed. Stage
+    latencies, memo hits and polygon sizes always go to ``metrics.REGISTRY``.
+
+    With an ``animation.RecordingCanvas`` the stages compute at full speed and
+    each one leaves its drawing log in ``event_logs`` for an
+    ``animation.AnimationPlayer`` to replay.
     """
 
-    def __init__(self, canvas):
+    def __init__(
+        self,
+        canvas,
+        clock: Optional[animation_module.AnimationClock] = None,
+        profiler: Optional[profiling_module.Profiler] = None,
+        fast_paths: bool = True,
+    ):
         self.canvas = canvas
+        self.profiler = profiler
+        self.fast_paths = fast_paths
+        # Frame pacing for every step drawing on this canvas
+        self.clock = clock or animation_module.AnimationClock()
+        self.canvas.clock = self.clock
         self.polygon_app: Optional[generate_polygon_module.GeneratePolygonApp] = None
+        self.shape: Optional[fast_paths_module.PolygonShape] = None
         self.trapezoidal_app: Optional[
             trapezoidalisation_module.TrapezoidalisationApp
         ] = None
@@ -34,77 +95,399 @@ class ArtGalleryPipeline:
             monotone_partitioning_module.MonotonePartitioningApp
         ] = None
         self.triangulation_app: Optional[triangulation_module.TriangulationApp] = None
+        self.convex_partition_app: Optional[
+            convex_partition_module.ConvexPartitionApp
+        ] = None
         self.dual_graph_app: Optional[dual_graph_module.DualGraphApp] = None
         self.three_coloring_app: Optional[three_coloring_module.ThreeColoringApp] = None
         self.vertex_guards_app: Optional[vertex_guards_module.VertexGuardsApp] = None
+        self.minimization: Optional[guard_minimization_module.MinimizationResult] = (
+            None
+        )
+        # stage -> (parameters, stages it was computed from)
+        self._completed = {}
+        # stage -> perf_counter() when its own work began
+        self._started = {}
+        # stage -> (DCEL, journal mark before the stage changed it)
+        self._marks = {}
+        # Stages undone by step_back, the most recent last
+        self._redo = []
+        # stage -> drawing events, when drawing to a RecordingCanvas
+        self.event_logs = {}
+        self._new_events = []
+        self._runners = {
+            "polygon": self._polygon_ready,
+            "trapezoidalisation": self.step_trapezoidalisation,
+            "monotone_partitioning": self.step_monotone_partitioning,
+            "triangulation": self.step_triangulation,
+            "convex_partition": self.step_convex_partition,
+            "dual_graph": self.step_dual_graph,
+            "three_coloring": self.step_three_coloring,
+            "vertex_guards": self.step_vertex_guards,
+            "minimize_guards": self.step_minimize_guards,
+        }
+
+    # Stage graph
+    def is_valid(self, stage: str) -> bool:
+        return stage in self._completed
+
+    def request(self, stage: str) -> bool:
+        """Make ``stage`` valid, computing only the upstream stages missing.
+
+        Stages that are already valid are reused as-is, so repeated requests
+        cost nothing and never draw or add diagonals twice.
+        """
+        return self._runners[stage]()
+
+    def invalidate(self, stage: str):
+        """Drop ``stage`` and, transitively, every stage computed from it."""
+        self._redo.clear()
+        if self._completed.pop(stage, None) is None:
+            return
+        self.event_logs.pop(stage, None)
+        self._roll_back(stage)
+        for other, (_, inputs) in list(self._completed.items()):
+            if stage in inputs:
+                self.invalidate(other)
+
+    def _is_current(self, stage, params=()) -> bool:
+        entry = self._completed.get(stage)
+        if entry is None and (stage, params) in ((s, e[0]) for s, e, _, _ in self._redo):
+            # Undone with step_back: restore it (and what was undone after it) as it was
+            while self.step_forward() != stage:
+                pass
+            entry = self._completed[stage]
+        if entry is not None and entry[0] == params:
+            metrics_module.STAGE_CACHE.labels(stage, "hit").inc()
+            return True
+        metrics_module.STAGE_CACHE.labels(stage, "miss").inc()
+        if entry is not None:
+            self.invalidate(stage)
+        return False
+
+    def _ensure(self, *stages) -> bool:
+        return all(self.is_valid(stage) or self.request(stage) for stage in stages)
+
+    def _begin(self, stage):
+        # Called once the upstream stages are ready, so a stage's profile only
+        # covers its own work.
+        self._redo.clear()
+        self._started[stage] = time.perf_counter()
+        if self.profiler is not None:
+            self.profiler.begin(stage)
+
+    def _abandon(self, stage):
+        # A stage that gave up after _begin: close its profile and timer
+        # without marking it valid.
+        if self.profiler is not None:
+            self.profiler.end(stage)
+        self._started.pop(stage, None)
+
+    def _complete(self, stage, params=(), inputs=None):
+        if self.profiler is not None:
+            self.profiler.end(stage)
+        started = self._started.pop(stage, None)
+        if started is not None:
+            metrics_module.STAGE_SECONDS.labels(stage).observe(time.perf_counter() - started)
+        if stage == "polygon":
+            metrics_module.POLYGON_VERTICES.observe(len(self.polygon_app.dcel.vertices))
+        if inputs is None:
+            inputs = STAGE_DEPENDENCIES[stage]
+        self._completed[stage] = (params, tuple(inputs))
+        take_events = getattr(self.canvas, "take_events", None)
+        if take_events is not None:
+            events = take_events()
+            self.event_logs[stage] = events
+            self._new_events.extend(events)
+
+    def take_new_events(self):
+        """Drawing events of the stages completed since the last call, in order."""
+        events, self._new_events = self._new_events, []
+        return events
+
+    def adopt_events(self, stage: str, events):
+        """Mark ``stage`` as computed elsewhere (e.g. by ``solve_pool``) and
+        take its drawing log.
+
+        Only the drawing is adopted: the stage's app object is not set, so
+        stages downstream of an adopted one must be adopted too.
+        """
+        self._redo.clear()
+        self._completed[stage] = ((), STAGE_DEPENDENCIES[stage])
+        self.event_logs[stage] = list(events)
+        self._new_events.extend(events)
+
+    # Journaled DCEL changes
+    def _journal(self, stage, dcel):
+        """Checkpoint ``dcel`` before ``stage`` changes it in place."""
+        self._roll_back(stage)  # leftovers of a failed or cancelled run
+        if dcel.journal is None:
+            dcel.journal = dcel_module.Journal()
+        self._marks[stage] = (dcel, dcel.journal.mark())
+        return dcel
+
+    def _roll_back(self, stage):
+        entry = self._marks.pop(stage, None)
+        if entry is None:
+            return None
+        dcel, mark = entry
+        # Marks taken after this one (e.g. by a failed later stage) are undone too.
+        for other, (other_dcel, other_mark) in list(self._marks.items()):
+            if other_dcel is dcel and other_mark >= mark:
+                del self._marks[other]
+        return dcel, dcel.journal.rollback(mark)
+
+    # Undo history
+    @property
+    def latest_stage(self) -> Optional[str]:
+        """The most recently completed stage that is still valid."""
+        return next(reversed(self._completed), None)
+
+    def can_step_back(self) -> bool:
+        return len(self._completed) > 1
+
+    def can_step_forward(self) -> bool:
+        return bool(self._redo)
+
+    def step_back(self) -> Optional[str]:
+        """Undo the latest stage (never the polygon) and return its name.
+
+        Its output is kept: the drawing log, the app object and, for stages
+        that changed the DCEL, the journal entries that redo the change, so
+        ``step_forward`` brings it back in time proportional to what the stage
+        changed. Requesting the stage again with the same parameters does the
+        same; computing anything new discards what was undone.
+        """
+        if not self.can_step_back():
+            return None
+        stage = self.latest_stage
+        entry = self._completed.pop(stage)
+        events = self.event_logs.pop(stage, None)
+        self._redo.append((stage, entry, events, self._roll_back(stage)))
+        return stage
+
+    def step_forward(self) -> Optional[str]:
+        """Restore the stage undone last; returns its name."""
+        if not self._redo:
+            return None
+        stage, entry, events, journaled = self._redo.pop()
+        if journaled is not None:
+            dcel, redo = journaled
+            self._marks[stage] = (dcel, dcel.journal.mark())
+            dcel.journal.replay(redo)
+        self._completed[stage] = entry
+        if events is not None:
+            self.event_logs[stage] = events
+            self._new_events.extend(events)
+        return stage
+
+    def rewind(self, stage: str) -> bool:
+        """Step back until ``stage`` is the latest stage."""
+        if not self.is_valid(stage):
+            return False
+        while self.latest_stage != stage:
+            self.step_back()
+        return True
+
+    # Fast paths
+    def _analyse_shape(self):
+        if self.fast_paths and self.polygon_app.points and not self.polygon_app.holes:
+            self.shape = fast_paths_module.analyse_polygon(self.polygon_app.points)
+        else:
+            self.shape = None
+
+    def _kernel_apex(self, dcel):
+        if not self.shape or self.shape.kernel_vertex is None:
+            return None
+        return dcel.vertices[self.shape.kernel_vertex]
 
     # Steps
-    def step_generate_polygon(self) -> bool:
+    def _new_polygon(self):
+        self.invalidate("polygon")
+        self._begin("polygon")
         self.polygon_app = generate_polygon_module.GeneratePolygonApp(self.canvas)
-        self.polygon_app.generate_polygon()
-        if not self.polygon_app or not self.polygon_app.dcel:
+        return self.polygon_app
+
+    def _polygon_ready(self) -> bool:
+        # The polygon is the input of the graph; it cannot be derived.
+        return self.is_valid("polygon")
+
+    def _polygon_loaded(self) -> bool:
+        # A cancelled dialog or rejected input leaves no vertices, and the
+        # polygon stage (with everything after it) invalid.
+        if not self.polygon_app.dcel.vertices:
+            self._abandon("polygon")
             return False
-        self.polygon_app.dcel.display()
+        self._analyse_shape()
+        self._complete("polygon")
         return True
 
+    def step_generate_polygon(self) -> bool:
+        self._new_polygon().generate_polygon()
+        if self.polygon_app.dcel.vertices:
+            self.polygon_app.dcel.display()
+        return self._polygon_loaded()
+
     def step_trapezoidalisation(self) -> bool:
-        if not self.polygon_app or not self.polygon_app.dcel:
+        if self._is_current("trapezoidalisation"):
+            return True
+        if not self._ensure("polygon"):
             return False
+        self._begin("trapezoidalisation")
         self.trapezoidal_app = trapezoidalisation_module.TrapezoidalisationApp(
             self.canvas, self.polygon_app.dcel, self.polygon_app
         )
         self.trapezoidal_app.draw_trapezoidalisation()
+        self._complete("trapezoidalisation")
         return True
 
     def step_monotone_partitioning(self) -> bool:
-        if not self.polygon_app or not self.polygon_app.dcel:
+        if self._is_current("monotone_partitioning"):
+            return True
+        if not self._ensure("trapezoidalisation"):
             return False
+        self._begin("monotone_partitioning")
+        dcel = self._journal("monotone_partitioning", self.polygon_app.dcel)
         self.monotone_app = monotone_partitioning_module.MonotonePartitioningApp(
-            self.canvas, self.polygon_app.dcel, self.trapezoidal_app
+            self.canvas, dcel, self.trapezoidal_app
         )
-        self.monotone_app.draw_monotone_partitioning()
+        if self.shape and (self.shape.y_monotone or self._kernel_apex(dcel) is not None):
+            self.monotone_app.skip_partitioning()
+        else:
+            self.monotone_app.draw_monotone_partitioning()
+        self._complete("monotone_partitioning")
         return True
 
     def step_triangulation(self) -> bool:
-        if not self.polygon_app or not self.polygon_app.dcel:
+        if self._is_current("triangulation"):
+            return True
+        if not self._ensure("monotone_partitioning"):
             return False
+        self._begin("triangulation")
+        dcel = self._journal("triangulation", self.monotone_app.dcel)
         self.triangulation_app = triangulation_module.TriangulationApp(
-            self.canvas, self.polygon_app.dcel, self.monotone_app
+            self.canvas, dcel, self.monotone_app
         )
-        self.triangulation_app.triangulate_polygon()
+        apex = self._kernel_apex(dcel)
+        if apex is not None and len(dcel.faces) == 1:
+            self.triangulation_app.fan_triangulate(apex)
+        else:
+            self.triangulation_app.triangulate_polygon()
+        self._complete("triangulation")
         return True
 
-    def step_dual_graph(self) -> bool:
-        if not self.polygon_app or not self.polygon_app.dcel:
+    def step_convex_partition(self) -> bool:
+        """Merge triangles into convex pieces on a copy of the triangulated DCEL.
+
+        The triangulation itself is kept for 3-coloring and guards.
+        """
+        if self._is_current("convex_partition"):
+            return True
+        if not self._ensure("triangulation"):
             return False
+        self._begin("convex_partition")
+        self.convex_partition_app = convex_partition_module.ConvexPartitionApp(
+            self.canvas, self.triangulation_app.dcel.copy(), self.triangulation_app
+        )
+        self.convex_partition_app.partition()
+        self._complete("convex_partition")
+        return True
+
+    def step_dual_graph(self, use_convex_partition: bool = False) -> bool:
+        params = (use_convex_partition,)
+        if self._is_current("dual_graph", params):
+            return True
+        inputs = ("triangulation",)
+        if use_convex_partition:
+            inputs += ("convex_partition",)
+        if not self._ensure(*inputs):
+            return False
+        self._begin("dual_graph")
+        dcel = self.triangulation_app.dcel
+        if use_convex_partition:
+            dcel = self.convex_partition_app.dcel
         self.dual_graph_app = dual_graph_module.DualGraphApp(
-            self.canvas, self.polygon_app.dcel, self.triangulation_app
+            self.canvas, dcel, self.triangulation_app
         )
         self.dual_graph_app.create_dual_graph()
+        self._complete("dual_graph", params, inputs)
         return True
 
-    def step_three_coloring(self) -> bool:
-        if not self.polygon_app or not self.polygon_app.dcel:
+    def step_three_coloring(self, start_face_index: int = 0) -> bool:
+        params = (start_face_index,)
+        if self._is_current("three_coloring", params):
+            return True
+        dual_graph = self._completed.get("dual_graph")
+        if dual_graph is not None and dual_graph[0] == (True,):
+            # The convex pieces' dual graph is shown: coloring needs the triangles'
+            self.invalidate("dual_graph")
+        if not self._ensure("dual_graph"):
             return False
+        self._begin("three_coloring")
         self.three_coloring_app = three_coloring_module.ThreeColoringApp(
-            self.canvas, self.polygon_app.dcel, self.dual_graph_app
+            self.canvas,
+            self.triangulation_app.dcel,
+            self.dual_graph_app,
+            start_face_index,
         )
         self.three_coloring_app.three_color_triangulation()
+        self._complete("three_coloring", params)
         return True
 
     # Convenience for web UI
     def step_generate_polygon_with_n(self, n: int) -> bool:
-        self.polygon_app = generate_polygon_module.GeneratePolygonApp(self.canvas)
-        self.polygon_app.generate_polygon_with_n(n)
-        if not self.polygon_app or not self.polygon_app.dcel:
-            return False
-        return True
+        self._new_polygon().generate_polygon_with_n(n)
+        return self._polygon_loaded()
+
+    def step_load_polygon(self, points, holes=()) -> bool:
+        self._new_polygon().load_polygon(points, holes)
+        return self._polygon_loaded()
 
     def step_vertex_guards(self) -> bool:
-        if not self.polygon_app or not self.polygon_app.dcel:
+        if self._is_current("vertex_guards"):
+            return True
+        if not self._ensure("three_coloring"):
             return False
+        self._begin("vertex_guards")
         self.vertex_guards_app = vertex_guards_module.VertexGuardsApp(
-            self.canvas, self.polygon_app.dcel, self.three_coloring_app
+            self.canvas, self.triangulation_app.dcel, self.three_coloring_app
         )
         self.vertex_guards_app.decide_vertex_guards()
+        self._complete("vertex_guards")
+        return True
+
+    def step_minimize_guards(
+        self, trials: int = 8, seed: int = 0, time_budget: Optional[float] = None
+    ) -> bool:
+        """Try ``trials`` randomized variants and draw the smallest guard set."""
+        params = (trials, seed, time_budget)
+        if self._is_current("minimize_guards", params):
+            return True
+        if not self._ensure("polygon"):
+            return False
+        self._begin("minimize_guards")
+        try:
+            self.minimization = guard_minimization_module.minimize_guards(
+                self.polygon_app.points,
+                trials,
+                seed,
+                time_budget,
+                holes=self.polygon_app.holes,
+            )
+        except Exception:
+            self._abandon("minimize_guards")
+            raise
+        if self.minimization.best is None:
+            self._abandon("minimize_guards")
+            return False
+
+        self.canvas.delete("all")
+        self.polygon_app.draw_axes()
+        self.polygon_app.draw_polygon_without_delay()
+        guards_app = vertex_guards_module.VertexGuardsApp(
+            self.canvas, self.polygon_app.dcel, None
+        )
+        for index in self.minimization.best.guards:
+            guards_app.draw_guard_vertex(self.polygon_app.dcel.vertices[index], None)
+        self._complete("minimize_guards", params)
         return True
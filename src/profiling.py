@@ -0,0 +1,220 @@
+# Per-stage timing, memory and hot-path counters for the pipeline.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# profiling.py - Profiler attached to ArtGalleryPipeline: wall/CPU time and tracemalloc peak
+# per stage, counters bumped from the algorithms, JSON report and Chrome trace export.
+
+# Only the counter hook is needed by the algorithms, so nothing beyond it is
+# imported here: tracemalloc, json and argparse load when a profiler or the
+# command line needs them.
+import time
+from collections import Counter
+
+# Counter names used by the algorithms
+ORIENTATION_TESTS = "orientation_tests"
+SEGMENTS_INTERSECT = "segments_intersect"
+ADD_DIAGONAL = "add_diagonal"
+FACES_WALKED = "faces_walked"
+
+# Profiler whose stage is running, if any; count() is a no-op otherwise.
+_active = None
+
+
+def count(name: str, n: int = 1):
+    """Bump counter ``name`` of the stage being profiled (cheap when none is)."""
+    if _active is not None:
+        _active.current.counters[name] += n
+
+
+class StageProfile:
+    def __init__(self, name: str, start: float):
+        self.name = name
+        self.start = start  # seconds since the profiler was created
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak_bytes = None  # tracemalloc peak above the stage's start
+        self.counters = Counter()
+
+
+class Profiler:
+    """Records one ``StageProfile`` per pipeline stage computed while attached.
+
+    Pass it to ``ArtGalleryPipeline(..., profiler=...)`` (or
+    ``headless.solve_polygon(..., profiler=...)``). Each stage records its own
+    work only, never that of the upstream stages it had to compute first.
+    ``memory=True`` traces allocations with ``tracemalloc``, which slows the
+    algorithms down severalfold; timings are more faithful without it.
+    Counters are process-wide while a stage runs, so profile one pipeline at
+    a time per process.
+    """
+
+    def __init__(self, memory: bool = True):
+        self.memory = memory
+        self._tracemalloc = None
+        if memory:
+            import tracemalloc
+
+            self._tracemalloc = tracemalloc
+        self.stages = []  # finished StageProfile objects, in order
+        self.current = None  # StageProfile of the running stage
+        self._origin = time.perf_counter()
+        self._cpu_start = 0.0
+        self._memory_start = 0
+        self._started_tracing = False
+
+    # Stage hooks (called by the pipeline)
+    def begin(self, stage: str):
+        global _active
+        if self.current is not None:
+            self.end(self.current.name)  # a stage that failed half way
+        self.current = StageProfile(stage, time.perf_counter() - self._origin)
+        if self.memory:
+            tracemalloc = self._tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+        self._cpu_start = time.process_time()
+        _active = self
+
+    def end(self, stage: str):
+        global _active
+        current = self.current
+        if current is None or current.name != stage:
+            return
+        current.cpu = time.process_time() - self._cpu_start
+        current.wall = time.perf_counter() - self._origin - current.start
+        if self.memory:
+            peak = self._tracemalloc.get_traced_memory()[1]
+            current.peak_bytes = max(peak - self._memory_start, 0)
+        self.stages.append(current)
+        self.current = None
+        if _active is self:
+            _active = None
+
+    def close(self):
+        """Drop a stage left unfinished (by an exception) and stop tracemalloc
+        if this profiler started it."""
+        global _active
+        self.current = None
+        if _active is self:
+            _active = None
+        if self._started_tracing:
+            self._tracemalloc.stop()
+            self._started_tracing = False
+
+    # Reports
+    @property
+    def counters(self) -> Counter:
+        total = Counter()
+        for stage in self.stages:
+            total.update(stage.counters)
+        return total
+
+    def report(self) -> dict:
+        return {
+            "stages": [
+                {
+                    "name": stage.name,
+                    "wall_ms": 1000.0 * stage.wall,
+                    "cpu_ms": 1000.0 * stage.cpu,
+                    "peak_kib": None if stage.peak_bytes is None else stage.peak_bytes / 1024.0,
+                    "counters": dict(stage.counters),
+                }
+                for stage in self.stages
+            ],
+            "total_wall_ms": 1000.0 * sum(stage.wall for stage in self.stages),
+            "total_cpu_ms": 1000.0 * sum(stage.cpu for stage in self.stages),
+            "counters": dict(self.counters),
+        }
+
+    def trace_events(self) -> list:
+        """Chrome trace events: a complete ("X") event per stage, plus a
+        counter ("C") event with the running counter totals at its end."""
+        import os
+        import threading
+
+        pid = os.getpid()
+        tid = threading.get_ident()
+        events = []
+        running = Counter()
+        for stage in self.stages:
+            start_us = 1e6 * stage.start
+            events.append(
+                {
+                    "name": stage.name,
+                    "cat": "stage",
+                    "ph": "X",
+                    "ts": start_us,
+                    "dur": 1e6 * stage.wall,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {
+                        "cpu_ms": 1000.0 * stage.cpu,
+                        "peak_kib": None if stage.peak_bytes is None else stage.peak_bytes / 1024.0,
+                        **stage.counters,
+                    },
+                }
+            )
+            running.update(stage.counters)
+            events.append(
+                {
+                    "name": "counters",
+                    "ph": "C",
+                    "ts": start_us + 1e6 * stage.wall,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": dict(running),
+                }
+            )
+        return events
+
+    def write_json(self, path: str):
+        import json
+
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.report(), fh, indent=2)
+
+    def write_chrome_trace(self, path: str):
+        """Write a file for chrome://tracing or https://ui.perfetto.dev."""
+        import json
+
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, fh)
+
+
+def main(argv=None):
+    import argparse
+    import json
+    import sys
+
+    import batch_solve as batch_solve_module
+    import headless as headless_module
+
+    parser = argparse.ArgumentParser(description="Profile the pipeline on one polygon")
+    parser.add_argument("input", nargs="?", default="-", help="Polygon in the --solve line format (default: stdin)")
+    parser.add_argument("--json", help="Write the report to this file")
+    parser.add_argument("--trace", help="Write a Chrome trace-event file")
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc (faster, truer timings)")
+    args = parser.parse_args(argv)
+
+    text = sys.stdin.read() if args.input == "-" else open(args.input, encoding="utf-8").read()
+    request = batch_solve_module.parse_request(text)
+    profiler = Profiler(memory=not args.no_memory)
+    try:
+        headless_module.solve_polygon(
+            request["points"], holes=request["holes"], profiler=profiler, **request["options"]
+        )
+    finally:
+        profiler.close()
+    print(json.dumps(profiler.report(), indent=2))
+    if args.json:
+        profiler.write_json(args.json)
+    if args.trace:
+        profiler.write_chrome_trace(args.trace)
+
+
+if __name__ == "__main__":
+    main()
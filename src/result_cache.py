@@ -0,0 +1,266 @@
+# Content-addressed cache of headless solve results.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# result_cache.py - In-memory LRU tier plus an on-disk JSON snapshot tier in front of solve_polygon.
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import headless as headless_module
+import metrics as metrics_module
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    memory_evictions: int = 0
+    disk_evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def canonicalize(points, holes=()):
+    """Rotate the outer ring so its lexicographically smallest vertex is first.
+
+    Returns the canonical outer ring, the holes as floats, and the shift such
+    that canonical index ``k`` is caller index ``(k + shift) % n``.
+    """
+    outer = [(float(x), float(y)) for x, y in points]
+    shift = min(range(len(outer)), key=lambda i: outer[i])
+    canonical = outer[shift:] + outer[:shift]
+    canonical_holes = [[(float(x), float(y)) for x, y in hole] for hole in holes]
+    return canonical, canonical_holes, shift
+
+
+def cache_key(points, holes=(), **options) -> str:
+    canonical, canonical_holes, _ = canonicalize(points, holes)
+    payload = json.dumps(
+        {"points": canonical, "holes": canonical_holes, "options": options},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def remap_result(result, shift, points, holes=()):
+    """Copy ``result`` with outer-ring indices shifted back to caller order."""
+    n = len(result.points)
+
+    def caller_index(i):
+        return (i + shift) % n if i < n else i
+
+    return headless_module.SolveResult(
+        points=[tuple(p) for p in points],
+        holes=[[tuple(p) for p in hole] for hole in holes],
+        triangles=[tuple(caller_index(i) for i in t) for t in result.triangles],
+        colors={caller_index(i): color for i, color in result.colors.items()},
+        guards=sorted(caller_index(i) for i in result.guards),
+        guard_points=list(result.guard_points),
+        convex_pieces=[
+            [caller_index(i) for i in piece] for piece in result.convex_pieces
+        ],
+    )
+
+
+def estimated_size(result) -> int:
+    # Rough in-memory footprint: a few machine words per stored number.
+    numbers = (
+        2 * len(result.points)
+        + 3 * len(result.triangles)
+        + 2 * len(result.colors)
+        + len(result.guards)
+        + 2 * len(result.guard_points)
+        + sum(len(piece) for piece in result.convex_pieces)
+        + sum(2 * len(hole) for hole in result.holes)
+    )
+    return 256 + 32 * numbers
+
+
+class ResultCache:
+    """Two-tier cache keyed by the hash of the canonical polygon and options.
+
+    The memory tier is an LRU bounded by ``max_memory_bytes`` (estimated);
+    the optional disk tier keeps one JSON snapshot per key under ``disk_dir``
+    and evicts least recently used files beyond ``max_disk_bytes``. Hits are
+    returned without running any algorithm.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        disk_dir=None,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = CacheStats()
+        self._memory = OrderedDict()  # key -> (result, size)
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            for name in os.listdir(disk_dir):
+                if name.endswith(".json"):
+                    self._disk_bytes += os.path.getsize(os.path.join(disk_dir, name))
+
+    # Public API
+    def solve(self, points, holes=(), **options):
+        """Return the cached result for this polygon, solving it on a miss."""
+        result = self.lookup(points, holes, **options)
+        if result is None:
+            result = headless_module.solve_polygon(points, holes=holes, **options)
+            self.store(points, holes, result, **options)
+        return result
+
+    def lookup(self, points, holes=(), **options):
+        """The cached result for this polygon in the caller's vertex order, or None.
+
+        For callers that solve elsewhere (a process pool) and ``store`` the
+        result once it arrives.
+        """
+        _, _, shift = canonicalize(points, holes)
+        result = self.get(cache_key(points, holes, **options))
+        if result is None:
+            return None
+        return remap_result(result, shift, points, holes)
+
+    def store(self, points, holes, result, **options):
+        """Cache ``result``, whose indices follow the caller's ``points``."""
+        canonical, canonical_holes, shift = canonicalize(points, holes)
+        self.put(
+            cache_key(points, holes, **options),
+            remap_result(result, -shift, canonical, canonical_holes),
+        )
+
+    def get(self, key):
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.stats.hits += 1
+                self.stats.memory_hits += 1
+                metrics_module.RESULT_CACHE.labels("hit").inc()
+                return entry[0]
+
+        result = self._read_disk(key)
+        with self._lock:
+            if result is None:
+                self.stats.misses += 1
+                metrics_module.RESULT_CACHE.labels("miss").inc()
+                return None
+            self.stats.hits += 1
+            self.stats.disk_hits += 1
+            metrics_module.RESULT_CACHE.labels("hit").inc()
+            self._remember(key, result)
+        return result
+
+    def put(self, key, result):
+        with self._lock:
+            self._remember(key, result)
+        if self.disk_dir:
+            self._write_disk(key, result)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    # Memory tier
+    def _remember(self, key, result):
+        if key in self._memory:
+            self._memory_bytes -= self._memory.pop(key)[1]
+        size = estimated_size(result)
+        self._memory[key] = (result, size)
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            _, (_, evicted_size) = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted_size
+            self.stats.memory_evictions += 1
+
+    # Disk tier
+    def _path(self, key):
+        return os.path.join(self.disk_dir, key + ".json")
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        try:
+            result = headless_module.SolveResult.from_dict(data)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            # Valid JSON but not a snapshot (truncated by hand, older layout):
+            # a miss, and the file goes so the next solve rewrites it.
+            self._remove_disk(path)
+            return None
+        try:
+            os.utime(path)  # mark as recently used for eviction
+        except OSError:
+            pass
+        return result
+
+    def _remove_disk(self, path):
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            self._disk_bytes -= size
+
+    def _write_disk(self, key, result):
+        path = self._path(key)
+        data = json.dumps(result.to_dict(), separators=(",", ":")).encode("utf-8")
+        tmp_path = "%s.%d.tmp" % (path, threading.get_ident())
+        try:
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(tmp_path, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        with self._lock:
+            self._disk_bytes += len(data) - old_size
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk(keep=path)
+
+    def _evict_disk(self, keep):
+        entries = []
+        for name in os.listdir(self.disk_dir):
+            if name.endswith(".json"):
+                path = os.path.join(self.disk_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, path, stat.st_size))
+        entries.sort()
+        self._disk_bytes = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._disk_bytes -= size
+            self.stats.disk_evictions += 1
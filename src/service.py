@@ -0,0 +1,419 @@
+# Local HTTP/JSON solve service.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# service.py - asyncio HTTP server exposing POST /solve over the headless pipeline, with a
+# bounded request queue, a process pool for the solving, timeouts and 429 backpressure.
+# GET /metrics serves the process's metrics registry in the Prometheus text format.
+
+import argparse
+import asyncio
+import functools
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Optional
+
+import batch_solve as batch_solve_module
+import headless as headless_module
+import metrics as metrics_module
+import profiling as profiling_module
+import result_cache as result_cache_module
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    429: "Too Many Requests",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+MAX_HEADER_LINES = 100
+
+
+@dataclass
+class ServiceConfig:
+    host: str = "127.0.0.1"
+    port: int = 8080
+    workers: Optional[int] = None  # solver processes (default: one per CPU)
+    queue_size: int = 64  # requests waiting for a solver; more get 429
+    timeout: float = 30.0  # seconds from arrival to answer; later gets 504
+    max_body_bytes: int = 8 * 1024 * 1024
+    cache_bytes: int = 64 * 1024 * 1024  # in-memory result cache, 0 disables it
+    cache_dir: Optional[str] = None  # on-disk result cache tier
+
+
+@dataclass
+class ServiceStats:
+    accepted: int = 0
+    rejected: int = 0  # 429
+    timed_out: int = 0  # 504
+    completed: int = 0
+    failed: int = 0  # 422
+    cached: int = 0  # answered from the result cache
+
+
+@dataclass
+class _Job:
+    request: dict
+    future: asyncio.Future
+    queued_at: float = field(default_factory=time.perf_counter)
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+def solve_request(request: dict):
+    """Solve one parsed request (runs in a solver process).
+
+    Returns the ``SolveResult`` and its timings: metrics recorded in the
+    solver process would never reach the service's registry.
+    """
+    start = time.perf_counter()
+    profiler = profiling_module.Profiler(memory=False)
+    try:
+        result = headless_module.solve_polygon(
+            request["points"], holes=request["holes"], profiler=profiler, **request["options"]
+        )
+    finally:
+        profiler.close()
+    timings = {
+        "solve": time.perf_counter() - start,
+        "stages": {stage.name: stage.wall for stage in profiler.stages},
+    }
+    return result, timings
+
+
+class SolveService:
+    """Serves ``POST /solve`` (and ``GET /health``, ``GET /metrics``) on
+    ``config.host:port``.
+
+    The request body is one polygon in the ``main.py --solve`` line format.
+    Parsed requests wait in a queue of ``queue_size`` for one of ``workers``
+    dispatchers, each feeding a process of the pool, so the event loop never
+    runs the geometry. A full queue answers 429 with ``Retry-After`` at once,
+    and a request not answered within ``timeout`` seconds gets 504. A request
+    whose solver process dies gets 503, and the broken pool is replaced by a
+    fresh one for the requests after it. A solver process cannot be stopped
+    mid-solve, so a request that times out while running keeps its dispatcher
+    (and counts as running) until the solver finishes; its result is still
+    cached.
+
+    Results are kept in a ``result_cache.ResultCache`` owned by the service
+    process and looked up and stored on the loop's default thread pool; a
+    request already answered skips the queue and the solvers.
+    """
+
+    def __init__(self, config: Optional[ServiceConfig] = None):
+        self.config = config or ServiceConfig()
+        self.workers = self.config.workers or os.cpu_count() or 1
+        self.stats = ServiceStats()
+        self.cache = None
+        if self.config.cache_bytes > 0:
+            self.cache = result_cache_module.ResultCache(
+                self.config.cache_bytes, self.config.cache_dir
+            )
+        self.running = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Spawned workers: a forked one would inherit the open client sockets,
+        # and a closed connection would never reach EOF while it runs.
+        self._context = multiprocessing.get_context("spawn")
+        self._dispatchers = []
+        self._server = None
+
+    # Lifecycle
+    async def start(self):
+        self._queue = asyncio.Queue(maxsize=self.config.queue_size)
+        self._pool()
+        self._dispatchers = [
+            asyncio.create_task(self._dispatch()) for _ in range(self.workers)
+        ]
+        metrics_module.QUEUE_DEPTH.labels("service").set_function(
+            lambda: self._queue.qsize() + self.running
+        )
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.config.host, self.config.port
+        )
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # Solving
+    async def _run_cache(self, method, *args, **kwargs):
+        # Hashing and disk reads stay off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(method, *args, **kwargs))
+
+    async def solve(self, request: dict) -> dict:
+        if self.cache is not None:
+            start = time.perf_counter()
+            result = await self._run_cache(
+                self.cache.lookup, request["points"], request["holes"], **request["options"]
+            )
+            if result is not None:
+                self.stats.accepted += 1
+                self.stats.completed += 1
+                self.stats.cached += 1
+                fields = batch_solve_module.result_fields(result)
+                fields["timings"] = {"cache": time.perf_counter() - start}
+                return fields
+        job = _Job(request, asyncio.get_running_loop().create_future())
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.stats.rejected += 1
+            raise HttpError(429, "Solve queue is full", {"Retry-After": "1"})
+        self.stats.accepted += 1
+        try:
+            # Cancels the job on timeout: a dispatcher skips it if still queued,
+            # and a running one holds its dispatcher until the solver returns.
+            return await asyncio.wait_for(job.future, self.config.timeout)
+        except asyncio.TimeoutError:
+            self.stats.timed_out += 1
+            raise HttpError(504, "Solve timed out after %gs" % self.config.timeout)
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            if job.future.done():
+                continue
+            self.running += 1
+            executor = self._pool()
+            try:
+                try:
+                    pending = loop.run_in_executor(executor, solve_request, job.request)
+                except BrokenProcessPool:
+                    # Broken while solving an earlier request: start a fresh pool.
+                    executor = self._replace_pool(executor)
+                    pending = loop.run_in_executor(executor, solve_request, job.request)
+                result, timings = await pending
+            except BrokenProcessPool:
+                # This request's solver died (e.g. killed for memory); the
+                # requests after it get a fresh pool.
+                self._replace_pool(executor)
+                self.stats.failed += 1
+                if not job.future.done():
+                    job.future.set_exception(HttpError(503, "Solver process died"))
+            except Exception as exc:
+                self.stats.failed += 1
+                if not job.future.done():
+                    job.future.set_exception(
+                        HttpError(422, "%s: %s" % (type(exc).__name__, exc))
+                    )
+            else:
+                self.stats.completed += 1
+                for stage, seconds in timings["stages"].items():
+                    metrics_module.STAGE_SECONDS.labels(stage).observe(seconds)
+                request = job.request
+                if self.cache is not None:
+                    await self._run_cache(
+                        self.cache.store,
+                        request["points"],
+                        request["holes"],
+                        result,
+                        **request["options"],
+                    )
+                fields = batch_solve_module.result_fields(result)
+                fields["timings"] = timings
+                timings["queued"] = time.perf_counter() - job.queued_at
+                if not job.future.done():
+                    job.future.set_result(fields)
+            finally:
+                self.running -= 1
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=self._context
+            )
+        return self._executor
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        # Several dispatchers can see the same broken pool; only the first
+        # one replaces it.
+        if self._executor is broken:
+            self._executor = None
+            broken.shutdown(wait=False, cancel_futures=True)
+        return self._pool()
+
+    def health(self) -> dict:
+        return {
+            "status": "ok",
+            "workers": self.workers,
+            "queued": self._queue.qsize(),
+            "running": self.running,
+            **vars(self.stats),
+        }
+
+    # HTTP
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                keep_alive = await self._handle_request(reader, writer)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, reader, writer) -> bool:
+        request_line = await reader.readline()
+        if not request_line:
+            return False
+        try:
+            method, path, version = request_line.decode("latin-1").split()
+        except ValueError:
+            await self._respond(writer, 400, {"error": "Malformed request line"}, False)
+            return False
+
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            await self._respond(writer, 431, {"error": "Too many headers"}, False)
+            return False
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" and (version != "HTTP/1.0" or connection == "keep-alive")
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            length = -1
+        if length < 0 or length > self.config.max_body_bytes:
+            await self._respond(writer, 413 if length > 0 else 400, {"error": "Bad body length"}, False)
+            return False
+        body = await reader.readexactly(length) if length else b""
+
+        start = time.perf_counter()
+        path = path.split("?", 1)[0]
+        try:
+            status, payload = await self._route(method, path, body)
+            extra = {}
+        except HttpError as exc:
+            status, payload, extra = exc.status, {"error": str(exc)}, exc.headers
+        except Exception as exc:
+            status, payload, extra = 500, {"error": "%s: %s" % (type(exc).__name__, exc)}, {}
+        if path == "/solve":
+            metrics_module.REQUESTS.labels("service", status).inc()
+            metrics_module.REQUEST_SECONDS.labels("service").observe(time.perf_counter() - start)
+        await self._respond(writer, status, payload, keep_alive, extra)
+        return keep_alive
+
+    async def _route(self, method, path, body):
+        if path == "/health":
+            if method != "GET":
+                raise HttpError(405, "Use GET")
+            return 200, self.health()
+        if path == "/metrics":
+            if method != "GET":
+                raise HttpError(405, "Use GET")
+            return 200, metrics_module.REGISTRY.render()
+        if path != "/solve":
+            raise HttpError(404, "Unknown path")
+        if method != "POST":
+            raise HttpError(405, "Use POST")
+        try:
+            request = batch_solve_module.parse_request(body.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError, TypeError) as exc:
+            raise HttpError(400, "%s: %s" % (type(exc).__name__, exc))
+        metrics_module.POLYGON_VERTICES.observe(
+            len(request["points"]) + sum(len(hole) for hole in request["holes"])
+        )
+        fields = await self.solve(request)
+        return 200, {"id": request["id"], "ok": True, **fields}
+
+    async def _respond(self, writer, status, payload, keep_alive, headers=None):
+        if isinstance(payload, str):  # already rendered text (the metrics)
+            body, content_type = payload.encode("utf-8"), metrics_module.CONTENT_TYPE
+        else:
+            body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+            content_type = "application/json"
+        lines = [
+            "HTTP/1.1 %d %s" % (status, REASONS.get(status, "")),
+            "Content-Type: %s" % content_type,
+            "Content-Length: %d" % len(body),
+            "Connection: %s" % ("keep-alive" if keep_alive else "close"),
+        ]
+        lines += ["%s: %s" % item for item in (headers or {}).items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+
+async def serve(config: ServiceConfig):
+    service = SolveService(config)
+    host, port = await service.start()
+    print("Solve service on http://%s:%d (%d workers)" % (host, port, service.workers), flush=True)
+    try:
+        await service.serve_forever()
+    finally:
+        await service.close()
+
+
+def parse_args(argv=None) -> ServiceConfig:
+    defaults = ServiceConfig()
+    parser = argparse.ArgumentParser(description="Art gallery solve service")
+    parser.add_argument("--host", default=defaults.host)
+    parser.add_argument("--port", type=int, default=defaults.port)
+    parser.add_argument("--workers", type=int, default=defaults.workers)
+    parser.add_argument("--queue-size", type=int, default=defaults.queue_size)
+    parser.add_argument("--timeout", type=float, default=defaults.timeout)
+    parser.add_argument(
+        "--cache-bytes",
+        type=int,
+        default=defaults.cache_bytes,
+        help="In-memory result cache size (0 disables caching)",
+    )
+    parser.add_argument("--cache-dir", help="Also keep cached results as JSON files here")
+    args = parser.parse_args(argv)
+    return ServiceConfig(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        queue_size=args.queue_size,
+        timeout=args.timeout,
+        cache_bytes=args.cache_bytes,
+        cache_dir=args.cache_dir,
+    )
+
+
+def main(argv=None):
+    try:
+        asyncio.run(serve(parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+# Process-wide worker pool for the pipeline computations of UI sessions.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# solve_pool.py - Bounded process pool shared by every web session: asynchronous jobs
+# with progress, and one job for identical concurrent requests.
+
+import atexit
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional
+
+import animation as animation_module
+import headless as headless_module
+import metrics as metrics_module
+import pipeline as pipeline_module
+import result_cache as result_cache_module
+
+# Stages a recorded job computes after loading the polygon, in order.
+RECORDED_STAGES = (
+    "trapezoidalisation",
+    "monotone_partitioning",
+    "triangulation",
+    "dual_graph",
+    "three_coloring",
+    "vertex_guards",
+)
+# Ids of drawings made in a worker, so they never clash with local ones.
+EVENT_NAMESPACE = "pool"
+
+
+class PoolBusy(RuntimeError):
+    """Raised when the pool already holds ``max_pending`` unfinished jobs."""
+
+
+# Worker side
+_progress_queue = None
+
+
+def _init_worker(progress_queue):
+    global _progress_queue
+    _progress_queue = progress_queue
+
+
+def _report(key, done, total, stage=None, seconds=None):
+    if _progress_queue is not None:
+        _progress_queue.put((key, done, total, stage, seconds))
+
+
+def _solve(key, points, holes, options):
+    return headless_module.solve_polygon(
+        points,
+        holes=holes,
+        progress=lambda done, total: _report(key, done, total),
+        **options,
+    )
+
+
+def _record(key, points, holes):
+    pipeline = pipeline_module.ArtGalleryPipeline(
+        animation_module.RecordingCanvas(EVENT_NAMESPACE)
+    )
+    if not pipeline.step_load_polygon(points, holes):
+        raise ValueError("Invalid polygon")
+    for done, stage in enumerate(RECORDED_STAGES, 1):
+        start = time.perf_counter()
+        if not pipeline.request(stage):
+            raise ValueError("Pipeline step failed: %s" % stage)
+        _report(key, done, len(RECORDED_STAGES), stage, time.perf_counter() - start)
+    return {stage: pipeline.event_logs[stage] for stage in RECORDED_STAGES}
+
+
+# Caller side
+class SolveJob:
+    """Handle on a submitted job; shared by every caller that asked for it."""
+
+    def __init__(self, key, future):
+        self.key = key
+        self.future = future
+        self.progress = 0.0  # fraction of the pipeline steps done
+        self.stage: Optional[str] = None  # last stage finished, for recorded jobs
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+    def exception(self, timeout=None):
+        return self.future.exception(timeout)
+
+
+class SolvePool:
+    """Bounded process pool running pipeline jobs off the callers' threads.
+
+    ``solve`` runs ``headless.solve_polygon`` and ``record`` runs the drawing
+    pipeline on a recording canvas, returning each stage's event log for an
+    ``animation.AnimationPlayer``. Both return a ``SolveJob`` at once. A
+    request identical to one still running (same canonical polygon and
+    options) gets the running job instead of a new one. At most
+    ``max_pending`` jobs may be unfinished; beyond that ``PoolBusy`` is raised.
+
+    Solved results go into ``cache`` (a ``result_cache.ResultCache``, by
+    default a memory-only one), and a ``solve`` it can answer returns a
+    finished job without reaching a worker.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        cache: Optional[result_cache_module.ResultCache] = None,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 8 * self.max_workers
+        self.cache = cache if cache is not None else result_cache_module.ResultCache()
+        self._jobs: Dict[str, SolveJob] = {}
+        self._lock = threading.Lock()
+        # Spawned workers: forking a multi-threaded server process is unsafe.
+        self._context = multiprocessing.get_context("spawn")
+        self._progress = self._context.Queue()
+        self._executor = None
+        self._closed = False
+        listener = threading.Thread(target=self._listen, name="solve-pool-progress", daemon=True)
+        listener.start()
+
+    # Public API
+    def solve(self, points, holes=(), **options) -> SolveJob:
+        key = "solve:" + result_cache_module.cache_key(points, holes, **options)
+        points, holes = _plain(points), _plain_rings(holes)
+        result = self.cache.lookup(points, holes, **options)
+        if result is not None:
+            metrics_module.REQUESTS.labels("pool", "cached").inc()
+            future = Future()
+            future.set_result(result)
+            job = SolveJob(key, future)
+            job.progress = 1.0
+            return job
+
+        def store(future):
+            if not future.cancelled() and future.exception() is None:
+                self.cache.store(points, holes, future.result(), **options)
+
+        return self._submit(key, _solve, points, holes, options, on_done=store)
+
+    def record(self, points, holes=()) -> SolveJob:
+        key = "record:" + result_cache_module.cache_key(points, holes)
+        return self._submit(key, _record, _plain(points), _plain_rings(holes))
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._progress.put(None)
+
+    # Internals
+    def _submit(self, key, fn, *args, on_done=None) -> SolveJob:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Solve pool is shut down")
+            job = self._jobs.get(key)
+            if job is not None:
+                metrics_module.REQUESTS.labels("pool", "shared").inc()
+                return job
+            if len(self._jobs) >= self.max_pending:
+                metrics_module.REQUESTS.labels("pool", "busy").inc()
+                raise PoolBusy("%d jobs pending" % len(self._jobs))
+            try:
+                future = self._pool().submit(fn, key, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); start a fresh pool.
+                broken, self._executor = self._executor, None
+                broken.shutdown(wait=False, cancel_futures=True)
+                future = self._pool().submit(fn, key, *args)
+            job = SolveJob(key, future)
+            self._jobs[key] = job
+        metrics_module.REQUESTS.labels("pool", "submitted").inc()
+        if on_done is not None:
+            future.add_done_callback(on_done)
+        future.add_done_callback(lambda _: self._finished(job))
+        return job
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self._context,
+                initializer=_init_worker,
+                initargs=(self._progress,),
+            )
+        return self._executor
+
+    def _finished(self, job):
+        job.progress = 1.0
+        with self._lock:
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+
+    def _listen(self):
+        while True:
+            try:
+                message = self._progress.get()
+            except (EOFError, OSError, queue.Empty):
+                return
+            if message is None:
+                return
+            key, done, total, stage, seconds = message
+            if seconds is not None:
+                metrics_module.STAGE_SECONDS.labels(stage).observe(seconds)
+            with self._lock:
+                job = self._jobs.get(key)
+            if job is not None and not job.done():
+                job.progress = done / total
+                job.stage = stage
+
+
+def _plain(points):
+    return [(float(x), float(y)) for x, y in points]
+
+
+def _plain_rings(rings):
+    return [_plain(ring) for ring in rings]
+
+
+_shared_pool: Optional[SolvePool] = None
+_shared_lock = threading.Lock()
+
+
+def get_pool() -> SolvePool:
+    """The process-wide pool, created on first use.
+
+    Its size comes from ``ART_GALLERY_WORKERS`` (default: one per CPU) and
+    its queue bound from ``ART_GALLERY_MAX_PENDING``.
+    """
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = SolvePool(
+                max_workers=int(os.environ.get("ART_GALLERY_WORKERS", 0)) or None,
+                max_pending=int(os.environ.get("ART_GALLERY_MAX_PENDING", 0)) or None,
+            )
+            atexit.register(_shared_pool.shutdown)
+            pool = _shared_pool
+            metrics_module.QUEUE_DEPTH.labels("pool").set_function(lambda: pool.pending)
+        return _shared_pool
@@ -4,11 +4,14 @@
 # Date: 25 Sept, 2025
 # three_coloring.py - Assigns colors ensuring adjacent vertices differ.
 
-import time
+from animation import pause
+import profiling
+
+PALETTE = ("#b58900", "#228b22", "#d33682")
 
 
 class ThreeColoringApp:
-    def __init__(self, canvas, dcel, dual_graph_app):
+    def __init__(self, canvas, dcel, dual_graph_app, start_face_index=0):
         self.canvas = canvas
         self.dcel = dcel
         self.dual_graph_app = dual_graph_app
@@ -17,13 +20,26 @@ class ThreeColoringApp:
         self.padding = 50
         self.origin_x = self.padding
         self.origin_y = self.canvas_height - self.padding
+        self.start_face_index = start_face_index
         self.face_and_vertices = {}
         self.colored_vertices = {}
 
-    def coloring_dfs(self, current_face, visited_faces, graph):
-        if current_face in visited_faces:
-            return
-        visited_faces.append(current_face)
+    def coloring_dfs(self, start_face, graph):
+        # Depth-first walk of the dual tree with an explicit stack (a
+        # recursive walk runs out of stack on polygons of a few thousand
+        # vertices). Faces are colored in the same preorder as a recursion
+        # over graph[face] would visit them.
+        visited_faces = set()
+        stack = [start_face]
+        while stack:
+            current_face = stack.pop()
+            if current_face in visited_faces:
+                continue
+            visited_faces.add(current_face)
+            self.color_face(current_face)
+            stack.extend(reversed(graph[current_face]))
+
+    def color_face(self, current_face):
         vertex1 = self.face_and_vertices[current_face][0]
         vertex2 = self.face_and_vertices[current_face][1]
         vertex3 = self.face_and_vertices[current_face][2]
@@ -61,11 +77,9 @@ class ThreeColoringApp:
                 ):
                     self.colored_vertices[vertex3] = color
 
-        for child_faces in graph[current_face]:
-            self.coloring_dfs(child_faces, visited_faces, graph)
-
     def three_color_triangulation(self):
         for face in self.dcel.faces:
+            profiling.count(profiling.FACES_WALKED)
             looping_edge = face.outer_half_edge
             starting_vertex = looping_edge.origin
             vertex_list = []
@@ -78,9 +92,8 @@ class ThreeColoringApp:
 
             self.face_and_vertices[face] = vertex_list
 
-        visited_faces = []
-        starting_face = self.dcel.faces[0]
-        self.coloring_dfs(starting_face, visited_faces, self.dual_graph_app.graph)
+        starting_face = self.dcel.faces[self.start_face_index % len(self.dcel.faces)]
+        self.coloring_dfs(starting_face, self.dual_graph_app.graph)
         for k in self.colored_vertices:
             self.color_vertex(k, self.colored_vertices[k])
 
@@ -90,5 +103,4 @@ class ThreeColoringApp:
         self.canvas.create_oval(
             adjusted_x - 5, adjusted_y - 5, adjusted_x + 5, adjusted_y + 5, fill=color
         )
-        self.canvas.update()
-        time.sleep(0.4)
+        pause(self.canvas)
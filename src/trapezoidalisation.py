@@ -5,7 +5,7 @@
 # trapezoidalisation.py - Draws horizontal helper lines during sweep.
 
 
-import time
+from animation import pause
 
 
 class TrapezoidalisationApp:
@@ -25,8 +25,7 @@ class TrapezoidalisationApp:
 
         for vertex in vertices:
             self.draw_horizontal_line(vertex)
-            self.canvas.update()
-            time.sleep(0.4)
+            pause(self.canvas)
 
     def draw_horizontal_line(self, vertex):
         x1 = 0
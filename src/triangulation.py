@@ -2,9 +2,125 @@
 
 # GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
 # Date: 25 Sept, 2025
-# triangulation.py - Inserts diagonals (rendered dotted) to triangulate faces.
-
-import time
+# triangulation.py - Triangulates y-monotone pieces, yielding triangles or inserting the
+# diagonals into the DCEL.
+
+import profiling
+
+FLAT_EPS = 1e-9  # |cross| relative to the squared extent below which a triangle is flat
+
+
+def _orientation(a, b, c):
+    return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+
+
+def _sweep(xy, sign):
+    # Stack triangulation of a y-monotone piece, in local indices.
+    m = len(xy)
+    order = sorted(range(m), key=lambda k: (-xy[k][1], xy[k][0]))
+    # Chain 0 runs from the top vertex to the bottom one in cycle order.
+    chain = [1] * m
+    k = order[0]
+    while k != order[-1]:
+        chain[k] = 0
+        k = (k + 1) % m
+
+    stack = [order[0], order[1]]
+    for j in range(2, m - 1):
+        u = order[j]
+        if chain[u] != chain[stack[-1]]:
+            # Opposite chain: u sees every vertex on the stack.
+            for a, b in zip(stack, stack[1:]):
+                yield (u, a, b)
+            stack = [order[j - 1], u]
+            continue
+        last = stack.pop()
+        while stack:
+            profiling.count(profiling.ORIENTATION_TESTS)
+            turn = sign * _orientation(xy[stack[-1]], xy[last], xy[u])
+            if (turn <= 0) if chain[u] == 0 else (turn >= 0):
+                break  # last is reflex: u cannot see past it
+            yield (u, last, stack[-1])
+            last = stack.pop()
+        stack.append(last)
+        stack.append(u)
+    u = order[-1]
+    for a, b in zip(stack, stack[1:]):
+        yield (u, a, b)
+
+
+def _flip_flat_triangles(triangles, xy):
+    # A straight-angle vertex b between boundary neighbours a and c leaves
+    # the sweep a (near) zero-area triangle (a, b, c). Its long edge a-c is always a
+    # diagonal, so flipping it with the triangle (a, c, d) on the other side
+    # gives (a, b, d) and (b, c, d) and every vertex stays a corner.
+    def flat(t):
+        a, b, c = (xy[v] for v in t)
+        scale = max(abs(a[0] - c[0]), abs(a[1] - c[1]), abs(a[0] - b[0]), abs(a[1] - b[1]))
+        return abs(_orientation(a, b, c)) <= FLAT_EPS * scale * scale
+
+    pending = [k for k, t in enumerate(triangles) if flat(t)]
+    if not pending:
+        return triangles
+    by_edge = {}
+    for k, t in enumerate(triangles):
+        for e in ((t[0], t[1]), (t[1], t[2]), (t[2], t[0])):
+            by_edge.setdefault(frozenset(e), set()).add(k)
+
+    def length(a, c):
+        return (xy[a][0] - xy[c][0]) ** 2 + (xy[a][1] - xy[c][1]) ** 2
+
+    budget = 4 * len(triangles)
+    while pending and budget:
+        budget -= 1
+        k = pending.pop()
+        t = triangles[k]
+        if not flat(t):
+            continue
+        a, b, c = max(
+            ((t[0], t[1], t[2]), (t[1], t[2], t[0]), (t[2], t[0], t[1])),
+            key=lambda abc: length(abc[0], abc[2]),
+        )
+        others = by_edge[frozenset((a, c))] - {k}
+        if not others:
+            continue
+        other = others.pop()
+        (d,) = set(triangles[other]) - {a, c}
+        for index, old in ((k, t), (other, triangles[other])):
+            for e in ((old[0], old[1]), (old[1], old[2]), (old[2], old[0])):
+                by_edge[frozenset(e)].discard(index)
+        triangles[k] = (a, b, d)
+        triangles[other] = (b, c, d)
+        for index in (k, other):
+            new = triangles[index]
+            for e in ((new[0], new[1]), (new[1], new[2]), (new[2], new[0])):
+                by_edge.setdefault(frozenset(e), set()).add(index)
+            if flat(new):
+                pending.append(index)
+    return triangles
+
+
+def monotone_triangles(cycle, points):
+    """Yield the triangles of one y-monotone piece as vertex triples.
+
+    ``cycle`` lists the piece's vertices in boundary order and ``points``
+    maps each of them to (x, y). The vertices are swept top to bottom with a
+    stack (the standard O(m log m) method for a piece of m vertices), so
+    nothing beyond the piece is held; triangles follow the cycle's
+    orientation and none of them is flat.
+    """
+    cycle = list(cycle)
+    m = len(cycle)
+    if m < 3:
+        return
+    xy = [points[v] for v in cycle]
+    area = sum(xy[k - 1][0] * xy[k][1] - xy[k][0] * xy[k - 1][1] for k in range(m))
+    sign = 1 if area >= 0 else -1
+
+    for a, b, c in _flip_flat_triangles(list(_sweep(xy, sign)), xy):
+        if sign * _orientation(xy[a], xy[b], xy[c]) < 0:
+            b, c = c, b
+        yield (cycle[a], cycle[b], cycle[c])
 
 
 class TriangulationApp:
@@ -19,180 +135,45 @@ class TriangulationApp:
         self.origin_y = self.canvas_height - self.padding
 
     def triangulate_polygon(self):
+        # Every face is a y-monotone piece; the edges of its triangles that
+        # are not boundary edges are the diagonals to add.
         pending_diagonals = []
         for face in self.dcel.faces:
-            looping_edge = face.outer_half_edge
-            starting_vertex = looping_edge.origin
-            vertex_list = []
-
+            profiling.count(profiling.FACES_WALKED)
+            vertices = []
+            edge = face.outer_half_edge
             while True:
-                vertex_list.append(looping_edge.origin)
-                looping_edge = looping_edge.next
-                if looping_edge.origin == starting_vertex:
+                vertices.append(edge.origin)
+                edge = edge.next
+                if edge == face.outer_half_edge:
                     break
-
-            sorted_vertices = sorted(vertex_list, key=lambda v: (-v.y, v.x))
-            top_vertex = sorted_vertices[0]
-            bottom_vertex = sorted_vertices[-1]
-
-            chain1 = []
-            chain2 = []
-
-            while vertex_list[0] != top_vertex:
-                temp_vertex = vertex_list[0]
-                vertex_list.remove(temp_vertex)
-                vertex_list.append(temp_vertex)
-
-            switching = False
-            chain2.append(top_vertex)
-            for k in vertex_list:
-                if not switching:
-                    chain1.append(k)
-                else:
-                    chain2.append(k)
-                if k == bottom_vertex:
-                    switching = True
-            chain2.append(bottom_vertex)
-
-            chain1 = sorted(chain1, key=lambda v: (-v.y, v.x))
-            chain2 = sorted(chain2, key=lambda v: (-v.y, v.x))
-
-            Q = []
-            Q.append(sorted_vertices[0])
-            sorted_vertices.pop(0)
-            Q.append(sorted_vertices[0])
-            sorted_vertices.pop(0)
-
-            left_chain = []
-            right_chain = []
-
-            if len(chain1) > 2 and len(chain2) > 2:
-                minx1 = 1e9
-                minx2 = 1e9
-                for k in range(1, len(chain1) - 1):
-                    minx1 = min(chain1[k].x, minx1)
-                for k in range(1, len(chain2) - 1):
-                    minx2 = min(chain2[k].x, minx2)
-                if minx1 < minx2:
-                    left_chain = chain1
-                    right_chain = chain2
-                else:
-                    left_chain = chain2
-                    right_chain = chain1
-            elif len(chain1) > 2:
-                v1 = top_vertex
-                v2 = chain1[1]
-                v3 = bottom_vertex
-                if (
-                    (v3.y - v1.y) / (v3.x - v1.x) > 0
-                    and v2.y - v1.y - ((v3.y - v1.y) / (v3.x - v1.x)) * (v2.x - v1.x)
-                    <= 0
-                ) or (
-                    (v3.y - v1.y) / (v3.x - v1.x) < 0
-                    and v2.y - v1.y - ((v3.y - v1.y) / (v3.x - v1.x)) * (v2.x - v1.x)
-                    >= 0
-                ):
-                    right_chain = chain1
-                    left_chain = chain2
-                else:
-                    right_chain = chain2
-                    left_chain = chain1
-            else:
-                v1 = top_vertex
-                v2 = chain2[1]
-                v3 = bottom_vertex
-                if (
-                    (v3.y - v1.y) / (v3.x - v1.x) > 0
-                    and v2.y - v1.y - ((v3.y - v1.y) / (v3.x - v1.x)) * (v2.x - v1.x)
-                    <= 0
-                ) or (
-                    (v3.y - v1.y) / (v3.x - v1.x) < 0
-                    and v2.y - v1.y - ((v3.y - v1.y) / (v3.x - v1.x)) * (v2.x - v1.x)
-                    >= 0
-                ):
-                    right_chain = chain2
-                    left_chain = chain1
-                else:
-                    right_chain = chain1
-                    left_chain = chain2
-
-            left_chain.pop(0)
-            left_chain.pop()
-            right_chain.pop(0)
-            right_chain.pop()
-
-            for k in sorted_vertices:
-                if k in left_chain and Q[-1] in left_chain:
-                    Q.append(k)
-                    while True and len(Q) >= 3:
-                        v1, v2, v3 = Q[-1], Q[-2], Q[-3]
-                        if (
-                            (v3.y - v1.y) / (v3.x - v1.x) > 0
-                            and v2.y
-                            - v1.y
-                            - ((v3.y - v1.y) / (v3.x - v1.x)) * (v2.x - v1.x)
-                            <= 0
-                        ) or (
-                            (v3.y - v1.y) / (v3.x - v1.x) < 0
-                            and v2.y
-                            - v1.y
-                            - ((v3.y - v1.y) / (v3.x - v1.x)) * (v2.x - v1.x)
-                            >= 0
-                        ):
-                            break
-                        else:
-                            if (v1, v3) not in self.dcel.existing_lines:
-                                self.monotone_app.draw_diagonal_only(v1, v3)
-                                pending_diagonals.append((v1, v3))
-                            u = Q.pop()
-                            Q.pop()
-                            Q.append(u)
-                elif k in right_chain and Q[-1] in right_chain:
-                    Q.append(k)
-                    while True and len(Q) >= 3:
-                        v1, v2, v3 = Q[-1], Q[-2], Q[-3]
-                        if (
-                            (v3.y - v1.y) / (v3.x - v1.x) < 0
-                            and v2.y
-                            - v1.y
-                            - ((v3.y - v1.y) / (v3.x - v1.x)) * (v2.x - v1.x)
-                            <= 0
-                        ) or (
-                            (v3.y - v1.y) / (v3.x - v1.x) > 0
-                            and v2.y
-                            - v1.y
-                            - ((v3.y - v1.y) / (v3.x - v1.x)) * (v2.x - v1.x)
-                            >= 0
-                        ):
-                            break
-                        else:
-                            if (v1, v3) not in self.dcel.existing_lines:
-                                self.monotone_app.draw_diagonal_only(v1, v3)
-                                pending_diagonals.append((v1, v3))
-                            u = Q.pop()
-                            Q.pop()
-                            Q.append(u)
-                else:
-                    Q.pop(0)
-                    while len(Q) >= 2:
-                        if (Q[0], k) not in self.dcel.existing_lines:
-                            self.monotone_app.draw_diagonal_only(Q[0], k)
-                            pending_diagonals.append((Q[0], k))
-                        Q.pop(0)
-                    if (Q[0], k) not in self.dcel.existing_lines:
-                        # draw dotted/dashed gray line if possible: not supported in Tk directly
-                        self.monotone_app.canvas.create_line(
-                            self.monotone_app.origin_x + Q[0].x,
-                            self.monotone_app.origin_y - Q[0].y,
-                            self.monotone_app.origin_x + k.x,
-                            self.monotone_app.origin_y - k.y,
-                            fill="#a0a0a0",
-                            dash=(4, 3),
-                        )
-                        self.monotone_app.canvas.update()
-                        time.sleep(0.4)
-                        pending_diagonals.append((Q[0], k))
-                    Q.append(k)
+            points = [(v.x, v.y) for v in vertices]
+            m = len(vertices)
+            found = set()
+            for triangle in monotone_triangles(range(m), points):
+                for i, j in zip(triangle, triangle[1:] + triangle[:1]):
+                    if (j - i) % m in (1, m - 1) or (j, i) in found:
+                        continue
+                    found.add((i, j))
+                    v1, v2 = vertices[i], vertices[j]
+                    if (v1, v2) not in self.dcel.existing_lines:
+                        self.monotone_app.draw_diagonal_only(v1, v2)
+                        pending_diagonals.append((v1, v2))
 
         for v1, v2 in pending_diagonals:
             self.dcel.add_diagonal(v1, v2)
+
+    def fan_triangulate(self, apex):
+        # Valid only when apex lies in the polygon kernel: every other vertex
+        # is visible from it, so the fan diagonals never cross an edge.
+        vertices = self.dcel.vertices
+        start = vertices.index(apex)
+        n = len(vertices)
+        fan_diagonals = []
+        for j in range(2, n - 1):
+            vertex = vertices[(start + j) % n]
+            self.monotone_app.draw_diagonal_only(apex, vertex)
+            fan_diagonals.append((apex, vertex))
+
+        for v1, v2 in fan_diagonals:
+            self.dcel.add_diagonal(v1, v2)
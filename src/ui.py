@@ -79,6 +79,21 @@ class Toolbar:
         self._buttons[key] = btn
         return btn
 
+    def add_scale(self, label: str, from_: float, to: float, value: float, command):
+        ttk.Label(self.frame, text=label, style="Subtle.TLabel").pack(
+            pady=(12, 0), padx=6, anchor=tk.W
+        )
+        variable = tk.DoubleVar(value=value)
+        scale = ttk.Scale(
+            self.frame,
+            from_=from_,
+            to=to,
+            variable=variable,
+            command=lambda _value: command(variable.get()),
+        )
+        scale.pack(pady=6, padx=6, fill=tk.X)
+        return scale
+
     def set_enabled(self, key: str, enabled: bool):
         if key in self._buttons:
             self._buttons[key].config(state=tk.NORMAL if enabled else tk.DISABLED)
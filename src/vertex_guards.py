@@ -4,6 +4,8 @@
 # Date: 25 Sept, 2025
 # vertex_guards.py - Highlights chosen guard vertices visibly on the canvas.
 
+import profiling
+
 
 class VertexGuardsApp:
     def __init__(self, canvas, dcel, three_coloring_app):
@@ -15,6 +17,8 @@ class VertexGuardsApp:
         self.padding = 50
         self.origin_x = self.padding
         self.origin_y = self.canvas_height - self.padding
+        self.guard_color = None
+        self.guard_vertices = []
 
     def decide_vertex_guards(self):
         y_count = 0
@@ -55,9 +59,33 @@ class VertexGuardsApp:
             min_color = PINK
             min_color_vertices = pink_vertices
 
-        for k in min_color_vertices:
+        self.guard_color = min_color
+        self.guard_vertices = min_color_vertices + self.uncovered_face_guards(
+            min_color_vertices
+        )
+        for k in self.guard_vertices:
             self.draw_guard_vertex(k, min_color)
 
+    def uncovered_face_guards(self, guards):
+        # A triangulation with holes is not always 3-colorable, so the
+        # smallest color class may miss some triangles; give each of those
+        # one of its own vertices (a triangle is visible from its corners).
+        guard_set = set(guards)
+        extra = []
+        for face in self.dcel.faces:
+            profiling.count(profiling.FACES_WALKED)
+            half_edge = face.outer_half_edge
+            corners = []
+            while True:
+                corners.append(half_edge.origin)
+                half_edge = half_edge.next
+                if half_edge == face.outer_half_edge:
+                    break
+            if not guard_set.intersection(corners):
+                guard_set.add(corners[0])
+                extra.append(corners[0])
+        return extra
+
     def draw_guard_vertex(self, vertex, color):
         adjusted_x = self.origin_x + vertex.x
         adjusted_y = self.origin_y - vertex.y
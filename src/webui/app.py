@@ -4,9 +4,10 @@
 # Date: 25 Sept, 2025
 # webui/app.py - Streamlit layout and controls for each algorithm step.
 
-import time
-import io
 import os
+import time
+from collections import deque
+
 import sys
 import streamlit as st
 
@@ -17,36 +18,153 @@ if _PROJECT_ROOT not in sys.path:
     sys.path.insert(0, _PROJECT_ROOT)
 
 
+from animation import AnimationClock, AnimationPlayer, RecordingCanvas
+from lod import POLYGON_TAG, draw_polygon
+from metrics import start_from_env as start_metrics_exporter
 from pipeline import ArtGalleryPipeline
-from webui.canvas_adapter import MatplotlibCanvasAdapter, PlotConfig
+from solve_pool import RECORDED_STAGES, PoolBusy, get_pool
+from webui.scene import SceneCanvasAdapter, scene_canvas
+
+RENDERERS = {"Browser (vector)": "vector", "Server (Matplotlib)": "raster"}
+# Pipeline stage -> the UI stage shown once it is the latest one
+UI_STAGES = {
+    "polygon": "polygon",
+    "trapezoidalisation": "trapezoids",
+    "monotone_partitioning": "monotone",
+    "triangulation": "triangulation",
+    "dual_graph": "dual",
+    "three_coloring": "coloring",
+    "vertex_guards": "guards",
+}
+BGCOLOR = "#f5f5dc"
+POLL_INTERVAL = 0.25  # seconds between reruns while a pool job is running
+
+
+def make_adapter(renderer: str):
+    if renderer == "vector":
+        return SceneCanvasAdapter(bgcolor=BGCOLOR)
+    # Matplotlib is only loaded by sessions that pick the server renderer
+    from webui.canvas_adapter import MatplotlibCanvasAdapter, PlotConfig
+
+    return MatplotlibCanvasAdapter(PlotConfig(width=7, height=7, bgcolor=BGCOLOR))
 
 
 def get_pipeline_state():
     if "pipeline" not in st.session_state:
-        adapter = MatplotlibCanvasAdapter(PlotConfig(width=7, height=7, bgcolor="#f5f5dc"))
-        st.session_state.adapter = adapter
-        st.session_state.pipeline = ArtGalleryPipeline(adapter)
+        # Steps compute against a recorder; their logs are replayed on the adapter.
+        # Each session paces its own animation (4x matches 0.1 s frames).
+        clock = AnimationClock(speed=4.0)
+        st.session_state.pipeline = ArtGalleryPipeline(RecordingCanvas(), clock=clock)
+        st.session_state.pending_events = deque()
+        st.session_state.job = None  # solve_pool job computing this polygon's steps
+        st.session_state.target = None  # (pipeline stage, UI stage) the user asked for
+        st.session_state.renderer = None
         st.session_state.stage = "init"  # init -> polygon -> trapezoids -> monotone -> triangulation -> dual -> coloring -> guards
-    return st.session_state.pipeline, st.session_state.adapter
+    return st.session_state.pipeline
 
 
-def render_canvas(adapter: MatplotlibCanvasAdapter):
-    fig = adapter.render()
-    buf = io.BytesIO()
+def use_renderer(pipeline: ArtGalleryPipeline, renderer: str):
+    """Switch the session to ``renderer``, drawing the valid stages instantly."""
+    if st.session_state.renderer != renderer:
+        adapter = make_adapter(renderer)
+        player = AnimationPlayer(adapter, pipeline.clock)
+        redraw_stages(pipeline, player)
+        st.session_state.renderer = renderer
+        st.session_state.applied_view = None
+        st.session_state.adapter = adapter
+        st.session_state.player = player
+    return st.session_state.adapter, st.session_state.player
+
+
+def redraw_stages(pipeline: ArtGalleryPipeline, player: AnimationPlayer):
+    """Draw the valid stages instantly from their logs."""
+    player.clear()
+    for events in pipeline.event_logs.values():
+        player.play(events, speed=None)
+    pipeline.take_new_events()
+    st.session_state.pending_events.clear()
+
+
+def step_history(pipeline: ArtGalleryPipeline, player: AnimationPlayer, forward: bool):
+    """Undo or restore a step from the pipeline history, without recomputing it."""
+    if forward:
+        pipeline.step_forward()
+        player.play(pipeline.take_new_events(), speed=None)
+    else:
+        pipeline.step_back()
+        redraw_stages(pipeline, player)
+    st.session_state.stage = UI_STAGES.get(pipeline.latest_stage, st.session_state.stage)
+    st.session_state.target = None
+    st.session_state.applied_view = None
+
+
+def submit_job(pipeline: ArtGalleryPipeline):
+    """Have the shared worker pool compute every step for the current polygon."""
     try:
-        fig.savefig(buf, format="png")
-        buf.seek(0)
-        st.image(buf)
+        st.session_state.job = get_pool().record(
+            pipeline.polygon_app.points, pipeline.polygon_app.holes
+        )
+    except PoolBusy:
+        st.session_state.job = None
+
+
+def collect_job(pipeline: ArtGalleryPipeline):
+    """Adopt the requested steps from the pool job once it is done.
+
+    Returns ``"running"`` while the job runs (a progress bar is shown),
+    ``"adopted"`` when steps were just adopted, and None otherwise; both
+    call for a rerun once the canvas is drawn.
+    """
+    target = st.session_state.target
+    if target is None:
+        return None
+    if st.session_state.job is None:
+        submit_job(pipeline)
+        if st.session_state.job is None:
+            st.warning("The server is busy; please try again in a moment.")
+            st.session_state.target = None
+            return None
+    job = st.session_state.job
+    if not job.done():
+        st.progress(job.progress, text="Computing " + (job.stage or "steps") + "…")
+        return "running"
+    st.session_state.target = None
+    if job.exception() is not None:
+        st.session_state.job = None
+        st.error("Step failed: %s" % job.exception())
+        return None
+    logs = job.result()
+    stage, ui_stage = target
+    for name in RECORDED_STAGES[: RECORDED_STAGES.index(stage) + 1]:
+        if not pipeline.is_valid(name):
+            pipeline.adopt_events(name, logs[name])
+    st.session_state.stage = ui_stage
+    return "adopted"
+
+
+def rerun_for(job_status):
+    # Poll a running job; after adopting steps, refresh the step buttons.
+    if job_status == "running":
+        time.sleep(POLL_INTERVAL)
+    if job_status:
+        st.rerun()
+
+
+def render_canvas(adapter, placeholder):
+    try:
+        placeholder.image(adapter.frame())
     except Exception:
         # Fallback to Streamlit's pyplot if Agg fails
-        st.pyplot(fig)
+        with placeholder:
+            st.pyplot(adapter.render())
 
 
 def main():
     st.set_page_config(page_title="Optimal Street Light Placement", layout="wide")
     st.title("Optimal Street Light Placement — Web UI")
+    start_metrics_exporter()  # only if ART_GALLERY_METRICS_PORT is set
 
-    pipeline, adapter = get_pipeline_state()
+    pipeline = get_pipeline_state()
     # We will set the live renderer after laying out columns so frames render in the right column
 
     # Two-column layout: controls (left), canvas (right)
@@ -54,72 +172,113 @@ def main():
 
     with col_controls:
         st.subheader("Controls")
+        renderer = RENDERERS[st.radio("Renderer", list(RENDERERS), key="renderer_left")]
+        adapter, player = use_renderer(pipeline, renderer)
         n = st.number_input("Vertices (n)", min_value=3, max_value=100, value=8, step=1, key="n_left")
         gen_disabled = False
         if st.button("1. Generate Polygon", use_container_width=True, key="gen_left", disabled=gen_disabled):
             if pipeline.step_generate_polygon_with_n(int(n)):
                 st.session_state.stage = "polygon"
+                # Start computing the steps at once; the buttons then only reveal them
+                submit_job(pipeline)
         st.markdown("---")
         st.subheader("Steps")
+        col_back, col_forward = st.columns(2)
+        if col_back.button("◀ Back", use_container_width=True, key="back_left", disabled=not pipeline.can_step_back()):
+            step_history(pipeline, player, forward=False)
+        if col_forward.button("Forward ▶", use_container_width=True, key="forward_left", disabled=not pipeline.can_step_forward()):
+            step_history(pipeline, player, forward=True)
         trap_disabled = st.session_state.stage not in ["polygon", "trapezoids", "monotone", "triangulation", "dual", "coloring", "guards"]
         if st.button("2. Trapezoidalization", use_container_width=True, key="trap_left", disabled=trap_disabled):
-            if pipeline.step_trapezoidalisation():
-                st.session_state.stage = "trapezoids"
+            st.session_state.target = ("trapezoidalisation", "trapezoids")
         mono_disabled = st.session_state.stage not in ["trapezoids", "monotone", "triangulation", "dual", "coloring", "guards"]
         if st.button("3. Monotone Partitioning", use_container_width=True, key="mono_left", disabled=mono_disabled):
-            if pipeline.step_monotone_partitioning():
-                st.session_state.stage = "monotone"
+            st.session_state.target = ("monotone_partitioning", "monotone")
         tri_disabled = st.session_state.stage not in ["monotone", "triangulation", "dual", "coloring", "guards"]
         if st.button("4. Triangulation", use_container_width=True, key="tri_left", disabled=tri_disabled):
-            if pipeline.step_triangulation():
-                st.session_state.stage = "triangulation"
+            st.session_state.target = ("triangulation", "triangulation")
         dual_disabled = st.session_state.stage not in ["triangulation", "dual", "coloring", "guards"]
         if st.button("5. Dual Graph", use_container_width=True, key="dual_left", disabled=dual_disabled):
-            if pipeline.step_dual_graph():
-                st.session_state.stage = "dual"
+            st.session_state.target = ("dual_graph", "dual")
         color_disabled = st.session_state.stage not in ["dual", "coloring", "guards"]
         if st.button("6. 3-Coloring", use_container_width=True, key="color_left", disabled=color_disabled):
-            if pipeline.step_three_coloring():
-                st.session_state.stage = "coloring"
+            st.session_state.target = ("three_coloring", "coloring")
         guards_disabled = st.session_state.stage not in ["coloring", "guards"]
         if st.button("7. Vertex Guards (Street Lights)", use_container_width=True, key="guards_left", disabled=guards_disabled):
-            if pipeline.step_vertex_guards():
-                st.session_state.stage = "guards"
+            st.session_state.target = ("vertex_guards", "guards")
         st.markdown("---")
         if st.button("Reset", use_container_width=True, key="reset_left"):
             adapter.delete("all")
+            pipeline.invalidate("polygon")
             st.session_state.stage = "init"
-        st.caption("Animation: 0.1s fixed")
-        st.session_state.sleep = 0.1
+            st.session_state.job = None
+            st.session_state.target = None
+        pipeline.clock.speed = st.slider(
+            "Animation speed", 0.25, 16.0, 4.0, step=0.25, key="speed_left"
+        )
+        if st.button("Skip animation", use_container_width=True, key="skip_left"):
+            pipeline.clock.skip_to_end()
+        if renderer == "raster":
+            with st.expander("View"):
+                zoom = st.slider("Zoom", 1.0, 16.0, 1.0, key="zoom_left")
+                center_x = st.slider("Center x", 0, 500, 250, key="center_x_left")
+                center_y = st.slider("Center y", 0, 500, 250, key="center_y_left")
+        job_status = collect_job(pipeline)
+
+    # Play what the clicked step (and any upstream step) drew. Events are
+    # consumed as they are drawn, so a rerun that interrupts the animation
+    # resumes it where it stopped.
+    pending = st.session_state.pending_events
+    pending.extend(pipeline.take_new_events())
+    played = []
+
+    def consume():
+        while pending:
+            played.append(pending.popleft())
+            yield played[-1]
+
+    if renderer == "vector":
+        # The browser animates and draws; the server only records frame delays
+        player.play(consume())
+        pipeline.clock.resume()
+        with col_canvas:
+            scene_canvas(adapter)
+        rerun_for(job_status)
+        return
 
     with col_canvas:
         placeholder = st.empty()
-        def live_render(fig):
-            img_buf = io.BytesIO()
+        def live_render(frame):
             try:
-                fig.savefig(img_buf, format="png")
-                img_buf.seek(0)
-                with placeholder:
-                    st.image(img_buf)
+                placeholder.image(frame)
             except Exception:
                 pass
         adapter.set_live_renderer(live_render)
 
-    # Monkey-patch time.sleep to respect slider during this session
-    _original_sleep = time.sleep
-    def _patched_sleep(_s):
-        delay = st.session_state.sleep
-        if delay and delay > 0:
-            return _original_sleep(delay)
-        return None
-    time.sleep = _patched_sleep
+    player.play(consume())
+    pipeline.clock.resume()
+    events = played
 
-    # Initial render (or final frame after interactions)
-    with col_canvas:
-        render_canvas(adapter)
+    # Zoomed views redraw the polygon at the detail level of the visible part
+    half = 250 / zoom
+    view = (center_x - half, center_x + half, center_y - half, center_y + half)
+    if view != st.session_state.get("applied_view") or (events and zoom > 1):
+        adapter.set_view(*view)
+        st.session_state.applied_view = view
+        if pipeline.polygon_app and pipeline.polygon_app.points:
+            adapter.delete(POLYGON_TAG)
+            draw_polygon(
+                adapter,
+                [pipeline.polygon_app.points] + pipeline.polygon_app.holes,
+                adapter.viewport(),
+                pipeline.polygon_app.lod,
+            )
+    adapter.flush_frame()
+
+    # Initial render (or final frame after interactions), in the live frame's place
+    render_canvas(adapter, placeholder)
+    rerun_for(job_status)
 
 
 if __name__ == "__main__":
     main()
-
-
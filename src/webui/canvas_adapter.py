@@ -7,10 +7,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Tuple, List
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Tuple, List
 
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle
+
+from lod import Viewport
 
 
 @dataclass
@@ -18,6 +25,26 @@ class PlotConfig:
     width: int = 5
     height: int = 5
     bgcolor: str = "#ffffff"
+    max_fps: float = 10.0  # live frames per second; 0 renders every update
+
+
+@dataclass
+class _Batch:
+    """All lines (or circles) of one style, drawn as a single collection."""
+
+    collection: object
+    items: Dict[int, object] = field(default_factory=dict)
+    dirty: bool = False
+
+    def flush(self):
+        if not self.dirty:
+            return
+        items = list(self.items.values())
+        if isinstance(self.collection, LineCollection):
+            self.collection.set_segments(items)
+        else:
+            self.collection.set_paths(items)
+        self.dirty = False
 
 
 class MatplotlibCanvasAdapter:
@@ -25,26 +52,44 @@ class MatplotlibCanvasAdapter:
 
     Methods map a small subset of the Tk canvas API used by the algorithms
     to Matplotlib primitives, enabling reuse in a web environment.
+
+    Lines and ovals are batched: each style (color, dash) shares one
+    ``LineCollection`` / ``PatchCollection`` that is rebuilt lazily before the
+    next render, so thousands of primitives stay a handful of artists. Ids
+    still behave like Tk ids and can be deleted one by one.
+
+    Live rendering is throttled: drawing calls only mark the figure dirty,
+    ``update()`` emits at most ``max_fps`` frames per second, and
+    ``flush_frame()`` emits the last pending one. Frames are RGBA arrays read
+    straight from a reused Agg buffer, with no PNG encoding.
     """
 
     def __init__(self, config: PlotConfig | None = None):
         self.config = config or PlotConfig()
-        self.fig, self.ax = plt.subplots(figsize=(self.config.width, self.config.height))
+        # A bare Figure: pyplot is slow to import and keeps every figure alive.
+        self.fig = Figure(figsize=(self.config.width, self.config.height))
+        self.ax = self.fig.add_subplot()
         self.ax.set_aspect("equal")
         self.ax.set_facecolor(self.config.bgcolor)
         self.fig.patch.set_facecolor(self.config.bgcolor)
         self.ax.axis("off")
-        self._live_renderer = None  # function(fig) -> None
+        self._live_renderer = None  # function(rgba_frame) -> None
+        self._agg = FigureCanvasAgg(self.fig)
+        self._dirty = False
+        self._last_frame = float("-inf")
         # Fixed canvas bounds in Tk-coordinate space (0..500)
         self._xmin, self._xmax = 0, 500
         self._ymin, self._ymax = 0, 500
         # We keep Matplotlib's normal y-up coordinates; the calling code already
         # performs y inversion using origin_y - y to mimic Tk behavior.
+        self._view = (self._xmin, self._xmax, self._ymin, self._ymax)
         self.ax.set_xlim(self._xmin, self._xmax)
         self.ax.set_ylim(self._ymin, self._ymax)
-        # Graphics object registry to emulate Tk ids
+        # Graphics object registry to emulate Tk ids: id -> artist or batch key
         self._next_id = 1
         self._objects = {}
+        self._batches: Dict[tuple, _Batch] = {}
+        self._tags: Dict[str, List[int]] = {}
 
     def _is_finite(self, *vals) -> bool:
         try:
@@ -66,9 +111,79 @@ class MatplotlibCanvasAdapter:
     def set_live_renderer(self, render_fn):
         self._live_renderer = render_fn
 
-    def _render_if_live(self):
-        if self._live_renderer is not None:
-            self._live_renderer(self.fig)
+    def _request_frame(self):
+        self._dirty = True
+        if self._live_renderer is None:
+            return
+        now = time.monotonic()
+        if self.config.max_fps and now - self._last_frame < 1.0 / self.config.max_fps:
+            return  # coalesced into a later frame
+        self._emit_frame(now)
+
+    def _emit_frame(self, now: float):
+        self._last_frame = now
+        self._dirty = False
+        self._live_renderer(self.frame())
+
+    def flush_frame(self):
+        """Emit the frame held back by throttling, if any."""
+        if self._dirty and self._live_renderer is not None:
+            self._emit_frame(time.monotonic())
+
+    def _new_id(self) -> int:
+        obj_id = self._next_id
+        self._next_id += 1
+        return obj_id
+
+    def _batch(self, key: tuple) -> _Batch:
+        batch = self._batches.get(key)
+        if batch is None:
+            kind, color, dash = key
+            if kind == "line":
+                collection = LineCollection(
+                    [], colors=color, linestyles=(0, list(dash)) if dash else "solid"
+                )
+            else:
+                collection = PatchCollection(
+                    [], facecolors=color, edgecolors=color, match_original=False
+                )
+            # autolim=False: the fixed canvas bounds never change
+            self.ax.add_collection(collection, autolim=False)
+            batch = self._batches[key] = _Batch(collection)
+        return batch
+
+    def _add_to_batch(self, key: tuple, item) -> int:
+        batch = self._batch(key)
+        obj_id = self._new_id()
+        batch.items[obj_id] = item
+        batch.dirty = True
+        self._objects[obj_id] = key
+        return obj_id
+
+    def _tag(self, obj_id: int, tags) -> int:
+        if isinstance(tags, str):
+            tags = (tags,)
+        for tag in tags or ():
+            self._tags.setdefault(tag, []).append(obj_id)
+        return obj_id
+
+    def _flush_batches(self):
+        for batch in self._batches.values():
+            batch.flush()
+
+    def _dash_sequence(self, dash) -> Tuple[float, ...] | None:
+        # Matplotlib expects an even-length sequence of positive on/off lengths
+        if not dash:
+            return None
+        try:
+            dash_seq = [float(d) for d in dash]
+        except Exception:
+            return None
+        if dash_seq and min(dash_seq) <= 0:
+            dash_seq = [4.0, 3.0]
+        if len(dash_seq) % 2 == 1:
+            dash_seq = dash_seq * 2
+        return tuple(dash_seq)
 
     # Compatibility methods
     def delete(self, tag):
@@ -80,49 +195,43 @@ class MatplotlibCanvasAdapter:
             self.ax.set_facecolor(self.config.bgcolor)
             self.fig.patch.set_facecolor(self.config.bgcolor)
             self.ax.axis("off")
-            self.ax.set_xlim(self._xmin, self._xmax)
-            self.ax.set_ylim(self._ymin, self._ymax)
+            xmin, xmax, ymin, ymax = self._view
+            self.ax.set_xlim(xmin, xmax)
+            self.ax.set_ylim(ymin, ymax)
             self._objects.clear()
+            self._batches.clear()
+            self._tags.clear()
+        elif tag in self._tags:
+            for obj_id in self._tags.pop(tag):
+                self.delete(obj_id)
         else:
             try:
                 artist = self._objects.pop(tag, None)
-                if artist is not None:
+                if isinstance(artist, tuple):
+                    batch = self._batches[artist]
+                    batch.items.pop(tag, None)
+                    batch.dirty = True
+                elif artist is not None:
                     artist.remove()
             except Exception:
                 pass
-        self._render_if_live()
+        self._dirty = True
 
-    def create_line(self, x1, y1, x2, y2, fill="black", dash: Tuple[int, int] | None = None, arrow=None):
-        if not self._is_finite(x1, y1, x2, y2):
+    def create_line(self, *coords, fill="black", dash: Tuple[int, int] | None = None, arrow=None, tags=None):
+        # Accepts x1, y1, x2, y2 or a longer polyline, as Tk does
+        if len(coords) < 4 or len(coords) % 2 or not self._is_finite(*coords):
             return None
-        x1 = float(self._clamp(x1, self._xmin, self._xmax))
-        x2 = float(self._clamp(x2, self._xmin, self._xmax))
-        y1 = float(self._clamp(y1, self._ymin, self._ymax))
-        y2 = float(self._clamp(y2, self._ymin, self._ymax))
-        (line,) = self.ax.plot([x1, x2], [y1, y2], color=fill)
-        if dash:
-            # Matplotlib expects a sequence of on/off ink lengths; use set_dashes for compatibility
-            try:
-                dash_seq = [float(d) for d in dash]
-                if dash_seq and min(dash_seq) <= 0:
-                    dash_seq = [4.0, 3.0]
-                if len(dash_seq) % 2 == 1:
-                    dash_seq = dash_seq * 2  # ensure even length
-                # Prefer modern linestyle tuple when available
-                try:
-                    line.set_linestyle((0, dash_seq))
-                except Exception:
-                    line.set_dashes(dash_seq)
-            except Exception:
-                pass
-        self.ax.set_xlim(self._xmin, self._xmax)
-        self.ax.set_ylim(self._ymin, self._ymax)
-        obj_id = self._next_id
-        self._next_id += 1
-        self._objects[obj_id] = line
-        return obj_id
+        points = [
+            (
+                float(self._clamp(coords[i], self._xmin, self._xmax)),
+                float(self._clamp(coords[i + 1], self._ymin, self._ymax)),
+            )
+            for i in range(0, len(coords), 2)
+        ]
+        key = ("line", fill, self._dash_sequence(dash))
+        return self._tag(self._add_to_batch(key, points), tags)
 
-    def create_oval(self, x1, y1, x2, y2, fill="black"):
+    def create_oval(self, x1, y1, x2, y2, fill="black", tags=None):
         # Convert bounding box to center and radius
         if not self._is_finite(x1, y1, x2, y2):
             return None
@@ -137,16 +246,10 @@ class MatplotlibCanvasAdapter:
         radius = max(rx, ry)
         if radius <= 0:
             radius = 0.5
-        circle = plt.Circle((cx, cy), radius=radius, color=fill)
-        self.ax.add_patch(circle)
-        self.ax.set_xlim(self._xmin, self._xmax)
-        self.ax.set_ylim(self._ymin, self._ymax)
-        obj_id = self._next_id
-        self._next_id += 1
-        self._objects[obj_id] = circle
-        return obj_id
+        circle = Circle((cx, cy), radius=radius)
+        return self._tag(self._add_to_batch(("oval", fill, None), circle), tags)
 
-    def create_text(self, x, y, text, fill="black", font=("Arial", 10)):
+    def create_text(self, x, y, text, fill="black", font=("Arial", 10), tags=None):
         if not self._is_finite(x, y):
             return None
         size = 10
@@ -157,18 +260,36 @@ class MatplotlibCanvasAdapter:
         x = self._clamp(x, self._xmin, self._xmax)
         y = self._clamp(y, self._ymin, self._ymax)
         artist = self.ax.text(x, y, str(text), color=fill, fontsize=size)
-        self.ax.set_xlim(self._xmin, self._xmax)
-        self.ax.set_ylim(self._ymin, self._ymax)
-        obj_id = self._next_id
-        self._next_id += 1
+        obj_id = self._new_id()
         self._objects[obj_id] = artist
-        return obj_id
+        return self._tag(obj_id, tags)
 
     def update(self):
-        self._render_if_live()
+        self._request_frame()
+
+    # View
+    def set_view(self, xmin: float, xmax: float, ymin: float, ymax: float):
+        """Show only this part of the canvas (zoom/pan); primitives keep their coordinates."""
+        self._view = (xmin, xmax, ymin, ymax)
+        self.ax.set_xlim(xmin, xmax)
+        self.ax.set_ylim(ymin, ymax)
+        self._dirty = True
+
+    def viewport(self) -> Viewport:
+        """LOD viewport for the current view: identity mapping, visible window and pixel size."""
+        xmin, xmax, ymin, ymax = self._view
+        pixels = self.config.width * self.fig.dpi
+        return Viewport(window=(xmin, ymin, xmax, ymax), pixel_size=(xmax - xmin) / pixels)
 
     # Utility
     def render(self):
+        self._flush_batches()
         return self.fig
 
+    def frame(self) -> np.ndarray:
+        """Draw the figure into the reused Agg buffer and return it as RGBA."""
+        self._flush_batches()
+        self._agg.draw()
+        return np.asarray(self._agg.buffer_rgba())
+
 
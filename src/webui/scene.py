@@ -0,0 +1,170 @@
+# Scene-graph canvas whose changes are drawn by the browser.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# webui/scene.py - Tk-like canvas that keeps vector primitives and hands out
+# incremental deltas to a Streamlit component that renders them client-side.
+#
+
+from __future__ import annotations
+
+import os
+import uuid
+from typing import Dict, List, Optional
+
+_COMPONENT_DIR = os.path.join(os.path.dirname(__file__), "scene_component")
+_component = None
+
+
+class SceneCanvasAdapter:
+    """Canvas API (create_line/oval/text, delete, update) over a scene graph.
+
+    Every change is appended to a delta log as a JSON-ready op with a sequence
+    number: ``add`` (with the primitive), ``remove``, ``clear`` and ``frame``
+    (an animation boundary with its delay). ``delta(since)`` returns what a
+    client that already applied ``since`` is missing; the log restarts at
+    each ``clear``, so it never holds more than the current scene plus the
+    animation since then. Nothing is rasterized on the server, and
+    ``mark_frame`` lets ``animation.pause`` record delays instead of sleeping.
+    """
+
+    animate = False
+
+    def __init__(self, width: int = 500, height: int = 500, bgcolor: str = "#ffffff"):
+        self.width = width
+        self.height = height
+        self.bgcolor = bgcolor
+        self.scene_id = uuid.uuid4().hex
+        self.scene: Dict[int, dict] = {}
+        self._log: List[dict] = []
+        self._seq = 0
+        self._next_id = 1
+        self._tags: Dict[str, List[int]] = {}
+        self._append({"op": "clear"})
+
+    def _append(self, op: dict):
+        self._seq += 1
+        op["seq"] = self._seq
+        self._log.append(op)
+        # Replaying a long-lived scene's history would cost more than
+        # resending the scene itself.
+        if len(self._log) > 4 * len(self.scene) + 1000:
+            self._compact()
+
+    def _compact(self):
+        self._log = []
+        self._append({"op": "clear"})
+        for obj_id, primitive in self.scene.items():
+            self._seq += 1
+            self._log.append({"op": "add", "seq": self._seq, "id": obj_id, **primitive})
+
+    def _add(self, primitive: dict, tags=None) -> int:
+        obj_id = self._next_id
+        self._next_id += 1
+        self.scene[obj_id] = primitive
+        self._append({"op": "add", "id": obj_id, **primitive})
+        if isinstance(tags, str):
+            tags = (tags,)
+        for tag in tags or ():
+            self._tags.setdefault(tag, []).append(obj_id)
+        return obj_id
+
+    # Canvas API
+    def create_line(self, *coords, fill="black", dash=None, arrow=None, width=1, tags=None):
+        if len(coords) == 1:
+            coords = coords[0]
+        points = [float(c) for c in coords]
+        return self._add(
+            {
+                "type": "line",
+                "points": points,
+                "stroke": fill,
+                "dash": [float(d) for d in dash] if dash else None,
+                "arrow": bool(arrow),
+                "width": width,
+            },
+            tags,
+        )
+
+    def create_oval(self, x1, y1, x2, y2, fill="black", outline=None, tags=None):
+        return self._add(
+            {
+                "type": "oval",
+                "cx": (x1 + x2) / 2.0,
+                "cy": (y1 + y2) / 2.0,
+                "r": max(abs(x2 - x1), abs(y2 - y1)) / 2.0,
+                "fill": fill,
+            },
+            tags,
+        )
+
+    def create_text(self, x, y, text="", fill="black", font=("Arial", 10), tags=None):
+        size = 10
+        if isinstance(font, (list, tuple)) and len(font) > 1:
+            size = int(font[1])
+        return self._add(
+            {"type": "text", "x": x, "y": y, "text": str(text), "fill": fill, "size": size},
+            tags,
+        )
+
+    def delete(self, tag):
+        if tag == "all":
+            self.scene.clear()
+            self._tags.clear()
+            self._log = []
+            self._append({"op": "clear"})
+        elif tag in self._tags:
+            for obj_id in self._tags.pop(tag):
+                self.delete(obj_id)
+        elif self.scene.pop(tag, None) is not None:
+            self._append({"op": "remove", "id": tag})
+
+    def update(self):
+        pass
+
+    def mark_frame(self, seconds: float, clock=None):
+        # The browser does the waiting, at the session clock's pace
+        delay = clock.delay(seconds) if clock is not None else seconds
+        self._append({"op": "frame", "delay": delay})
+
+    # Deltas
+    @property
+    def head(self) -> int:
+        return self._seq
+
+    def delta(self, since: int = 0) -> List[dict]:
+        """Ops after sequence number ``since`` (everything since the last clear
+        if ``since`` predates it)."""
+        if not self._log or since < self._log[0]["seq"]:
+            return list(self._log)
+        return [op for op in self._log if op["seq"] > since]
+
+
+def scene_canvas(adapter: SceneCanvasAdapter, speed: float = 1.0, key: str = "scene"):
+    """Render ``adapter`` in the browser through the bundled Streamlit component.
+
+    The component reports the last sequence number it applied, so each rerun
+    only ships the ops it has not seen. ``speed=0`` skips the animation.
+    """
+    global _component
+    import streamlit as st
+    import streamlit.components.v1 as components
+
+    if _component is None:
+        _component = components.declare_component("scene_canvas", path=_COMPONENT_DIR)
+
+    acked: Optional[dict] = st.session_state.get(key)
+    since = 0
+    if isinstance(acked, dict) and acked.get("scene_id") == adapter.scene_id:
+        since = int(acked.get("seq", 0))
+    return _component(
+        scene_id=adapter.scene_id,
+        ops=adapter.delta(since),
+        head=adapter.head,
+        speed=speed,
+        width=adapter.width,
+        height=adapter.height,
+        bgcolor=adapter.bgcolor,
+        key=key,
+        default=None,
+    )
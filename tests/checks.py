@@ -0,0 +1,56 @@
+# Shared assertions for the solver tests.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# checks.py - Checks a triangulation (triangle count, total area, no flat triangles), its
+# 3-coloring and its guard coverage against the input rings.
+
+import math
+
+
+def ring_area(points) -> float:
+    """Unsigned area of a ring."""
+    n = len(points)
+    twice = sum(
+        points[i - 1][0] * points[i][1] - points[i][0] * points[i - 1][1] for i in range(n)
+    )
+    return abs(twice) / 2.0
+
+
+def polygon_area(points, holes=()) -> float:
+    return ring_area(points) - sum(ring_area(hole) for hole in holes)
+
+
+def assert_triangulation(vertices, triangles, points, holes=()):
+    """``triangles`` tile the polygon: n + 2h - 2 non-flat triangles of total area."""
+    expected = len(points) + sum(len(hole) for hole in holes) + 2 * len(holes) - 2
+    assert len(triangles) == expected
+    area = polygon_area(points, holes)
+    for triangle in triangles:
+        assert len(set(triangle)) == 3
+        assert ring_area([vertices[i] for i in triangle]) > 1e-9 * area
+    total = sum(ring_area([vertices[i] for i in t]) for t in triangles)
+    assert math.isclose(total, area, rel_tol=1e-9)
+
+
+def assert_three_coloring(triangles, colors):
+    """Every triangle has three different colors."""
+    for triangle in triangles:
+        assert len({colors[i] for i in triangle}) == 3
+
+
+def assert_guarded(triangles, guards):
+    """Every triangle has a guard at one of its corners."""
+    guard_set = set(guards)
+    for triangle in triangles:
+        assert guard_set.intersection(triangle)
+
+
+def assert_solution(result, holes=()):
+    """Full check of a ``headless.SolveResult``."""
+    vertices = result.vertices()
+    assert_triangulation(vertices, result.triangles, result.points, holes)
+    if not holes:
+        # With holes the triangulation is not always 3-colorable
+        assert_three_coloring(result.triangles, result.colors)
+    assert_guarded(result.triangles, result.guards)
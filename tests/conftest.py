@@ -0,0 +1,14 @@
+# Test configuration: the modules live flat in src/ and import each other by name.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# conftest.py - Puts src/, benchmarks/ and scripts/ on sys.path.
+
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+for folder in ("src", "benchmarks", "scripts"):
+    path = os.path.join(ROOT, folder)
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,72 @@
+# Fuzz corpus of random simple polygons for the solver tests.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# corpus.py - Deterministic random simple polygons on an integer grid (so equal y values,
+# horizontal edges and collinear vertices are common), untangled by 2-opt moves.
+
+import random
+
+SEEDS = range(200)
+
+
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _crosses(p1, p2, q1, q2):
+    # Proper crossing or touching of two segments that share no endpoint
+    d1, d2 = _cross(q1, q2, p1), _cross(q1, q2, p2)
+    d3, d4 = _cross(p1, p2, q1), _cross(p1, p2, q2)
+    if ((d1 > 0) != (d2 > 0) and d1 and d2) and ((d3 > 0) != (d4 > 0) and d3 and d4):
+        return True
+
+    def on(a, b, p):
+        return (
+            _cross(a, b, p) == 0
+            and min(a[0], b[0]) <= p[0] <= max(a[0], b[0])
+            and min(a[1], b[1]) <= p[1] <= max(a[1], b[1])
+        )
+
+    return on(q1, q2, p1) or on(q1, q2, p2) or on(p1, p2, q1) or on(p1, p2, q2)
+
+
+def _first_crossing(points):
+    n = len(points)
+    for i in range(n):
+        for j in range(i + 2, n):
+            if i == 0 and j == n - 1:
+                continue
+            if _crosses(points[i], points[i + 1], points[j], points[(j + 1) % n]):
+                return i, j
+    return None
+
+
+def _is_simple(points):
+    # Adjacent edges may not fold back onto each other either
+    n = len(points)
+    for i in range(n):
+        a, b, c = points[i - 1], points[i], points[(i + 1) % n]
+        if _cross(a, b, c) == 0 and (b[0] - a[0]) * (c[0] - b[0]) + (b[1] - a[1]) * (c[1] - b[1]) < 0:
+            return False
+    return _first_crossing(points) is None
+
+
+def fuzz_polygon(seed, n=None, size=40):
+    """A random simple polygon with ``n`` (default 6..30) distinct grid vertices."""
+    rng = random.Random(seed)
+    while True:
+        count = n or rng.randint(6, 30)
+        points = list({(rng.randint(0, size), rng.randint(0, size)) for _ in range(count)})
+        rng.shuffle(points)
+        if len(points) < 3:
+            continue
+        for _ in range(50 * len(points)):
+            crossing = _first_crossing(points)
+            if crossing is None:
+                break
+            i, j = crossing
+            # 2-opt: reversing the run between the crossing edges shortens the tour
+            points[i + 1 : j + 1] = points[i + 1 : j + 1][::-1]
+        if _is_simple(points) and abs(sum(_cross((0, 0), points[k - 1], points[k]) for k in range(len(points)))) > 0:
+            return [(float(x), float(y)) for x, y in points]
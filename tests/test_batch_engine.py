@@ -0,0 +1,83 @@
+# Tests for the packed batch engine.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_batch_engine.py - Mixed batches solved in-process and over shared memory, checked per
+# polygon for triangle count, area, 3-coloring and guard coverage.
+
+import math
+
+import pytest
+
+import batch_engine
+import fast_paths
+from checks import assert_guarded, assert_solution, assert_three_coloring, assert_triangulation
+from corpus import SEEDS, fuzz_polygon
+from families import FAMILIES
+
+BOWTIE = [(0, 0), (10, 10), (10, 0), (0, 10)]
+LINE = [(0, 0), (1, 0), (2, 0)]
+PENTAGRAM = [(math.cos(4 * math.pi * k / 5), math.sin(4 * math.pi * k / 5)) for k in range(5)]
+
+
+def mixed_polygons():
+    return [
+        FAMILIES[name](n, seed)
+        for seed in range(3)
+        for name in sorted(FAMILIES)
+        for n in (8, 17, 40)
+    ]
+
+
+def assert_batch(result, polygons):
+    assert result.ok.all()
+    for index, points in enumerate(polygons):
+        triangles = [tuple(t) for t in result.triangles_of(index).tolist()]
+        assert_triangulation(points, triangles, points)
+        start = result.batch.offsets[index]
+        assert_three_coloring(triangles, result.colors[start:].tolist())
+        assert_guarded(triangles, result.guards_of(index))
+        assert_solution(result.solve_result(index))
+
+
+def test_mixed_batch_in_process():
+    polygons = mixed_polygons()
+    result = batch_engine.solve_batch(batch_engine.PolygonBatch.from_polygons(polygons), workers=1)
+    assert set(result.kinds.tolist()) == {
+        batch_engine.CONVEX,
+        batch_engine.MONOTONE,
+        batch_engine.GENERAL,
+    }
+    assert_batch(result, polygons)
+
+
+def test_shared_memory_workers_match_in_process(monkeypatch):
+    monkeypatch.setattr(batch_engine, "MIN_PARALLEL_VERTICES", 0)
+    polygons = mixed_polygons()
+    batch = batch_engine.PolygonBatch.from_polygons(polygons)
+    shared = batch_engine.solve_batch(batch, workers=2)
+    assert_batch(shared, polygons)
+    local = batch_engine.solve_batch(batch, workers=1)
+    assert (shared.triangles == local.triangles).all()
+    assert (shared.guards == local.guards).all()
+
+
+@pytest.mark.parametrize("ring", [BOWTIE, LINE, PENTAGRAM], ids=["bowtie", "line", "pentagram"])
+def test_rings_that_are_not_simple_fail_alone(ring):
+    comb = FAMILIES["comb"](12)
+    result = batch_engine.solve_batch(batch_engine.PolygonBatch.from_polygons([comb, ring]), workers=1)
+    assert result.ok.tolist() == [True, False]
+    assert result.kinds[1] != batch_engine.CONVEX
+    assert (result.triangles_of(1) == -1).all() and not result.guards_of(1)
+    with pytest.raises(ValueError):
+        result.solve_result(1)
+    assert_solution(result.solve_result(0))
+
+
+def test_fuzz_corpus_matches_the_pipeline():
+    polygons = [fuzz_polygon(seed) for seed in SEEDS]
+    result = batch_engine.solve_batch(batch_engine.PolygonBatch.from_polygons(polygons), workers=1)
+    for index, points in enumerate(polygons):
+        assert result.ok[index]
+        assert result.kinds[index] != batch_engine.MONOTONE or fast_paths.is_y_monotone(points)
+        assert_solution(result.solve_result(index))
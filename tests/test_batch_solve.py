@@ -0,0 +1,73 @@
+# Tests for the JSONL batch solve mode.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_batch_solve.py - Records in input order, failures as records, and a reader that stops
+# early.
+
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import batch_solve
+from checks import assert_guarded, assert_triangulation
+from families import FAMILIES
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+def test_records_in_input_order():
+    polygons = [FAMILIES[name](n) for name in sorted(FAMILIES) for n in (7, 19)]
+    lines = [json.dumps({"id": k, "points": p}) for k, p in enumerate(polygons)]
+    lines.insert(3, "not json")
+    out = io.StringIO()
+    solved, failed = batch_solve.run(io.StringIO("\n".join(lines)), out, workers=1)
+    assert (solved, failed) == (len(polygons), 1)
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert not records[3]["ok"] and records[3]["line"] == 4
+    del records[3]
+    for k, (points, record) in enumerate(zip(polygons, records)):
+        assert record["id"] == k and record["ok"]
+        triangles = [tuple(t) for t in record["triangles"]]
+        assert_triangulation(points, triangles, points)
+        assert_guarded(triangles, record["guards"])
+
+
+@pytest.mark.parametrize("options", [[1], "fast", None, {"speed": 2}])
+def test_bad_options_are_rejected(options):
+    line = json.dumps({"points": FAMILIES["comb"](7), "options": options})
+    with pytest.raises(ValueError):
+        batch_solve.parse_request(line)
+    record = batch_solve.solve_line(1, line)
+    assert not record["ok"] and record["error"].startswith("ValueError")
+
+
+def test_large_polygon_under_the_default_recursion_limit():
+    # The 3-coloring walks the dual tree (one face per triangle) without recursing
+    assert sys.getrecursionlimit() <= 1000
+    points = FAMILIES["spiral"](1500)
+    out = io.StringIO()
+    assert batch_solve.run(io.StringIO(json.dumps(points)), out, workers=1) == (1, 0)
+    record = json.loads(out.getvalue())
+    triangles = [tuple(t) for t in record["triangles"]]
+    assert_triangulation(points, triangles, points)
+    assert_guarded(triangles, record["guards"])
+
+
+def test_reader_closing_early_exits_quietly(tmp_path):
+    source = tmp_path / "polygons.jsonl"
+    source.write_text((json.dumps(FAMILIES["spiral"](30)) + "\n") * 2000)
+    process = subprocess.Popen(
+        [sys.executable, MAIN, "--solve", str(source), "--workers", "1"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert json.loads(process.stdout.readline())["ok"]
+    process.stdout.close()
+    assert process.wait(timeout=120) == 1
+    assert "Traceback" not in process.stderr.read().decode("utf-8")
@@ -0,0 +1,141 @@
+# Tests for the GeoJSON, WKT and binary exporters.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_export.py - Exports read back and checked for triangle count, area, 3-coloring and
+# guard coverage.
+
+import io
+import json
+import math
+import re
+
+import pytest
+
+import export
+import headless
+from checks import (
+    assert_guarded,
+    assert_three_coloring,
+    assert_triangulation,
+    polygon_area,
+    ring_area,
+)
+from families import FAMILIES
+
+SPECS = [(name, n) for name in sorted(FAMILIES) for n in (12, 40)]
+
+
+def solve(name, n):
+    return headless.solve_polygon(FAMILIES[name](n), convex_partition=True)
+
+
+def assert_coverage(vertices, triangles, guard_points, coverage):
+    # Each triangle's guard is one of its corners, or the single guard that
+    # sees the whole polygon.
+    assert len(coverage) == len(triangles)
+    for triangle, guard in zip(triangles, coverage):
+        assert 0 <= guard < len(guard_points)
+        if len(guard_points) > 1:
+            assert guard_points[guard] in [vertices[v] for v in triangle]
+
+
+@pytest.mark.parametrize("name, n", SPECS)
+def test_binary_round_trip(name, n):
+    result = solve(name, n)
+    out = io.BytesIO()
+    # A small chunk size splits vertices and triangles over several records
+    count = export.write_binary(
+        out,
+        result.vertices(),
+        result.triangles,
+        result.convex_pieces,
+        result.guard_points,
+        result.coverage(),
+        chunk_size=5,
+    )
+    data = export.read_binary(io.BytesIO(out.getvalue()))
+    assert count == len(result.triangles)
+    vertices = data["vertices"]
+    triangles = data["triangles"]
+    assert vertices == result.vertices()
+    assert triangles == [tuple(t) for t in result.triangles]
+    assert data["convex_pieces"] == [list(p) for p in result.convex_pieces]
+    assert_triangulation(vertices, triangles, result.points)
+    assert_three_coloring(triangles, result.colors)
+    assert_guarded(triangles, result.guards)
+    assert_coverage(vertices, triangles, data["guard_points"], data["coverage"])
+
+
+def test_read_binary_rejects_a_truncated_file():
+    result = solve("comb", 12)
+    out = io.BytesIO()
+    export.write_binary(out, result.vertices(), result.triangles)
+    with pytest.raises(ValueError):
+        export.read_binary(io.BytesIO(out.getvalue()[:-3]))
+    with pytest.raises(ValueError):
+        export.read_binary(io.BytesIO(b"NOPE" + out.getvalue()[4:]))
+
+
+@pytest.mark.parametrize("name, n", SPECS)
+def test_geojson_features(name, n):
+    result = solve(name, n)
+    out = io.StringIO()
+    written = export.write_geojson(
+        out,
+        result.vertices(),
+        result.triangles,
+        result.convex_pieces,
+        result.guard_points,
+        result.coverage(),
+        chunk_size=7,
+    )
+    features = json.loads(out.getvalue())["features"]
+    assert written == len(features)
+    by_kind = {}
+    for feature in features:
+        by_kind.setdefault(feature["properties"]["kind"], []).append(feature["geometry"])
+    area = polygon_area(result.points)
+
+    rings = [g["coordinates"][0] for g in by_kind["triangle"]]
+    assert len(rings) == len(result.points) - 2
+    for ring in rings:
+        assert ring[0] == ring[-1] and len(ring) == 4
+        # GeoJSON exterior rings are counter-clockwise
+        assert sum(
+            ring[i][0] * ring[i + 1][1] - ring[i + 1][0] * ring[i][1] for i in range(3)
+        ) > 0
+    assert math.isclose(sum(ring_area(r[:-1]) for r in rings), area, rel_tol=1e-9)
+    pieces = [g["coordinates"][0][:-1] for g in by_kind["convex_piece"]]
+    assert math.isclose(sum(ring_area(p) for p in pieces), area, rel_tol=1e-9)
+    assert len(by_kind["guard"]) == len(result.guard_points)
+    covered = sum(
+        ring_area(polygon[0][:-1]) for g in by_kind["coverage"] for polygon in g["coordinates"]
+    )
+    assert math.isclose(covered, area, rel_tol=1e-9)
+
+
+@pytest.mark.parametrize("name, n", SPECS)
+def test_wkt_lines(name, n):
+    result = solve(name, n)
+    out = io.StringIO()
+    written = export.write_wkt(
+        out,
+        result.vertices(),
+        result.triangles,
+        guard_points=result.guard_points,
+        coverage=result.coverage(),
+    )
+    lines = out.getvalue().splitlines()
+    assert written == len(lines)
+    number = r"(-?[0-9.e+-]+)"
+    triangles = [line for line in lines if line.startswith("POLYGON")]
+    assert len(triangles) == len(result.triangles)
+    area = 0.0
+    for line in triangles:
+        ring = [tuple(map(float, p)) for p in re.findall(number + " " + number, line)]
+        assert len(ring) == 4 and ring[0] == ring[-1]
+        area += ring_area(ring[:-1])
+    assert math.isclose(area, polygon_area(result.points), rel_tol=1e-9)
+    assert sum(line.startswith("POINT") for line in lines) == len(result.guard_points)
+    assert sum(line.startswith("MULTIPOLYGON") for line in lines) == len(result.guard_points)
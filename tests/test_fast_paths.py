@@ -0,0 +1,94 @@
+# Tests for the convex, y-monotone and kernel-vertex fast paths.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_fast_paths.py - polygon_kernel corners, kernel-vertex fans, the y-monotone test on
+# horizontal edges and the fast_paths switch.
+
+import math
+import random
+
+import pytest
+
+import fast_paths
+import headless
+from checks import assert_solution
+from corpus import SEEDS, fuzz_polygon
+from families import FAMILIES
+
+COMB = [(400, 400), (0, 400), (0, 0), (200, 202), (400, 4)]
+
+
+def test_kernel_has_no_repeated_or_straight_corners():
+    kernel = fast_paths.polygon_kernel(COMB)
+    assert len(kernel) >= 3
+    for k in range(len(kernel)):
+        a, b, c = kernel[k - 2], kernel[k - 1], kernel[k]
+        assert a != b
+        assert abs((b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])) > 1e-9
+
+
+def test_comb_kernel_vertex_fans_cleanly():
+    shape = fast_paths.analyse_polygon(COMB)
+    # Vertex 0 is outside the kernel and vertex 1 is collinear with edge 3-4
+    assert shape.kernel_vertex not in (0, 1)
+    result = headless.solve_polygon(COMB)
+    assert result.guards == [shape.kernel_vertex]
+    assert_solution(result)
+
+
+@pytest.mark.parametrize("family", sorted(FAMILIES))
+@pytest.mark.parametrize("n", (5, 6, 9, 16, 41))
+def test_fast_path_matches_full_pipeline(family, n):
+    points = FAMILIES[family](n)
+    fast = headless.solve_polygon(points)
+    full = headless.solve_polygon(points, fast_paths=False)
+    assert_solution(fast)
+    assert_solution(full)
+    assert len(fast.triangles) == len(full.triangles)
+
+
+def random_star(rng, n):
+    # Star-shaped around the origin: sorted angles, random radii
+    points = []
+    for angle in sorted(rng.uniform(0, 2 * math.pi) for _ in range(n)):
+        radius = rng.uniform(50, 200)
+        points.append((round(radius * math.cos(angle), 3), round(radius * math.sin(angle), 3)))
+    return points
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_star_polygons(seed):
+    rng = random.Random(seed)
+    points = random_star(rng, rng.randint(4, 40))
+    assert_solution(headless.solve_polygon(points))
+    assert_solution(headless.solve_polygon(points, rotation=2.0, shift=1, fast_paths=False))
+
+
+def test_horizontal_edge_going_left_breaks_monotonicity():
+    # The right chain runs left along y = 28, which the sweeps order upwards
+    points = [
+        (40, 37), (26, 28), (13, 28), (25, 27), (28, 16), (33, 3),
+        (32, 0), (4, 16), (3, 28), (24, 31), (24, 34), (29, 38),
+    ]
+    assert not fast_paths.is_y_monotone(points)
+    assert fast_paths.is_y_monotone([(0, 0), (4, 0), (4, 3), (0, 3)])
+    assert_solution(headless.solve_polygon(points))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_fast_paths_solve_the_corpus(seed):
+    assert_solution(headless.solve_polygon(fuzz_polygon(seed)))
+
+
+def test_fast_paths_off_reaches_the_pipeline():
+    points = FAMILIES["convex"](12)
+    pipeline = headless.pipeline_module.ArtGalleryPipeline(
+        headless.HeadlessCanvas(), fast_paths=False
+    )
+    assert pipeline.step_load_polygon(points, [])
+    assert pipeline.request("triangulation")
+    assert pipeline.shape is None
+
+    result = headless.solve_polygon(points, rotation=2.0, shift=1, fast_paths=False)
+    assert_solution(result)
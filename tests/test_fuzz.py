@@ -0,0 +1,17 @@
+# Tests over the fuzz corpus of random simple polygons.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_fuzz.py - Every corpus polygon is solved by the general pipeline and checked for
+# triangle count, area, 3-coloring and guard coverage.
+
+import pytest
+
+import headless
+from checks import assert_solution
+from corpus import SEEDS, fuzz_polygon
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_general_pipeline_solves_the_corpus(seed):
+    assert_solution(headless.solve_polygon(fuzz_polygon(seed), fast_paths=False))
@@ -0,0 +1,55 @@
+# Tests for multi-trial guard minimization.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_guard_minimization.py - Failed trials are counted, bugs are not swallowed, and large
+# polygons run under the default recursion limit.
+
+import sys
+
+import pytest
+
+import guard_minimization
+from checks import assert_guarded, assert_triangulation
+from families import FAMILIES
+
+
+def test_best_trial_is_a_valid_solution():
+    points = FAMILIES["comb"](12)
+    outcome = guard_minimization.minimize_guards(points, trials=4, max_workers=1)
+    assert outcome.trials_completed == 4 and outcome.trials_failed == 0
+    best = outcome.best
+    assert_triangulation(best.vertices(), best.triangles, points)
+    assert_guarded(best.triangles, best.guards)
+
+
+def test_rejected_variant_counts_as_failed(monkeypatch):
+    def solve_polygon(points, rotation, *args, **kwargs):
+        if rotation:
+            raise ValueError("Diagonal does not run inside a face")
+        return real_solve_polygon(points, rotation, *args, **kwargs)
+
+    real_solve_polygon = guard_minimization.headless_module.solve_polygon
+    monkeypatch.setattr(guard_minimization.headless_module, "solve_polygon", solve_polygon)
+    outcome = guard_minimization.minimize_guards(FAMILIES["spiral"](20), trials=3, max_workers=1)
+    assert (outcome.trials_completed, outcome.trials_failed) == (3, 2)
+    assert outcome.best_variant.index == 0
+
+
+def test_unexpected_error_propagates(monkeypatch):
+    def solve_polygon(*args, **kwargs):
+        raise KeyError("missing half-edge")
+
+    monkeypatch.setattr(guard_minimization.headless_module, "solve_polygon", solve_polygon)
+    with pytest.raises(KeyError):
+        guard_minimization.minimize_guards(FAMILIES["convex"](8), trials=2, max_workers=1)
+
+
+def test_large_polygon_under_the_default_recursion_limit():
+    # A variant that overflowed the stack would now abort the whole run
+    assert sys.getrecursionlimit() <= 1000
+    points = FAMILIES["spiral"](3000)
+    outcome = guard_minimization.minimize_guards(points, trials=2, max_workers=1)
+    assert (outcome.trials_completed, outcome.trials_failed) == (2, 0)
+    assert_triangulation(outcome.best.vertices(), outcome.best.triangles, points)
+    assert_guarded(outcome.best.triangles, outcome.best.guards)
@@ -0,0 +1,106 @@
+# Tests for polygons with holes.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_holes.py - Random star-shaped polygons with small holes, solved and streamed, checked
+# for triangle count, area and guard coverage.
+
+import math
+import random
+
+import pytest
+
+import headless
+import pipeline as pipeline_module
+from checks import assert_solution, assert_triangulation
+
+QUAD = [(21, 188), (9, 115), (263, 164), (301, 309)]
+QUAD_HOLES = [
+    [(60, 160), (68, 160), (64, 168)],
+    [(150, 190), (158, 190), (158, 198), (150, 198)],
+    [(240, 200), (246, 196), (244, 206)],
+]
+
+
+def random_polygon_with_holes(rng):
+    # Angles at most pi/2 apart and radii >= 100 keep the disc of radius 70
+    # inside the outer ring; holes sit in disjoint cells of [-45, 45]^2.
+    n = rng.randint(8, 30)
+    step = 2 * math.pi / n
+    outer = []
+    for k in range(n):
+        angle = (k + rng.uniform(0.1, 0.9)) * step
+        radius = rng.uniform(100, 200)
+        outer.append((round(radius * math.cos(angle)), round(radius * math.sin(angle))))
+    cells = [(x, y) for x in (-45, -15, 15) for y in (-45, -15, 15)]
+    holes = []
+    for x, y in rng.sample(cells, rng.randint(1, 3)):
+        x += rng.randint(2, 8)
+        y += rng.randint(2, 8)
+        s = rng.randint(4, 20)
+        if rng.random() < 0.5:
+            holes.append([(x, y), (x, y + s), (x + s, y + s), (x + s, y)])
+        else:
+            b, c = rng.randint(0, s // 2), rng.randint(0, s // 2)
+            holes.append([(x, y), (x + s, y + b), (x + c, y + s)])
+    return outer, holes
+
+
+@pytest.mark.parametrize("fast_paths", (True, False))
+@pytest.mark.parametrize("rotation, shift", [(0.0, 0), (2.0, 1), (math.pi / 2, 3)])
+def test_quad_with_three_holes(fast_paths, rotation, shift):
+    result = headless.solve_polygon(
+        QUAD, rotation=rotation, shift=shift, fast_paths=fast_paths, holes=QUAD_HOLES
+    )
+    assert_solution(result, QUAD_HOLES)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_polygons_with_holes(seed):
+    rng = random.Random(seed)
+    outer, holes = random_polygon_with_holes(rng)
+    for rotation, shift in ((0.0, 0), (2.0, 1), (0.7, 2)):
+        result = headless.solve_polygon(outer, rotation=rotation, shift=shift, holes=holes)
+        assert_solution(result, holes)
+    vertices = outer + [p for hole in holes for p in hole]
+    assert_triangulation(vertices, list(headless.iter_triangles(outer, holes)), outer, holes)
+
+
+@pytest.mark.parametrize(
+    "holes",
+    [
+        [[(21, 188), (60, 160), (68, 160)]],  # touches the outer ring
+        [QUAD_HOLES[0], [(60, 160), (50, 150), (55, 145)]],  # holes touching
+        [[(60, 160), (68, 160)]],
+    ],
+)
+def test_non_simple_rings_are_rejected(holes):
+    with pytest.raises(ValueError):
+        headless.solve_polygon(QUAD, holes=holes)
+    with pytest.raises(ValueError):
+        list(headless.iter_triangles(QUAD, holes))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_undo_and_redo_with_holes(seed):
+    outer, holes = random_polygon_with_holes(random.Random(seed))
+    pipeline = pipeline_module.ArtGalleryPipeline(headless.HeadlessCanvas(), fast_paths=False)
+    assert pipeline.step_load_polygon(outer, holes)
+    dcel = pipeline.polygon_app.dcel
+    assert pipeline.request("triangulation")
+    index_of = {vertex: k for k, vertex in enumerate(dcel.vertices)}
+
+    def triangles():
+        return sorted(
+            tuple(sorted(index_of[v] for v in headless.face_vertices(face))) for face in dcel.faces
+        )
+
+    solved = triangles()
+    vertices = [(v.x, v.y) for v in dcel.vertices]
+    assert_triangulation(vertices, solved, outer, holes)
+    # Rolling back the bridges restores the single face with every hole
+    assert pipeline.rewind("trapezoidalisation")
+    assert len(dcel.faces) == 1 and len(dcel.faces[0].inner_half_edges) == len(holes)
+    while pipeline.can_step_forward():
+        pipeline.step_forward()
+    assert triangles() == solved
@@ -0,0 +1,29 @@
+# Tests for the import cost of the geometry core.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_import_cost.py - The core loads no UI library and none of the tool-only modules, and the
+# benchmark records the import time.
+
+import json
+
+import bench
+import import_time
+
+
+def test_core_loads_no_ui_or_tool_modules():
+    cumulative, unwanted = import_time.measure_once(
+        ("dcel", "triangulation", "three_coloring", "pipeline")
+    )
+    assert unwanted == []
+    assert set(cumulative) == {"dcel", "triangulation", "three_coloring", "pipeline"}
+
+
+def test_benchmark_records_the_import_time(tmp_path, capsys):
+    output = tmp_path / "bench.json"
+    argv = ["--sizes", "10", "--families", "convex", "--repeat", "1", "--output", str(output)]
+    assert bench.main(argv) == 0
+    report = json.loads(output.read_text())
+    assert report["import"]["total_ms"] > 0
+    assert report["import"]["unwanted_modules_loaded"] == []
+    assert bench.main(argv + ["--compare", str(output), "--threshold", "10"]) == 0
@@ -0,0 +1,72 @@
+# Tests for incremental edits of a solved polygon.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_incremental.py - Random moves, inserts and deletes, each checked for triangle count,
+# area, 3-coloring and guard coverage; rejected edits leave the polygon as it was.
+
+import random
+
+import pytest
+
+from checks import assert_guarded, assert_three_coloring, assert_triangulation
+from families import FAMILIES
+from incremental import IncrementalTriangulation
+
+
+def assert_editor(editor):
+    points = editor.points()
+    triangles = editor.triangles()
+    assert_triangulation(points, triangles, points)
+    colors = [editor.colors[v] for v in editor.ring]
+    assert_three_coloring(triangles, colors)
+    index = {v: k for k, v in enumerate(editor.ring)}
+    assert_guarded(triangles, [index[v] for v in editor.guards])
+
+
+def random_edit(editor, rng):
+    n = len(editor.ring)
+    k = rng.randrange(n)
+    x, y = editor.ring[k].x, editor.ring[k].y
+    kind = rng.choice(("move", "insert", "delete") if n > 4 else ("move", "insert"))
+    if kind == "move":
+        return editor.move_vertex(k, x + rng.uniform(-15, 15), y + rng.uniform(-15, 15))
+    if kind == "insert":
+        after = editor.ring[(k + 1) % n]
+        t = rng.uniform(0.3, 0.7)
+        return editor.insert_vertex(
+            k,
+            x + t * (after.x - x) + rng.uniform(-10, 10),
+            y + t * (after.y - y) + rng.uniform(-10, 10),
+        )
+    return editor.delete_vertex(k)
+
+
+@pytest.mark.parametrize("family", sorted(FAMILIES))
+def test_random_edits_keep_a_guarded_triangulation(family):
+    rng = random.Random(family)
+    editor = IncrementalTriangulation.from_points(FAMILIES[family](24))
+    assert_editor(editor)
+    accepted = 0
+    for _ in range(150):
+        before = (editor.points(), sorted(map(sorted, editor.triangles())))
+        try:
+            result = random_edit(editor, rng)
+        except ValueError:
+            # A self-intersecting edit changes nothing
+            assert (editor.points(), sorted(map(sorted, editor.triangles()))) == before
+            continue
+        accepted += 1
+        assert result.guard_color == editor.guard_color
+        assert_editor(editor)
+    assert accepted > 50
+
+
+def test_self_intersecting_move_is_rejected():
+    square = [(0, 0), (100, 0), (100, 100), (0, 100)]
+    editor = IncrementalTriangulation.from_points(square)
+    before = editor.points()
+    with pytest.raises(ValueError):
+        editor.move_vertex(editor.points().index((0, 0)), 150, 50)
+    assert editor.points() == before
+    assert_editor(editor)
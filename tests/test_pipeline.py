@@ -0,0 +1,183 @@
+# Tests for the pipeline's stage API.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_pipeline.py - Stages requested out of order, reused and invalidated, with the convex
+# partition's dual graph, and undone and redone through the DCEL journal.
+
+import pytest
+
+import guard_minimization
+import headless
+import profiling
+import pipeline as pipeline_module
+from checks import assert_guarded, assert_three_coloring, assert_triangulation
+from families import FAMILIES
+
+
+def new_pipeline(points, holes=()):
+    pipeline = pipeline_module.ArtGalleryPipeline(headless.HeadlessCanvas(), fast_paths=False)
+    assert pipeline.step_load_polygon(points, holes)
+    return pipeline
+
+
+def pipeline_solution(pipeline):
+    dcel = pipeline.triangulation_app.dcel
+    index_of = {vertex: k for k, vertex in enumerate(dcel.vertices)}
+    triangles = [
+        tuple(index_of[v] for v in headless.face_vertices(face))
+        for face in dcel.faces
+        if face.outer_half_edge
+    ]
+    colors = {index_of[v]: c for v, c in pipeline.three_coloring_app.colored_vertices.items()}
+    guards = [index_of[v] for v in pipeline.vertex_guards_app.guard_vertices]
+    return [(v.x, v.y) for v in dcel.vertices], triangles, colors, guards
+
+
+@pytest.mark.parametrize("family", sorted(FAMILIES))
+def test_three_coloring_after_convex_dual_graph(family):
+    points = FAMILIES[family](24)
+    pipeline = new_pipeline(points)
+    assert pipeline.step_dual_graph(True)
+    assert pipeline.convex_partition_app.pieces()
+    assert pipeline.step_three_coloring()
+    assert pipeline.step_vertex_guards()
+
+    vertices, triangles, colors, guards = pipeline_solution(pipeline)
+    assert_triangulation(vertices, triangles, points)
+    assert_three_coloring(triangles, colors)
+    assert_guarded(triangles, guards)
+
+
+def test_request_reuses_valid_stages():
+    pipeline = new_pipeline(FAMILIES["spiral"](20))
+    assert pipeline.request("vertex_guards")
+    dual_graph_app = pipeline.dual_graph_app
+    assert pipeline.request("vertex_guards")
+    assert pipeline.dual_graph_app is dual_graph_app
+    vertices, triangles, colors, guards = pipeline_solution(pipeline)
+    assert_three_coloring(triangles, colors)
+    assert_guarded(triangles, guards)
+
+
+def test_request_computes_only_missing_upstream_stages():
+    profiler = profiling.Profiler(memory=False)
+    pipeline = pipeline_module.ArtGalleryPipeline(
+        headless.HeadlessCanvas(), profiler=profiler, fast_paths=False
+    )
+    assert pipeline.step_load_polygon(FAMILIES["comb"](20))
+    assert pipeline.request("triangulation")
+    assert not pipeline.is_valid("dual_graph")
+    assert pipeline.request("vertex_guards")
+    assert pipeline.request("vertex_guards")
+    assert [stage.name for stage in profiler.stages] == [
+        "polygon",
+        "trapezoidalisation",
+        "monotone_partitioning",
+        "triangulation",
+        "dual_graph",
+        "three_coloring",
+        "vertex_guards",
+    ]
+
+
+def test_invalidate_drops_downstream_stages_and_their_diagonals():
+    points = FAMILIES["comb"](20)
+    pipeline = new_pipeline(points)
+    assert pipeline.request("monotone_partitioning")
+    dcel = pipeline.monotone_app.dcel
+    pieces = len(dcel.faces)
+    assert pipeline.request("vertex_guards")
+    assert len(dcel.faces) > pieces
+
+    pipeline.invalidate("triangulation")
+    for stage in ("triangulation", "dual_graph", "three_coloring", "vertex_guards"):
+        assert not pipeline.is_valid(stage)
+    for stage in ("polygon", "trapezoidalisation", "monotone_partitioning"):
+        assert pipeline.is_valid(stage)
+    assert len(dcel.faces) == pieces
+    pipeline.invalidate("triangulation")  # already invalid: nothing to do
+
+    assert pipeline.request("vertex_guards")
+    vertices, triangles, colors, guards = pipeline_solution(pipeline)
+    assert_triangulation(vertices, triangles, points)
+    assert_three_coloring(triangles, colors)
+    assert_guarded(triangles, guards)
+
+
+def test_cancelled_polygon_dialog_leaves_the_polygon_invalid(monkeypatch):
+    profiler = profiling.Profiler(memory=False)
+    pipeline = pipeline_module.ArtGalleryPipeline(headless.HeadlessCanvas(), profiler=profiler)
+    assert pipeline.step_load_polygon(FAMILIES["comb"](10))
+    assert pipeline.request("triangulation")
+    # Cancelling the Tk dialog returns before any point is generated
+    monkeypatch.setattr(
+        pipeline_module.generate_polygon_module.GeneratePolygonApp,
+        "generate_polygon",
+        lambda self: None,
+    )
+    assert not pipeline.step_generate_polygon()
+    assert not pipeline.is_valid("polygon") and not pipeline.is_valid("triangulation")
+    assert not pipeline.request("vertex_guards")
+    assert not pipeline.step_generate_polygon_with_n(2)
+    assert profiler.current is None
+    assert pipeline.step_generate_polygon_with_n(12)
+    assert pipeline.request("vertex_guards")
+
+
+def test_minimize_guards_keeps_holes():
+    outer = [(0, 0), (200, 0), (200, 200), (0, 200)]
+    holes = [[(40, 40), (40, 80), (80, 80), (80, 40)], [(120, 120), (150, 160), (160, 120)]]
+    pipeline = new_pipeline(outer, holes)
+    assert pipeline.step_minimize_guards(trials=3)
+    best = pipeline.minimization.best
+    assert best.holes == [[tuple(p) for p in hole] for hole in holes]
+    assert_triangulation(best.vertices(), best.triangles, outer, holes)
+    assert_guarded(best.triangles, best.guards)
+
+
+def test_failed_minimize_guards_closes_its_stage(monkeypatch):
+    profiler = profiling.Profiler(memory=False)
+    pipeline = pipeline_module.ArtGalleryPipeline(headless.HeadlessCanvas(), profiler=profiler)
+    assert pipeline.step_load_polygon(FAMILIES["comb"](10))
+    monkeypatch.setattr(
+        pipeline_module.guard_minimization_module,
+        "minimize_guards",
+        lambda *args, **kwargs: guard_minimization.MinimizationResult(None, None, 2, 2, False),
+    )
+    assert not pipeline.step_minimize_guards(trials=2)
+    assert profiler.current is None
+    assert [stage.name for stage in profiler.stages] == ["polygon", "minimize_guards"]
+    assert not pipeline.is_valid("minimize_guards")
+
+
+@pytest.mark.parametrize("family", sorted(FAMILIES))
+def test_undo_redo_restores_the_solution(family):
+    points = FAMILIES[family](24)
+    pipeline = new_pipeline(points)
+    assert pipeline.request("vertex_guards")
+    solved = pipeline_solution(pipeline)
+    dcel = pipeline.triangulation_app.dcel
+    faces = len(dcel.faces)
+
+    undone = []
+    while pipeline.can_step_back():
+        undone.append(pipeline.step_back())
+    assert pipeline.latest_stage == "polygon"
+    assert "triangulation" in undone and len(dcel.faces) < faces
+    while pipeline.can_step_forward():
+        pipeline.step_forward()
+    assert pipeline.is_valid("vertex_guards")
+    vertices, triangles, colors, guards = pipeline_solution(pipeline)
+    assert sorted(map(sorted, triangles)) == sorted(map(sorted, solved[1]))
+    assert_triangulation(vertices, triangles, points)
+    assert_three_coloring(triangles, colors)
+    assert_guarded(triangles, guards)
+
+    # Undo past the triangulation, then compute the rest again
+    assert pipeline.rewind("monotone_partitioning")
+    assert pipeline.request("vertex_guards")
+    vertices, triangles, colors, guards = pipeline_solution(pipeline)
+    assert_triangulation(vertices, triangles, points)
+    assert_three_coloring(triangles, colors)
+    assert_guarded(triangles, guards)
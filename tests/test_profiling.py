@@ -0,0 +1,93 @@
+# Tests for the per-stage profiler.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_profiling.py - Stage timings, memory and hot-path counters, the JSON report, the Chrome
+# trace file, and an import of the core that leaves the profiler machinery unloaded.
+
+import json
+import os
+import subprocess
+import sys
+
+import headless
+import profiling
+from families import FAMILIES
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+STAGES = [
+    "polygon",
+    "trapezoidalisation",
+    "monotone_partitioning",
+    "triangulation",
+    "dual_graph",
+    "three_coloring",
+    "vertex_guards",
+]
+COUNTERS = (
+    profiling.ORIENTATION_TESTS,
+    profiling.SEGMENTS_INTERSECT,
+    profiling.ADD_DIAGONAL,
+    profiling.FACES_WALKED,
+)
+
+
+def profile(points, memory):
+    profiler = profiling.Profiler(memory=memory)
+    try:
+        headless.solve_polygon(points, fast_paths=False, profiler=profiler)
+    finally:
+        profiler.close()
+    return profiler
+
+
+def test_stages_and_counters():
+    profiler = profile(FAMILIES["comb"](40), memory=True)
+    assert [stage.name for stage in profiler.stages] == STAGES
+    for stage in profiler.stages:
+        assert stage.wall >= 0 and stage.cpu >= 0 and stage.peak_bytes >= 0
+    for name in COUNTERS:
+        assert profiler.counters[name] > 0, name
+    by_name = {stage.name: stage.counters for stage in profiler.stages}
+    assert by_name["monotone_partitioning"][profiling.SEGMENTS_INTERSECT] > 0
+    # Every diagonal of the monotone pieces and their triangles goes through add_diagonal
+    diagonals = by_name["monotone_partitioning"][profiling.ADD_DIAGONAL]
+    assert diagonals + by_name["triangulation"][profiling.ADD_DIAGONAL] == 40 - 3
+    assert profiling._active is None
+    profiling.count(profiling.ORIENTATION_TESTS)  # no stage running: ignored
+    assert profiler.counters == profile(FAMILIES["comb"](40), memory=False).counters
+
+
+def test_json_report_and_chrome_trace(tmp_path):
+    profiler = profile(FAMILIES["spiral"](30), memory=False)
+    profiler.write_json(str(tmp_path / "profile.json"))
+    profiler.write_chrome_trace(str(tmp_path / "trace.json"))
+
+    report = json.loads((tmp_path / "profile.json").read_text())
+    assert [stage["name"] for stage in report["stages"]] == STAGES
+    assert all(stage["peak_kib"] is None for stage in report["stages"])
+    assert report["counters"] == dict(profiler.counters)
+
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    events = trace["traceEvents"]
+    complete = [event for event in events if event["ph"] == "X"]
+    running = [event for event in events if event["ph"] == "C"]
+    assert [event["name"] for event in complete] == STAGES
+    assert len(running) == len(STAGES)
+    for stage, event, totals in zip(profiler.stages, complete, running):
+        assert event["ts"] == 1e6 * stage.start and event["dur"] == 1e6 * stage.wall
+        assert totals["ts"] == event["ts"] + event["dur"]
+    assert all(a["ts"] + a["dur"] <= b["ts"] for a, b in zip(complete, complete[1:]))
+    assert running[-1]["args"] == dict(profiler.counters)
+
+
+def test_core_import_leaves_the_profiler_machinery_out():
+    code = (
+        "import sys; sys.path.insert(0, %r); import dcel; "
+        "print(' '.join(sorted(m for m in ('argparse', 'tracemalloc', 'json', 'dataclasses')"
+        " if m in sys.modules)))" % SRC
+    )
+    output = subprocess.run(
+        [sys.executable, "-S", "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.split() == []
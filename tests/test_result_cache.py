@@ -0,0 +1,134 @@
+# Tests for the result cache and the solve paths in front of which it sits.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_result_cache.py - Hits from any starting vertex, unreadable snapshots, and the batch,
+# pool and service paths answering repeated polygons without solving again.
+
+import asyncio
+import io
+import json
+
+import batch_solve
+import headless
+import metrics
+import result_cache
+import service
+import solve_pool
+from checks import assert_guarded, assert_solution, assert_triangulation
+from families import FAMILIES
+
+
+def rotated(points, shift):
+    return points[shift:] + points[:shift]
+
+
+def assert_record(points, record):
+    # Records carry no colors: check the triangulation and the guards
+    triangles = [tuple(t) for t in record["triangles"]]
+    assert_triangulation(points, triangles, points)
+    assert_guarded(triangles, record["guards"])
+
+
+def count_solves(monkeypatch):
+    calls = []
+    solve_polygon = headless.solve_polygon
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return solve_polygon(*args, **kwargs)
+
+    monkeypatch.setattr(headless, "solve_polygon", counting)
+    return calls
+
+
+def test_hit_from_another_starting_vertex(monkeypatch):
+    calls = count_solves(monkeypatch)
+    cache = result_cache.ResultCache()
+    points = FAMILIES["comb"](14)
+    first = cache.solve(points, fast_paths=False)
+    again = cache.solve(rotated(points, 5), fast_paths=False)
+    assert len(calls) == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert_solution(first)
+    assert_solution(again)
+    assert again.points == rotated(points, 5)
+
+
+def test_disk_tier_round_trip(tmp_path):
+    points = FAMILIES["spiral"](20)
+    result_cache.ResultCache(disk_dir=str(tmp_path)).solve(points)
+    cache = result_cache.ResultCache(disk_dir=str(tmp_path))
+    assert_solution(cache.solve(rotated(points, 3)))
+    assert cache.stats.disk_hits == 1
+
+
+def test_unreadable_snapshot_is_a_miss_and_removed(tmp_path):
+    points = FAMILIES["spiral"](20)
+    result_cache.ResultCache(disk_dir=str(tmp_path)).solve(points)
+    (snapshot,) = tmp_path.iterdir()
+    for text in ('{"triangles": []}', "[1, 2]", '{"points": [[0, 0]], "colors": [1]}'):
+        snapshot.write_text(text)
+        cache = result_cache.ResultCache(disk_dir=str(tmp_path))
+        assert cache.lookup(points) is None
+        assert (cache.stats.hits, cache.stats.misses) == (0, 1)
+        assert not snapshot.exists() and cache._disk_bytes == 0
+        assert_solution(cache.solve(points))
+        assert snapshot.exists()
+
+
+def test_batch_solves_repeated_lines_once(monkeypatch):
+    calls = count_solves(monkeypatch)
+    points = FAMILIES["spiral"](16)
+    lines = [json.dumps(points), json.dumps(rotated(points, 4)), json.dumps(points)]
+    out = io.StringIO()
+    assert batch_solve.run(io.StringIO("\n".join(lines)), out, workers=1) == (3, 0)
+    assert len(calls) == 1
+    for line, record in zip(lines, map(json.loads, out.getvalue().splitlines())):
+        assert_record([tuple(p) for p in json.loads(line)], record)
+
+
+def test_batch_cache_can_be_disabled(monkeypatch):
+    calls = count_solves(monkeypatch)
+    line = json.dumps(FAMILIES["convex"](8))
+    batch_solve.run(io.StringIO(line + "\n" + line), io.StringIO(), workers=1, cache_bytes=0)
+    assert len(calls) == 2
+
+
+def test_pool_answers_cached_polygon_without_a_worker():
+    points = FAMILIES["comb"](10)
+    cache = result_cache.ResultCache()
+    cache.solve(points)
+    pool = solve_pool.SolvePool(max_workers=1, cache=cache)
+    try:
+        job = pool.solve(rotated(points, 2))
+        assert job.done() and job.progress == 1.0
+        assert pool._executor is None
+        assert_solution(job.result())
+    finally:
+        pool.shutdown()
+
+
+def test_service_answers_cached_polygon_without_queueing():
+    points = FAMILIES["star"](9)
+    svc = service.SolveService(service.ServiceConfig(workers=1))
+    svc.cache.solve(points)
+    request = batch_solve.parse_request(json.dumps({"points": rotated(points, 1)}))
+    # Not started: there is no queue, so only a cache hit can answer
+    fields = asyncio.run(svc.solve(request))
+    assert svc.stats.cached == 1
+    assert list(fields["timings"]) == ["cache"]
+    assert_record(request["points"], fields)
+
+
+def test_lookups_are_counted_in_metrics():
+    hits = metrics.RESULT_CACHE.labels("hit")
+    misses = metrics.RESULT_CACHE.labels("miss")
+    before = hits.value, misses.value
+    cache = result_cache.ResultCache()
+    points = FAMILIES["convex"](6)
+    cache.solve(points)
+    cache.solve(rotated(points, 1))
+    cache.solve(rotated(points, 2))
+    assert (hits.value - before[0], misses.value - before[1]) == (2, 1)
+    assert "art_gallery_result_cache_total" in metrics.REGISTRY.render()
@@ -0,0 +1,102 @@
+# Tests for the HTTP solve service.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_service.py - Answers over real connections, closing ones included, recovery from
+# a solver process that died, bad options and timed-out solves.
+
+import asyncio
+import json
+import time
+
+import service
+from checks import assert_guarded, assert_triangulation
+from families import FAMILIES
+
+
+async def post_solve(host, port, points, **fields):
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps({"points": points, **fields}).encode("utf-8")
+    writer.write(
+        b"POST /solve HTTP/1.1\r\nContent-Length: %d\r\nConnection: close\r\n\r\n" % len(body)
+        + body
+    )
+    await writer.drain()
+    # Connection: close, so the answer ends at EOF
+    response = await asyncio.wait_for(reader.read(), 60)
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload)
+
+
+def assert_answer(points, status, payload):
+    assert status == 200, payload
+    triangles = [tuple(t) for t in payload["triangles"]]
+    assert_triangulation(points, triangles, points)
+    assert_guarded(triangles, payload["guards"])
+
+
+def test_solves_and_recovers_from_a_dead_worker():
+    async def scenario():
+        svc = service.SolveService(service.ServiceConfig(port=0, workers=1, cache_bytes=0))
+        host, port = await svc.start()
+        try:
+            points = FAMILIES["comb"](12)
+            assert_answer(points, *await post_solve(host, port, points))
+
+            broken = svc._executor
+            for process in list(broken._processes.values()):
+                process.kill()
+            deadline = time.monotonic() + 30
+            while not broken._broken and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+            assert broken._broken
+
+            points = FAMILIES["spiral"](14)
+            assert_answer(points, *await post_solve(host, port, points))
+            assert svc._executor is not broken
+            assert svc.health()["completed"] == 2
+        finally:
+            await svc.close()
+
+    asyncio.run(scenario())
+
+
+def test_bad_options_get_400():
+    async def scenario():
+        svc = service.SolveService(service.ServiceConfig(port=0, workers=1))
+        host, port = await svc.start()
+        try:
+            points = FAMILIES["comb"](12)
+            for options in ([1], "fast", None, {"speed": 2}):
+                status, payload = await post_solve(host, port, points, options=options)
+                assert status == 400, payload
+            assert svc.health()["accepted"] == 0
+        finally:
+            await svc.close()
+
+    asyncio.run(scenario())
+
+
+def test_timed_out_solve_holds_its_worker_until_it_finishes():
+    async def scenario():
+        svc = service.SolveService(service.ServiceConfig(port=0, workers=1, timeout=0.05))
+        host, port = await svc.start()
+        try:
+            # Starting the solver process alone takes longer than the timeout
+            points = FAMILIES["spiral"](400)
+            status, _ = await post_solve(host, port, points)
+            assert status == 504
+            assert svc.health()["running"] == 1
+            deadline = time.monotonic() + 60
+            while svc.health()["running"] and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+            assert svc.health()["running"] == 0
+
+            # The late result went into the cache
+            assert_answer(points, *await post_solve(host, port, points))
+            assert svc.health()["cached"] == 1
+        finally:
+            await svc.close()
+
+    asyncio.run(scenario())
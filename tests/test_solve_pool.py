@@ -0,0 +1,73 @@
+# Tests for the shared solve pool.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_solve_pool.py - One job for identical requests, PoolBusy at max_pending, solved results
+# answering repeats from the cache, and a fresh pool after a worker died.
+
+import time
+
+import pytest
+
+import solve_pool
+from checks import assert_solution
+from families import FAMILIES
+
+TIMEOUT = 120
+
+
+def wait_until_idle(pool):
+    # A job leaves pending in a done-callback, just after its result is set
+    deadline = time.monotonic() + TIMEOUT
+    while pool.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pool.pending == 0
+
+
+@pytest.fixture
+def pool():
+    pool = solve_pool.SolvePool(max_workers=1, max_pending=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_identical_requests_share_one_job(pool):
+    points = FAMILIES["comb"](30)
+    job = pool.solve(points)
+    assert pool.solve(points) is job
+    assert pool.pending == 1
+    assert_solution(job.result(TIMEOUT))
+    assert job.progress == 1.0
+
+
+def test_max_pending_raises_pool_busy(pool):
+    job = pool.solve(FAMILIES["comb"](30))
+    with pytest.raises(solve_pool.PoolBusy):
+        pool.solve(FAMILIES["spiral"](30))
+    job.result(TIMEOUT)
+    wait_until_idle(pool)
+    assert_solution(pool.solve(FAMILIES["spiral"](30)).result(TIMEOUT))
+
+
+def test_solved_result_answers_the_repeat_from_the_cache(pool):
+    points = FAMILIES["comb"](20)
+    pool.solve(points).result(TIMEOUT)
+    wait_until_idle(pool)
+    job = pool.solve(points[7:] + points[:7])
+    assert job.done() and pool.pending == 0
+    assert pool.cache.stats.hits == 1
+    assert_solution(job.result())
+
+
+def test_dead_worker_gets_a_fresh_pool(pool):
+    assert_solution(pool.solve(FAMILIES["comb"](12)).result(TIMEOUT))
+    broken = pool._executor
+    for process in list(broken._processes.values()):
+        process.kill()
+    deadline = time.monotonic() + TIMEOUT
+    while not broken._broken and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert broken._broken
+
+    assert_solution(pool.solve(FAMILIES["spiral"](14)).result(TIMEOUT))
+    assert pool._executor is not broken
@@ -0,0 +1,79 @@
+# Tests for the monotone-piece triangulator and the streaming triangle generator.
+
+# GroupID-23 (22114047_22114081_22114098) - Khushal Agrawal, Rushit Pancholi and Vraj Tamkuwala
+# Date: 19 Oct, 2026
+# test_triangulation.py - monotone_triangles, iter_triangles / stream_triangles and the
+# DCEL triangulation stage on every benchmark family.
+
+import io
+
+import pytest
+
+import headless
+import triangulation
+from checks import assert_solution, assert_triangulation
+from corpus import SEEDS, fuzz_polygon
+from families import FAMILIES
+
+SIZES = (5, 8, 13, 30, 77)
+
+
+def test_monotone_piece_with_straight_angles():
+    # (1, 1) and (2, 2) lie on the line from (0, 0) to (3, 3)
+    piece = [(0, 0), (1, 1), (2, 2), (3, 3), (-1, 4)]
+    triangles = list(triangulation.monotone_triangles(range(len(piece)), piece))
+    assert_triangulation(piece, triangles, piece)
+
+
+@pytest.mark.parametrize("family", sorted(FAMILIES))
+@pytest.mark.parametrize("n", SIZES)
+def test_iter_triangles(family, n):
+    points = FAMILIES[family](n)
+    assert_triangulation(points, list(headless.iter_triangles(points)), points)
+
+
+def test_iter_triangles_with_hole():
+    outer = [(0, 0), (100, 0), (100, 100), (0, 100)]
+    hole = [(40, 40), (40, 60), (60, 60), (60, 40)]
+    triangles = list(headless.iter_triangles(outer, [hole]))
+    assert_triangulation(outer + hole, triangles, outer, [hole])
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_iter_triangles_matches_solve_polygon_on_the_corpus(seed):
+    points = fuzz_polygon(seed)
+    triangles = list(headless.iter_triangles(points))
+    assert len(triangles) == len(headless.solve_polygon(points, fast_paths=False).triangles)
+    assert_triangulation(points, triangles, points)
+
+
+@pytest.mark.parametrize(
+    "points, holes",
+    [
+        ([(0, 0), (2, 2), (2, 0), (0, 2)], ()),
+        ([(0, 0), (10, 0), (10, 10), (5, 1), (0, 10), (8, 3)], ()),
+        ([(0, 0), (10, 0), (10, 10), (0, 10)], [[(2, 2), (12, 4), (2, 6)]]),
+    ],
+)
+def test_iter_triangles_rejects_crossing_rings(points, holes):
+    with pytest.raises(ValueError):
+        list(headless.iter_triangles(points, holes))
+
+
+def test_stream_triangles_writes_every_triangle():
+    points = FAMILIES["spiral"](200)
+    out = io.StringIO()
+    count = headless.stream_triangles(points, out, chunk_size=7)
+    lines = out.getvalue().splitlines()
+    assert count == len(lines) == len(points) - 2
+    triangles = [tuple(int(i) for i in line.split()) for line in lines]
+    assert_triangulation(points, triangles, points)
+
+
+@pytest.mark.parametrize("family", sorted(FAMILIES))
+@pytest.mark.parametrize("rotation, shift", [(0.0, 0), (2.0, 1), (0.7, 3)])
+def test_dcel_triangulation_stage(family, rotation, shift):
+    # A rotated comb has straight-angle vertices inside its monotone pieces
+    points = FAMILIES[family](30)
+    result = headless.solve_polygon(points, rotation=rotation, shift=shift, fast_paths=False)
+    assert_solution(result)